@@ -2,7 +2,7 @@
 ldfparser is a library for parsing LIN Description Files
 """
 from .diagnostics import (LinDiagnosticFrame, LinDiagnosticRequest,
-                          LinDiagnosticResponse, LIN_MASTER_REQUEST_FRAME_ID,
+                          LinDiagnosticResponse, LinDiagnosticResponseFields, LIN_MASTER_REQUEST_FRAME_ID,
                           LIN_SLAVE_RESPONSE_FRAME_ID,
                           LIN_NAD_RESERVED, LIN_NAD_SLAVE_NODE_RANGE,
                           LIN_NAD_FUNCTIONAL_NODE_ADDRESS, LIN_NAD_BROADCAST_ADDRESS,
@@ -13,16 +13,35 @@ from .diagnostics import (LinDiagnosticFrame, LinDiagnosticRequest,
                           LIN_SID_ASSIGN_FRAME_ID_RANGE, LIN_SID_RESERVED_RANGE2,
                           LIN_SID_READ_BY_ID_PRODUCT_ID, LIN_SID_READ_BY_ID_SERIAL_NUMBER,
                           LIN_SID_READ_BY_ID_RESERVED_RANGE1, LIN_SID_READ_BY_ID_USER_DEFINED_RANGE,
-                          LIN_SID_READ_BY_ID_RESERVED_RANGE2)
-from .encoding import (PhysicalValue, LogicalValue, ASCIIValue, BCDValue,
+                          LIN_SID_READ_BY_ID_RESERVED_RANGE2, LIN_SUPPLIER_ID_WILDCARD,
+                          LIN_FUNCTION_ID_WILDCARD, LIN_PID_DO_NOT_CARE, LIN_PID_UNASSIGNED,
+                          assign_frame_id_ranges, encode_configuration, encode_configuration_entry)
+from .analysis import (LinFrameTiming, ScheduleIndex, ScheduleSlotTiming, ScheduleTableLoad, SignalRefresh,
+                       bus_load, frame_timings, schedule_table_load, signal_refresh)
+from .bus import LIN_SYNC_BYTE, LinBusDecoder, build_wire_frame, build_schedule_cycle
+from .client import (LIN_RSID_NEGATIVE_RESPONSE, LIN_NRC_SERVICE_NOT_SUPPORTED,
+                     LIN_NRC_SUBFUNCTION_NOT_SUPPORTED, LinDiagnosticClient, LinDiagnosticTransport,
+                     LinSimulatedSlave, LinSimulatedTransport)
+from .checksum import (LIN_CHECKSUM_CLASSIC, LIN_CHECKSUM_ENHANCED, protected_id, frame_id_of,
+                       classic_checksum, enhanced_checksum, checksum_type, checksum,
+                       frame_checksum, checksums, validate_frames)
+from .encoding import (PhysicalValue, PhysicalQuantity, LogicalValue, ASCIIValue, BCDValue,
+                       FixedPointScale, FixedPointValue,
+                       LIN_LOOKUP_TABLE_MAX_WIDTH, LIN_VALIDATION_STRICT, LIN_VALIDATION_CLAMP,
+                       LIN_VALIDATION_UNCHECKED,
                        LinSignalEncodingType)
-from .frame import LinEventTriggeredFrame, LinFrame, LinUnconditionalFrame
+from .frame import (FrameState, LinEventTriggeredFrame, LinFrame, LinFrameProjection,
+                    LinUnconditionalFrame, LIN_BYTE_ORDER_LITTLE_ENDIAN, LIN_BYTE_ORDER_BIG_ENDIAN)
 from .ldf import LDF
 from .lin import (LIN_VERSION_1_3, LIN_VERSION_2_0, LIN_VERSION_2_1,
                   LIN_VERSION_2_2, LinVersion, ISO17987_2015, Iso17987Version)
 from .node import (LinMaster, LinProductId, LinSlave,
                    LinNodeCompositionConfiguration, LinNodeComposition)
+from .optimizer import optimize_schedule
 from .parser import parse_ldf, parse_ldf_to_dict, parseLDF, parseLDFtoDict
+from .runner import LinBusBackend, LinClock, LinLoopbackBackend, LinScheduleRunner, LinScheduleStatistics
 from .save import save_ldf
-from .schedule import ScheduleTable, ScheduleTableEntry
-from .signal import LinSignal
+from .schedule import ScheduleSlot, ScheduleTable, ScheduleTableEntry, ScheduleTimeline
+from .signal import LinSignal, LinSignalGroup
+from .transport import (LIN_TRANSPORT_MAX_LENGTH, LinTransportPdu, LinTransportReceiver,
+                        LinTransportSender, LinTransportTiming, segment_pdu, transport_timings)
@@ -0,0 +1,377 @@
+"""
+Timing analysis of schedule tables
+
+Frame times follow the LIN specification, the nominal header takes 34 bit times and the nominal
+response 10 bit times per byte including the checksum. The maximum header length is given by the
+master in bits (48 by default), the maximum response is the nominal response extended by the
+response tolerance (40% by default).
+"""
+import csv
+import json
+from functools import lru_cache
+from typing import IO, Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from .schedule import (FreeFormatEntry, LinFrameEntry, MasterRequestEntry, ScheduleTable, ScheduleTableEntry,
+                       SlaveResponseEntry)
+
+if TYPE_CHECKING:
+    from .ldf import LDF
+    from .signal import LinSignal
+
+LIN_HEADER_NOMINAL_BITS = 34
+LIN_HEADER_MAXIMUM_BITS = 48
+LIN_RESPONSE_TOLERANCE = 0.4
+LIN_MAX_FRAME_LENGTH = 8
+
+class LinFrameTiming(NamedTuple):
+    """
+    Transmission time of a frame
+
+    :param nominal: Nominal time in seconds
+    :type nominal: float
+    :param maximum: Maximum time in seconds
+    :type maximum: float
+    """
+    nominal: float
+    maximum: float
+
+@lru_cache(maxsize=None)
+def frame_timings(baudrate: int, max_header_length: int = None,
+                  response_tolerance: float = None) -> Tuple[LinFrameTiming, ...]:
+    """
+    Returns the transmission times of frames indexed by their length in bytes
+
+    The table is computed once per combination of arguments and shared between analyses
+
+    :param baudrate: Baudrate of the network in bits per second
+    :type baudrate: int
+    :param max_header_length: Maximum header length in bits, 48 if not given
+    :type max_header_length: int
+    :param response_tolerance: Response tolerance as a fraction, 0.4 if not given
+    :type response_tolerance: float
+    :returns: Frame timings for lengths of 0 to 8 bytes
+    :rtype: Tuple[LinFrameTiming, ...]
+    :raises: ValueError if the baudrate isn't positive
+    """
+    if not baudrate or baudrate <= 0:
+        raise ValueError(f"baudrate must be positive, got {baudrate}")
+    bit_time = 1 / baudrate
+    header_maximum = (max_header_length or LIN_HEADER_MAXIMUM_BITS) * bit_time
+    tolerance = LIN_RESPONSE_TOLERANCE if response_tolerance is None else response_tolerance
+    timings = []
+    for length in range(LIN_MAX_FRAME_LENGTH + 1):
+        response = 10 * (length + 1) * bit_time
+        timings.append(LinFrameTiming(LIN_HEADER_NOMINAL_BITS * bit_time + response,
+                                      header_maximum + response * (1 + tolerance)))
+    return tuple(timings)
+
+class ScheduleSlotTiming(NamedTuple):
+    """
+    Timing of a schedule table slot
+
+    :param index: Position of the entry in the schedule table
+    :type index: int
+    :param entry: Schedule table entry
+    :type entry: ScheduleTableEntry
+    :param name: Name of the frame or the type of diagnostic entries, e.g. `MasterReq`
+    :type name: str
+    :param length: Response length in bytes
+    :type length: int
+    :param delay: Length of the slot in seconds
+    :type delay: float
+    :param nominal: Nominal frame time in seconds
+    :type nominal: float
+    :param maximum: Maximum frame time in seconds
+    :type maximum: float
+    :param overrun: True if the maximum frame time and the jitter of the master exceed the slot
+    :type overrun: bool
+    """
+    index: int
+    entry: ScheduleTableEntry
+    name: str
+    length: int
+    delay: float
+    nominal: float
+    maximum: float
+    overrun: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the timing without the entry, e.g. for JSON export"""
+        return {'index': self.index, 'name': self.name, 'length': self.length, 'delay': self.delay,
+                'nominal': self.nominal, 'maximum': self.maximum, 'overrun': self.overrun}
+
+class ScheduleTableLoad(NamedTuple):
+    """
+    Bus load of a schedule table
+
+    :param table: Schedule table
+    :type table: ScheduleTable
+    :param slots: Timing of each slot
+    :type slots: List[ScheduleSlotTiming]
+    :param cycle_time: Time in seconds that one cycle of the table takes
+    :type cycle_time: float
+    :param nominal_load: Share of the cycle that frames take nominally, between 0.0 and 1.0
+    :type nominal_load: float
+    :param maximum_load: Share of the cycle that frames take at most
+    :type maximum_load: float
+    """
+    table: ScheduleTable
+    slots: List[ScheduleSlotTiming]
+    cycle_time: float
+    nominal_load: float
+    maximum_load: float
+
+    @property
+    def overruns(self) -> List[ScheduleSlotTiming]:
+        """Returns the slots that are too short for their frames"""
+        return [slot for slot in self.slots if slot.overrun]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the bus load as a dictionary, e.g. for JSON export"""
+        return {'table': self.table.name, 'cycle_time': self.cycle_time, 'nominal_load': self.nominal_load,
+                'maximum_load': self.maximum_load, 'slots': [slot.to_dict() for slot in self.slots]}
+
+def frame_length(frame: Any) -> int:
+    """
+    Returns the response length of a frame in bytes, event triggered and sporadic frames take the
+    length of their longest associated frame
+    """
+    length = getattr(frame, 'length', None)
+    if length is None:
+        length = max((associated.length for associated in frame.frames), default=LIN_MAX_FRAME_LENGTH)
+    return length
+
+def _slot_frame(entry: ScheduleTableEntry) -> Tuple[str, int]:
+    """
+    Returns the name and response length of the frame sent in the slot
+    """
+    if isinstance(entry, LinFrameEntry):
+        return (entry.frame.name, frame_length(entry.frame))
+    if isinstance(entry, SlaveResponseEntry):
+        return ('SlaveResp', LIN_MAX_FRAME_LENGTH)
+    if isinstance(entry, (MasterRequestEntry, FreeFormatEntry)):
+        return ('MasterReq', LIN_MAX_FRAME_LENGTH)
+    # node configuration commands are sent as master requests
+    return (type(entry).__name__[:-len('Entry')], LIN_MAX_FRAME_LENGTH)
+
+def schedule_table_load(table: ScheduleTable, timings: Tuple[LinFrameTiming, ...],
+                        jitter: float = 0.0) -> ScheduleTableLoad:
+    """
+    Computes the slot timing and bus load of a schedule table
+
+    :param table: Schedule table
+    :type table: ScheduleTable
+    :param timings: Frame timings indexed by length, see `frame_timings`
+    :type timings: Tuple[LinFrameTiming, ...]
+    :param jitter: Jitter of the master in seconds
+    :type jitter: float
+    :returns: Bus load of the table
+    :rtype: ScheduleTableLoad
+    """
+    slots = []
+    for (index, entry) in enumerate(table.schedule):
+        (name, length) = _slot_frame(entry)
+        timing = timings[min(length, LIN_MAX_FRAME_LENGTH)]
+        slots.append(ScheduleSlotTiming(index, entry, name, length, entry.delay, timing.nominal,
+                                        timing.maximum, timing.maximum + jitter > entry.delay))
+    cycle_time = sum(slot.delay for slot in slots)
+    if cycle_time <= 0:
+        return ScheduleTableLoad(table, slots, cycle_time, 0.0, 0.0)
+    return ScheduleTableLoad(table, slots, cycle_time, sum(slot.nominal for slot in slots) / cycle_time,
+                             sum(slot.maximum for slot in slots) / cycle_time)
+
+def bus_load(ldf: 'LDF', tables: Optional[Iterable[str]] = None) -> List[ScheduleTableLoad]:
+    """
+    Computes the bus load of the schedule tables of an LDF
+
+    :Example:
+
+    ```
+    for load in bus_load(ldf):
+        print(f"{load.table.name}: {load.nominal_load:.1%}, {len(load.overruns)} overrun(s)")
+    ```
+
+    :param ldf: LDF
+    :type ldf: LDF
+    :param tables: Names of the schedule tables to analyze, all tables by default
+    :type tables: Iterable[str]
+    :returns: Bus load of each schedule table
+    :rtype: List[ScheduleTableLoad]
+    :raises: LookupError if a schedule table is not found, ValueError if the LDF has no baudrate
+    """
+    master = ldf.get_master()
+    timings = frame_timings(ldf.get_baudrate(), master.max_header_length, master.response_tolerance)
+    if tables is None:
+        selected = list(ldf.get_schedule_tables())
+    else:
+        selected = [ldf.get_schedule_table(name) for name in tables]
+    return [schedule_table_load(table, timings, master.jitter or 0.0) for table in selected]
+
+class ScheduleIndex():
+    """
+    ScheduleIndex holds the slots carrying each frame within the cycle of each schedule table
+
+    The index is built in a single pass over the schedule tables. Frames sent through event
+    triggered and sporadic slots are indexed at the position of those slots, these slots are
+    marked as conditional since the frame is only sent when it's updated or the slot isn't used
+    by another frame.
+
+    :param tables: Schedule tables to index
+    :type tables: Iterable[ScheduleTable]
+    """
+
+    def __init__(self, tables: Iterable[ScheduleTable]) -> None:
+        self.tables: List[ScheduleTable] = list(tables)
+        self._cycle_times: Dict[str, float] = {}
+        self._slots: Dict[str, Dict[str, List[Tuple[float, int, bool]]]] = {}
+        for table in self.tables:
+            slots: Dict[str, List[Tuple[float, int, bool]]] = {}
+            offset = 0.0
+            for (index, entry) in enumerate(table.schedule):
+                if isinstance(entry, LinFrameEntry):
+                    frame = entry.frame
+                    slots.setdefault(frame.name, []).append((offset, index, False))
+                    for associated in getattr(frame, 'frames', ()):
+                        slots.setdefault(associated.name, []).append((offset, index, True))
+                offset += entry.delay
+            self._cycle_times[table.name] = offset
+            self._slots[table.name] = slots
+
+    def cycle_time(self, table: str) -> float:
+        """
+        Returns the time in seconds that one cycle of the schedule table takes
+
+        :raises: LookupError if the schedule table isn't indexed
+        """
+        if table not in self._cycle_times:
+            raise LookupError(f"No schedule table named '{table}' found!")
+        return self._cycle_times[table]
+
+    def slots(self, table: str, frame: str) -> List[Tuple[float, int, bool]]:
+        """
+        Returns the slots of a schedule table that carry the frame
+
+        :param table: Name of the schedule table
+        :type table: str
+        :param frame: Name of the frame
+        :type frame: str
+        :returns: Start of the slot relative to the start of the cycle in seconds, position of the
+            entry in the table and whether the frame is sent conditionally, in slot order
+        :rtype: List[Tuple[float, int, bool]]
+        :raises: LookupError if the schedule table isn't indexed
+        """
+        self.cycle_time(table)
+        return self._slots[table].get(frame, [])
+
+class SignalRefresh(NamedTuple):
+    """
+    Refresh intervals of a signal in a schedule table
+
+    :param signal: Name of the signal
+    :type signal: str
+    :param table: Name of the schedule table
+    :type table: str
+    :param count: Number of slots per cycle that carry the signal
+    :type count: int
+    :param minimum: Shortest interval between two slots in seconds
+    :type minimum: float
+    :param average: Average interval in seconds
+    :type average: float
+    :param maximum: Longest interval between two slots in seconds
+    :type maximum: float
+    :param latency: Worst case time in seconds from an update of the signal until its frame is
+        received, an interval plus the maximum frame time of the slot ending it and the jitter of
+        the master
+    :type latency: float
+    :param conditional: True if some of the slots are event triggered or sporadic
+    :type conditional: bool
+    """
+    signal: str
+    table: str
+    count: int
+    minimum: float
+    average: float
+    maximum: float
+    latency: float
+    conditional: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the refresh intervals as a dictionary"""
+        return dict(self._asdict())
+
+def _signal_refresh(signal: 'LinSignal', index: ScheduleIndex, load: ScheduleTableLoad,
+                    jitter: float) -> Optional[SignalRefresh]:
+    table = load.table.name
+    cycle_time = index.cycle_time(table)
+    slots = sorted(slot for frame in signal.frames for slot in index.slots(table, frame.name))
+    if not slots or cycle_time <= 0:
+        return None
+    # the interval ending at each slot, the first one wraps around from the previous cycle
+    intervals = [slots[0][0] + cycle_time - slots[-1][0]]
+    intervals += [following[0] - slot[0] for (slot, following) in zip(slots, slots[1:])]
+    latency = max(interval + load.slots[slot[1]].maximum for (interval, slot) in zip(intervals, slots))
+    return SignalRefresh(signal.name, table, len(slots), min(intervals), cycle_time / len(slots),
+                         max(intervals), latency + jitter, any(slot[2] for slot in slots))
+
+def signal_refresh(ldf: 'LDF', signals: Optional[Iterable['LinSignal']] = None,
+                   tables: Optional[Iterable[str]] = None) -> List[SignalRefresh]:
+    """
+    Computes the refresh intervals of signals in every schedule table that carries them
+
+    The schedule tables are indexed once, each signal then only visits the slots carrying its
+    frames.
+
+    :Example:
+
+    ```
+    for refresh in signal_refresh(ldf):
+        print(f"{refresh.signal} in {refresh.table}: {refresh.maximum * 1000:.0f} ms")
+    ```
+
+    :param ldf: LDF
+    :type ldf: LDF
+    :param signals: Signals to analyze, all signals by default
+    :type signals: Iterable[LinSignal]
+    :param tables: Names of the schedule tables to analyze, all tables by default
+    :type tables: Iterable[str]
+    :returns: Refresh intervals per signal and schedule table, tables that don't carry a signal
+        are left out
+    :rtype: List[SignalRefresh]
+    :raises: LookupError if a schedule table is not found, ValueError if the LDF has no baudrate
+    """
+    loads = bus_load(ldf, tables)
+    index = ScheduleIndex(load.table for load in loads)
+    jitter = ldf.get_master().jitter or 0.0
+    if signals is None:
+        signals = ldf.get_signals()
+    results = []
+    for signal in signals:
+        for load in loads:
+            refresh = _signal_refresh(signal, index, load, jitter)
+            if refresh is not None:
+                results.append(refresh)
+    return results
+
+def write_json(results: Iterable[Any], file: IO[str]) -> None:
+    """
+    Writes analysis results as a JSON array
+
+    :param results: Results that provide a `to_dict` method
+    :type results: Iterable[Any]
+    :param file: File to write to
+    :type file: IO[str]
+    """
+    json.dump([result.to_dict() for result in results], file, indent=4)
+
+def write_csv(results: Iterable[SignalRefresh], file: IO[str]) -> None:
+    """
+    Writes signal refresh intervals as CSV with a header row
+
+    :param results: Refresh intervals
+    :type results: Iterable[SignalRefresh]
+    :param file: File to write to, opened with `newline=''`
+    :type file: IO[str]
+    """
+    writer = csv.writer(file)
+    writer.writerow(SignalRefresh._fields)
+    writer.writerows(results)
@@ -0,0 +1,261 @@
+"""
+Utilities for producing and consuming complete LIN frames as they appear on the bus
+
+A frame on the bus consists of the sync byte, the protected identifier, the frame content and
+the checksum.
+"""
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
+
+from .checksum import LIN_PID_TABLE, checksum, protected_id
+from .diagnostics import LIN_MASTER_REQUEST_FRAME_ID, LIN_SLAVE_RESPONSE_FRAME_ID
+from .frame import (LinEventTriggeredFrame, LinFrame, LinSporadicFrame, LinUnconditionalFrame)
+from .lin import LinVersion, Iso17987Version, J2602Version
+from .schedule import FreeFormatEntry, LinFrameEntry, ScheduleTable, SlaveResponseEntry
+
+if TYPE_CHECKING:
+    from .encoding import LinSignalEncodingType
+
+LIN_SYNC_BYTE = 0x55
+
+def _associated_frame(frame: Union[LinEventTriggeredFrame, LinSporadicFrame],
+                      values: Dict[str, Union[str, int, float]]) -> LinUnconditionalFrame:
+    if not values:
+        return frame.frames[0]
+    for associated in frame.frames:
+        if all(associated._fields.get(name) is not None for name in values):
+            return associated
+    raise LookupError(f"No frame associated with {frame.name} contains {', '.join(values)}")
+
+def _response(frame: LinUnconditionalFrame,
+              values: Dict[str, Union[str, int, float]],
+              encoding_types: Dict[str, 'LinSignalEncodingType']) -> bytes:
+    if not values and not frame._invalid_defaults:
+        return frame.default_payload
+    # signals whose initial value can't be encoded have to be supplied, encoding raises otherwise
+    return frame.encode(values or {}, encoding_types)
+
+def build_wire_frame(frame: Union[LinFrame, LinSporadicFrame],
+                     values: Dict[str, Union[str, int, float]],
+                     protocol_version: Union[LinVersion, Iso17987Version, J2602Version],
+                     encoding_types: Dict[str, 'LinSignalEncodingType'] = None) -> bytearray:
+    """
+    Builds the complete frame as it's transmitted on the bus
+
+    Signals that are not supplied are sent with their initial values. In case of event triggered
+    and sporadic frames the associated frame containing the supplied signals is sent, the first
+    byte of an event triggered frame's content is replaced by the protected identifier of the
+    associated frame.
+
+    Example:
+    >>> build_wire_frame(ldf.get_frame('LSM_Frm1'), {'LeftIntLightsSwitch': 'Off'},
+                         ldf.get_protocol_version())
+    bytearray(b'\\x55\\x42\\x00\\x00\\xbd')
+
+    :param frame: Frame to send, as returned by `LDF.get_frame`
+    :type frame: LinFrame
+    :param values: Mapping of signal names to values, see `LinUnconditionalFrame.encode`, when
+        `None` the initial values are sent
+    :type values: Dict[str, Union[str, int, float]]
+    :param protocol_version: Protocol version of the network, determines the checksum model
+    :type protocol_version: LinVersion
+    :param encoding_types: Mapping of signal names to encoding types
+    :type encoding_types: Dict[str, LinSignalEncodingType]
+    :returns: Sync byte, protected identifier, frame content and checksum
+    :rtype: bytearray
+    :raises: LookupError if no associated frame contains the given signals
+    :raises: ValueError if a value or an initial value that isn't supplied cannot be encoded
+    """
+    if isinstance(frame, LinSporadicFrame):
+        frame = _associated_frame(frame, values)
+    if isinstance(frame, LinEventTriggeredFrame):
+        associated = _associated_frame(frame, values)
+        response = bytearray(_response(associated, values, encoding_types))
+        response[0] = protected_id(associated.frame_id)
+    elif isinstance(frame, LinUnconditionalFrame):
+        response = _response(frame, values, encoding_types)
+    else:
+        raise TypeError(f"Cannot build frame from {frame}")
+    return _build_raw_frame(frame.frame_id, response, protocol_version)
+
+def build_schedule_cycle(table: ScheduleTable,
+                         protocol_version: Union[LinVersion, Iso17987Version, J2602Version],
+                         values: Dict[str, Dict[str, Union[str, int, float]]] = None,
+                         encoding_types: Dict[str, 'LinSignalEncodingType'] = None) -> bytearray:
+    """
+    Builds the frames of one cycle of a schedule table into a single buffer
+
+    Frame entries are sent with their responses, free format commands are sent as master request
+    frames. Other diagnostic entries only produce the header of the master request or slave
+    response frame since their content isn't known in advance.
+
+    :param table: Schedule table to build
+    :type table: ScheduleTable
+    :param protocol_version: Protocol version of the network, determines the checksum model
+    :type protocol_version: LinVersion
+    :param values: Mapping of frame names to signal values, frames that are not supplied are sent
+        with the initial values of their signals
+    :type values: Dict[str, Dict[str, Union[str, int, float]]]
+    :param encoding_types: Mapping of signal names to encoding types
+    :type encoding_types: Dict[str, LinSignalEncodingType]
+    :returns: Frames of the schedule table concatenated
+    :rtype: bytearray
+    """
+    if values is None:
+        values = {}
+    cycle = bytearray()
+    for entry in table.schedule:
+        if isinstance(entry, LinFrameEntry):
+            cycle += build_wire_frame(entry.frame, values.get(entry.frame.name), protocol_version,
+                                      encoding_types)
+        elif isinstance(entry, FreeFormatEntry):
+            cycle += _build_raw_frame(LIN_MASTER_REQUEST_FRAME_ID, bytes(entry.data), protocol_version)
+        elif isinstance(entry, SlaveResponseEntry):
+            cycle += bytearray((LIN_SYNC_BYTE, LIN_PID_TABLE[LIN_SLAVE_RESPONSE_FRAME_ID]))
+        else:
+            cycle += bytearray((LIN_SYNC_BYTE, LIN_PID_TABLE[LIN_MASTER_REQUEST_FRAME_ID]))
+    return cycle
+
+def _build_raw_frame(frame_id: int, data: bytes,
+                     protocol_version: Union[LinVersion, Iso17987Version, J2602Version]) -> bytearray:
+    wire = bytearray((LIN_SYNC_BYTE, protected_id(frame_id)))
+    wire += data
+    wire.append(checksum(frame_id, data, protocol_version))
+    return wire
+
+class _LinFrameCodec():
+    """
+    Decodes every signal of an unconditional frame, returns the frame along with the values
+    the same way `LinEventTriggeredFrame.decode` does
+    """
+    __slots__ = ('frame', 'projection')
+
+    def __init__(self, frame: LinUnconditionalFrame) -> None:
+        self.frame = frame
+        self.projection = frame.projection([signal.name for (_, signal) in frame.signal_map])
+
+    def decode(self, data: bytearray,
+               encoding_types: Dict[str, 'LinSignalEncodingType'] = None,
+               keep_unit: bool = False) -> Tuple[LinUnconditionalFrame, Dict[str, Union[str, int, float]]]:
+        return (self.frame, self.projection.decode(data, encoding_types, keep_unit))
+
+    def decode_raw(self, data: bytearray) -> Tuple[LinUnconditionalFrame, Dict[str, int]]:
+        return (self.frame, self.projection.decode_raw(data))
+
+class LinBusDecoder():
+    """
+    LinBusDecoder decodes frames received on the bus based on their protected identifiers
+
+    Frame codecs are compiled when the decoder is created and stored in a table indexed by the
+    protected identifier, each received frame is decoded with a single lookup. Protected
+    identifiers with invalid parity bits have no entry in the table.
+
+    Event triggered frames are decoded using the associated frame that they carry, in this case
+    the associated frame is returned, its publisher is the node that responded.
+
+    :param frames: Frames to decode
+    :type frames: Iterable[Union[LinUnconditionalFrame, LinEventTriggeredFrame]]
+    :param encoding_types: Mapping of signal names to encoding types, by default the encoding
+        type assigned to the signal is used
+    :type encoding_types: Dict[str, LinSignalEncodingType]
+    :param keep_unit: Whether physical values should keep their units
+    :type keep_unit: bool
+    """
+
+    def __init__(self, frames: Iterable[Union[LinUnconditionalFrame, LinEventTriggeredFrame]],
+                 encoding_types: Dict[str, 'LinSignalEncodingType'] = None,
+                 keep_unit: bool = False) -> None:
+        self.encoding_types = encoding_types
+        self.keep_unit = keep_unit
+        self._frames: List[Optional[LinFrame]] = [None] * 256
+        self._codecs: List[Optional[Union[_LinFrameCodec, LinEventTriggeredFrame]]] = [None] * 256
+        for frame in frames:
+            if not 0 <= frame.frame_id < len(LIN_PID_TABLE):
+                # frames outside the identifier range can't appear on the bus
+                continue
+            pid = LIN_PID_TABLE[frame.frame_id]
+            self._frames[pid] = frame
+            if isinstance(frame, LinEventTriggeredFrame):
+                self._codecs[pid] = frame
+            else:
+                self._codecs[pid] = _LinFrameCodec(frame)
+
+    def get_frame(self, pid: int) -> LinFrame:
+        """
+        Returns the frame belonging to the protected identifier
+
+        :param pid: Protected identifier
+        :type pid: int
+        :returns: LIN frame
+        :rtype: LinFrame
+        :raises: LookupError if the parity is invalid or there's no frame with the given identifier
+        """
+        self._codec(pid)
+        return self._frames[pid]
+
+    def _codec(self, pid: int) -> Union[_LinFrameCodec, LinEventTriggeredFrame]:
+        codec = self._codecs[pid] if 0 <= pid <= 0xFF else None
+        if codec is None:
+            raise LookupError(f"No frame with protected id 0x{pid:02x} found!")
+        return codec
+
+    def decode(self, pid: int, data: bytearray) -> Tuple[LinFrame, Dict[str, Union[str, int, float]]]:
+        """
+        Decodes a received frame
+
+        Example:
+        >>> decoder.decode(0x42, bytearray([0x00, 0x00]))
+        (LinUnconditionalFrame(..), {'LeftIntLightsSwitch': 'Off'})
+
+        :param pid: Protected identifier
+        :type pid: int
+        :param data: Frame content
+        :type data: bytearray
+        :returns: The frame and the mapping of signal names to signal values
+        :rtype: Tuple[LinFrame, Dict[str, Union[str, int, float]]]
+        :raises: LookupError if the parity is invalid or there's no frame with the given identifier
+        """
+        return self._codec(pid).decode(data, self.encoding_types, self.keep_unit)
+
+    def decode_raw(self, pid: int, data: bytearray) -> Tuple[LinFrame, Dict[str, int]]:
+        """
+        Decodes a received frame into raw signal values
+
+        :param pid: Protected identifier
+        :type pid: int
+        :param data: Frame content
+        :type data: bytearray
+        :returns: The frame and the mapping of signal names to raw signal values
+        :rtype: Tuple[LinFrame, Dict[str, int]]
+        :raises: LookupError if the parity is invalid or there's no frame with the given identifier
+        """
+        return self._codec(pid).decode_raw(data)
+
+    def decode_stream(self, records: Iterable[Tuple[int, bytearray]],
+                      skip_unknown: bool = False) -> Iterator[Tuple[LinFrame, Dict[str, Union[str, int, float]]]]:
+        """
+        Decodes a stream of received frames
+
+        :param records: Pairs of protected identifiers and frame contents
+        :type records: Iterable[Tuple[int, bytearray]]
+        :param skip_unknown: If True, frames that cannot be looked up are skipped, otherwise
+            a LookupError is raised
+        :type skip_unknown: bool
+        :returns: The frames and their decoded signal values
+        :rtype: Iterator[Tuple[LinFrame, Dict[str, Union[str, int, float]]]]
+        """
+        codecs = self._codecs
+        encoding_types = self.encoding_types
+        keep_unit = self.keep_unit
+        for (pid, data) in records:
+            codec = codecs[pid] if 0 <= pid <= 0xFF else None
+            if codec is None:
+                if skip_unknown:
+                    continue
+                raise LookupError(f"No frame with protected id 0x{pid:02x} found!")
+            try:
+                decoded = codec.decode(data, encoding_types, keep_unit)
+            except LookupError:
+                if skip_unknown:
+                    continue
+                raise
+            yield decoded
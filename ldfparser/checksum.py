@@ -0,0 +1,200 @@
+"""
+Protected identifier and checksum calculation
+
+Protected identifiers are specified in the LIN 2.1 Specification, section 2.3.1.3, checksums
+are specified in section 2.3.1.5
+"""
+from typing import Iterable, List, Tuple, Union, TYPE_CHECKING
+
+from .lin import LIN_VERSION_2_0, LinVersion, Iso17987Version, J2602Version
+
+if TYPE_CHECKING:
+    from .frame import LinFrame
+
+LIN_CHECKSUM_CLASSIC = 'classic'
+LIN_CHECKSUM_ENHANCED = 'enhanced'
+
+# Master request and slave response frames always use the classic checksum, the identifiers are
+# repeated here because the frame module depends on the protected identifier table
+_CLASSIC_CHECKSUM_FRAME_IDS = (0x3C, 0x3D)
+
+def _calculate_pid(frame_id: int) -> int:
+    bits = [(frame_id >> i) & 1 for i in range(6)]
+    p0 = bits[0] ^ bits[1] ^ bits[2] ^ bits[4]
+    p1 = 1 - (bits[1] ^ bits[3] ^ bits[4] ^ bits[5])
+    return frame_id | (p0 << 6) | (p1 << 7)
+
+# Protected identifier of each frame identifier
+LIN_PID_TABLE: Tuple[int, ...] = tuple(_calculate_pid(frame_id) for frame_id in range(64))
+
+# Frame identifier of each protected identifier, -1 where the parity bits are invalid
+LIN_FRAME_ID_TABLE: Tuple[int, ...] = tuple(
+    LIN_PID_TABLE.index(pid) if pid in LIN_PID_TABLE else -1 for pid in range(256)
+)
+
+def protected_id(frame_id: int) -> int:
+    """
+    Returns the protected identifier of a frame identifier
+
+    Example:
+    >>> protected_id(0x3C)
+    0x3C
+
+    :param frame_id: Frame identifier (0-63)
+    :type frame_id: int
+    :returns: Frame identifier with the parity bits
+    :rtype: int
+    :raises: ValueError if the frame identifier is out of range
+    """
+    if frame_id < 0 or frame_id > 63:
+        raise ValueError(f"frame id {frame_id} is invalid, must be 0-63")
+    return LIN_PID_TABLE[frame_id]
+
+def frame_id_of(pid: int) -> int:
+    """
+    Returns the frame identifier of a protected identifier
+
+    :param pid: Protected identifier
+    :type pid: int
+    :returns: Frame identifier
+    :rtype: int
+    :raises: ValueError if the parity bits are invalid
+    """
+    frame_id = LIN_FRAME_ID_TABLE[pid & 0xFF]
+    if frame_id < 0 or pid > 0xFF:
+        raise ValueError(f"protected id 0x{pid:02x} has invalid parity")
+    return frame_id
+
+def _carry_sum(value: int, data: Iterable[int]) -> int:
+    value += sum(data)
+    while value > 0xFF:
+        value = (value & 0xFF) + (value >> 8)
+    return value
+
+def classic_checksum(data: Iterable[int]) -> int:
+    """
+    Returns the classic checksum of the frame content
+
+    :param data: Frame content
+    :type data: bytearray
+    :returns: Checksum
+    :rtype: int
+    """
+    return ~_carry_sum(0, data) & 0xFF
+
+def enhanced_checksum(pid: int, data: Iterable[int]) -> int:
+    """
+    Returns the enhanced checksum of the frame content
+
+    :param pid: Protected identifier of the frame
+    :type pid: int
+    :param data: Frame content
+    :type data: bytearray
+    :returns: Checksum
+    :rtype: int
+    """
+    return ~_carry_sum(pid, data) & 0xFF
+
+def checksum_type(frame_id: int,
+                  protocol_version: Union[LinVersion, Iso17987Version, J2602Version]) -> str:
+    """
+    Returns the checksum model used by a frame
+
+    Diagnostic frames and every frame in LIN 1.x networks use the classic checksum, other frames
+    use the enhanced checksum
+
+    :param frame_id: Frame identifier
+    :type frame_id: int
+    :param protocol_version: Protocol version of the network, see `LDF.get_protocol_version()`
+    :type protocol_version: LinVersion
+    :returns: `LIN_CHECKSUM_CLASSIC` or `LIN_CHECKSUM_ENHANCED`
+    :rtype: str
+    """
+    if frame_id in _CLASSIC_CHECKSUM_FRAME_IDS:
+        return LIN_CHECKSUM_CLASSIC
+    if protocol_version >= LIN_VERSION_2_0:
+        return LIN_CHECKSUM_ENHANCED
+    return LIN_CHECKSUM_CLASSIC
+
+def checksum(frame_id: int, data: Iterable[int],
+             protocol_version: Union[LinVersion, Iso17987Version, J2602Version]) -> int:
+    """
+    Returns the checksum of the frame content using the checksum model of the frame
+
+    Example:
+    >>> checksum(0x10, bytearray([0x01, 0x02]), ldf.get_protocol_version())
+
+    :param frame_id: Frame identifier
+    :type frame_id: int
+    :param data: Frame content
+    :type data: bytearray
+    :param protocol_version: Protocol version of the network
+    :type protocol_version: LinVersion
+    :returns: Checksum
+    :rtype: int
+    """
+    if checksum_type(frame_id, protocol_version) == LIN_CHECKSUM_ENHANCED:
+        return enhanced_checksum(protected_id(frame_id), data)
+    return classic_checksum(data)
+
+def frame_checksum(frame: 'LinFrame', data: Iterable[int],
+                   protocol_version: Union[LinVersion, Iso17987Version, J2602Version]) -> int:
+    """
+    Returns the checksum of the given frame's content
+
+    :param frame: Frame that the content belongs to
+    :type frame: LinFrame
+    :param data: Frame content
+    :type data: bytearray
+    :param protocol_version: Protocol version of the network
+    :type protocol_version: LinVersion
+    :returns: Checksum
+    :rtype: int
+    """
+    return checksum(frame.frame_id, data, protocol_version)
+
+def checksums(frames: Iterable[Tuple[int, Iterable[int]]],
+              protocol_version: Union[LinVersion, Iso17987Version, J2602Version]) -> List[int]:
+    """
+    Returns the checksums of multiple frames
+
+    :param frames: Pairs of frame identifiers and frame contents
+    :type frames: Iterable[Tuple[int, bytearray]]
+    :param protocol_version: Protocol version of the network
+    :type protocol_version: LinVersion
+    :returns: Checksums in the same order as the frames
+    :rtype: List[int]
+    """
+    seeds = _checksum_seeds(protocol_version)
+    return [~_carry_sum(seeds[frame_id], data) & 0xFF for (frame_id, data) in frames]
+
+def validate_frames(frames: Iterable[Tuple[int, Iterable[int], int]],
+                    protocol_version: Union[LinVersion, Iso17987Version, J2602Version]) -> List[bool]:
+    """
+    Validates received frames
+
+    A frame is valid when the parity bits of the protected identifier and the checksum are both
+    correct
+
+    :param frames: Tuples of protected identifiers, frame contents and received checksums
+    :type frames: Iterable[Tuple[int, bytearray, int]]
+    :param protocol_version: Protocol version of the network
+    :type protocol_version: LinVersion
+    :returns: Validity of each frame in the same order as the frames
+    :rtype: List[bool]
+    """
+    seeds = _checksum_seeds(protocol_version)
+    results = []
+    for (pid, data, received) in frames:
+        frame_id = LIN_FRAME_ID_TABLE[pid & 0xFF]
+        results.append(frame_id >= 0 and (~_carry_sum(seeds[frame_id], data) & 0xFF) == received)
+    return results
+
+def _checksum_seeds(protocol_version: Union[LinVersion, Iso17987Version, J2602Version]) -> Tuple[int, ...]:
+    """
+    Returns the initial value of the checksum calculation for each frame identifier, the protected
+    identifier for enhanced checksums and zero for classic checksums
+    """
+    return tuple(LIN_PID_TABLE[frame_id]
+                 if checksum_type(frame_id, protocol_version) == LIN_CHECKSUM_ENHANCED else 0
+                 for frame_id in range(64))
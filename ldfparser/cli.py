@@ -1,11 +1,13 @@
 """Command Line Interface
 """
 import argparse
+import csv
 import json
 import os
 import sys
 
 from ldfparser import LDF, LinFrame, LinMaster, LinSignal, LinSlave, parse_ldf
+from ldfparser.analysis import bus_load
 
 def auto_int(number: str):
     """Converts a string to integer"""
@@ -45,6 +47,11 @@ def parse_args(args):
     signalarggroup.add_argument('--list', action="store_true")
     signalarggroup.add_argument('--name', type=str)
 
+    busloadparser = subparser.add_parser('busload')
+    busloadparser.add_argument('--table', type=str, action='append')
+    busloadparser.add_argument('--format', choices=['text', 'json', 'csv'], default='text')
+    busloadparser.add_argument('--output', required=False, default=None)
+
     return parser.parse_args(args)
 
 def main():
@@ -63,6 +70,8 @@ def main():
         handle_frame_subcommand(args, ldf)
     elif args.subparser_name == 'signal':
         handle_signal_subcommand(args, ldf)
+    elif args.subparser_name == 'busload':
+        handle_busload_subcommand(args, ldf)
     else:
         exit_with_error(1, f"Unknown subcommand {args.subparser_name}")
     exit(0)
@@ -101,6 +110,40 @@ def handle_signal_subcommand(args, ldf: LDF):
             exit_with_error(1, f"Signal with name '{args.name}' not found")
         print_signal_info(ldf.signal(args.name))
 
+def handle_busload_subcommand(args, ldf: LDF):
+    try:
+        loads = bus_load(ldf, args.table)
+    except LookupError as error:
+        exit_with_error(1, str(error))
+    if args.output is None:
+        write_busload(loads, args.format, sys.stdout)
+    else:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, 'w+', newline='') as file:
+            write_busload(loads, args.format, file)
+
+def write_busload(loads, output_format: str, file):
+    if output_format == 'json':
+        json.dump([load.to_dict() for load in loads], file, indent=4)
+    elif output_format == 'csv':
+        writer = csv.writer(file)
+        writer.writerow(['table', 'index', 'name', 'length', 'delay', 'nominal', 'maximum', 'overrun'])
+        for load in loads:
+            for slot in load.slots:
+                writer.writerow([load.table.name, slot.index, slot.name, slot.length, slot.delay,
+                                 slot.nominal, slot.maximum, slot.overrun])
+    else:
+        for load in loads:
+            print(f"{load.table.name}:", file=file)
+            print(f"\tCycle time: {load.cycle_time * 1000:.02f} ms", file=file)
+            print(f"\tBus load: {load.nominal_load * 100:.01f} % (max. {load.maximum_load * 100:.01f} %)",
+                  file=file)
+            print("\tSlots (delay, nominal, maximum, name):", file=file)
+            for slot in load.slots:
+                overrun = " OVERRUN" if slot.overrun else ""
+                print(f"\t\t{slot.delay * 1000:.02f} ms,{slot.nominal * 1000:.02f} ms,"
+                      f"{slot.maximum * 1000:.02f} ms,{slot.name}{overrun}", file=file)
+
 def export_ldf(ldf: LDF, output: str = None):
     if output is None:
         json.dump(ldf._source, sys.stdout, indent=4)
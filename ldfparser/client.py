@@ -0,0 +1,481 @@
+"""
+Asynchronous diagnostic client and a simulated slave backend
+
+The client sends diagnostic requests through a `LinDiagnosticTransport`, requests addressed to
+different nodes are pipelined, while one node processes its request the next one is already sent.
+"""
+import asyncio
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from .diagnostics import (LIN_NAD_BROADCAST_ADDRESS, LIN_SID_ASSIGN_FRAME_ID, LIN_SID_ASSIGN_FRAME_ID_RANGE,
+                          LIN_SID_ASSIGN_NAD, LIN_SID_READ_BY_ID, LIN_SID_READ_BY_ID_PRODUCT_ID,
+                          LIN_SID_READ_BY_ID_SERIAL_NUMBER, LIN_SID_SAVE_CONFIGURATION,
+                          LIN_FUNCTION_ID_WILDCARD, LIN_SUPPLIER_ID_WILDCARD, encode_configuration, rsid)
+from .node import LinProductId, LinSlave
+from .transport import (LinTransportPdu, LinTransportReceiver, LinTransportTiming, segment_pdu,
+                        transport_timings)
+
+# Response service identifier of negative responses
+LIN_RSID_NEGATIVE_RESPONSE = 0x7F
+
+# Error codes of negative responses
+LIN_NRC_SERVICE_NOT_SUPPORTED = 0x11
+LIN_NRC_SUBFUNCTION_NOT_SUPPORTED = 0x12
+
+class LinDiagnosticTransport():
+    """
+    Interface between the diagnostic client and the bus
+
+    A transport sends master request frames and issues slave response headers, implementations
+    wrap LIN interfaces or simulate the slaves, see `LinSimulatedTransport`.
+    """
+
+    async def master_request(self, data: bytes) -> None:
+        """
+        Transmits a master request frame
+
+        :param data: Frame content
+        :type data: bytes
+        """
+        raise NotImplementedError()
+
+    async def slave_response(self) -> Optional[bytes]:
+        """
+        Transmits a slave response header
+
+        :returns: The frame content sent by a slave or `None` if no slave responded
+        :rtype: bytes
+        """
+        raise NotImplementedError()
+
+class _LinPendingRequest():
+    """
+    Request waiting to be transmitted or for its response
+    """
+    __slots__ = ('nad', 'frames', 'future', 'timeout', 'ready', 'deadline')
+
+    def __init__(self, nad: int, frames: List[bytes], future: asyncio.Future, timeout: float) -> None:
+        self.nad = nad
+        self.frames = frames
+        self.future = future
+        self.timeout = timeout
+        self.ready = 0.0
+        self.deadline = 0.0
+
+    def fail(self, error: Exception) -> None:
+        if not self.future.done():
+            self.future.set_exception(error)
+
+class LinDiagnosticClient():
+    """
+    LinDiagnosticClient sends diagnostic requests and awaits their responses
+
+    Requests can be issued concurrently, each node has at most one request in progress. When
+    pipelining is enabled, requests to other nodes are transmitted while waiting for a response.
+    Slave response headers for a node are only sent after its `P2_min` elapsed, frames of a
+    segmented request are spaced by its `ST_min`.
+
+    :Example:
+
+    ```
+    client = LinDiagnosticClient(LinSimulatedTransport(ldf.get_slaves()), ldf.get_slaves())
+    product_ids = await asyncio.gather(*(client.read_product_id(slave.initial_nad)
+                                         for slave in ldf.get_slaves()))
+    ```
+
+    :param transport: Transport that the requests are sent through
+    :type transport: LinDiagnosticTransport
+    :param slaves: Slave nodes whose timing applies to their requests
+    :type slaves: Iterable[LinSlave]
+    :param timeout: Default time in seconds to wait for the response after the request was sent
+    :type timeout: float
+    :param pipeline: If False, a request is only sent after the previous one was answered
+    :type pipeline: bool
+    :param poll_interval: Time in seconds between slave response headers that weren't answered
+    :type poll_interval: float
+    """
+
+    def __init__(self, transport: LinDiagnosticTransport, slaves: Iterable[LinSlave] = (),
+                 timeout: float = 1.0, pipeline: bool = True, poll_interval: float = 0.01) -> None:
+        slaves = list(slaves)
+        self.transport = transport
+        self.timeout = timeout
+        self.pipeline = pipeline
+        self.poll_interval = poll_interval
+        # timing of nodes that aren't in `slaves`
+        self.timing = LinTransportTiming()
+        self.p2_min = LinSlave('').p2_min
+        self._timings: Dict[int, LinTransportTiming] = transport_timings(slaves)
+        self._p2_min: Dict[int, float] = {}
+        for slave in slaves:
+            for nad in (slave.configured_nad, slave.initial_nad):
+                if nad is not None:
+                    self._p2_min.setdefault(nad, slave.p2_min)
+        self._receiver = LinTransportReceiver(slaves)
+        self._queue: Deque[_LinPendingRequest] = deque()
+        self._waiting: Dict[int, _LinPendingRequest] = {}
+        self._driver: Optional[asyncio.Future] = None
+
+    async def request(self, nad: int, data: bytes, timeout: float = None) -> LinTransportPdu:
+        """
+        Sends a diagnostic request and returns the response
+
+        :param nad: Node address
+        :type nad: int
+        :param data: Request starting with the service identifier
+        :type data: bytes
+        :param timeout: Time in seconds to wait for the response after the request was sent
+        :type timeout: float
+        :returns: The response
+        :rtype: LinTransportPdu
+        :raises: asyncio.TimeoutError if the request couldn't be sent within `N_As_timeout` or
+            the node didn't respond in time, ValueError if the response is malformed
+        """
+        future = asyncio.get_event_loop().create_future()
+        self._queue.append(_LinPendingRequest(nad, segment_pdu(nad, data), future,
+                                              self.timeout if timeout is None else timeout))
+        if self._driver is None or self._driver.done():
+            self._driver = asyncio.ensure_future(self._drive())
+        return await future
+
+    async def read_by_id(self, nad: int, identifier: int, supplier_id: int = LIN_SUPPLIER_ID_WILDCARD,
+                         function_id: int = LIN_FUNCTION_ID_WILDCARD) -> bytes:
+        """
+        Reads data from a node using the ReadById service
+
+        :param nad: Node address
+        :type nad: int
+        :param identifier: Identifier to read
+        :type identifier: int
+        :param supplier_id: Supplier ID
+        :type supplier_id: int
+        :param function_id: Function ID
+        :type function_id: int
+        :returns: The data following the response service identifier
+        :rtype: bytes
+        :raises: ValueError if the node responded negatively
+        """
+        pdu = await self.request(nad, bytes((LIN_SID_READ_BY_ID, identifier,
+                                             supplier_id & 0xFF, supplier_id >> 8,
+                                             function_id & 0xFF, function_id >> 8)))
+        return _positive_response(pdu, LIN_SID_READ_BY_ID)
+
+    async def read_product_id(self, nad: int) -> LinProductId:
+        """
+        Reads the product identifier of a node
+
+        :param nad: Node address
+        :type nad: int
+        :returns: Product identifier
+        :rtype: LinProductId
+        :raises: ValueError if the node responded negatively
+        """
+        data = await self.read_by_id(nad, LIN_SID_READ_BY_ID_PRODUCT_ID)
+        return LinProductId(data[0] | (data[1] << 8), data[2] | (data[3] << 8), data[4])
+
+    async def read_serial_number(self, nad: int) -> int:
+        """
+        Reads the serial number of a node
+
+        :param nad: Node address
+        :type nad: int
+        :returns: Serial number
+        :rtype: int
+        :raises: ValueError if the node responded negatively
+        """
+        data = await self.read_by_id(nad, LIN_SID_READ_BY_ID_SERIAL_NUMBER)
+        return int.from_bytes(data[:4], 'little')
+
+    async def configure(self, slaves: Iterable[LinSlave], save_configuration: bool = False) -> None:
+        """
+        Configures the slaves with the requests of `encode_configuration`
+
+        The requests of a slave are sent one after the other, slaves are configured concurrently
+
+        :param slaves: Slave nodes to configure
+        :type slaves: Iterable[LinSlave]
+        :param save_configuration: If True, the nodes are requested to save their configuration
+        :type save_configuration: bool
+        :raises: ValueError if a node responded negatively
+        """
+        async def configure_slave(slave: LinSlave) -> None:
+            requests = encode_configuration([slave], save_configuration=save_configuration)
+            for i in range(0, len(requests), 8):
+                (nad, pci) = (requests[i], requests[i + 1])
+                data = requests[i + 2:i + 2 + (pci & 0x0F)]
+                _positive_response(await self.request(nad, data), data[0])
+
+        await asyncio.gather(*(configure_slave(slave) for slave in slaves))
+
+    async def _drive(self) -> None:
+        """
+        Transmits queued requests and polls responses until every request is completed
+        """
+        loop = asyncio.get_event_loop()
+        try:
+            while self._queue or self._waiting:
+                now = loop.time()
+                self._expire(now)
+                request = self._next_request()
+                if request is not None:
+                    await self._transmit(request)
+                elif self._waiting:
+                    await self._poll(now)
+        except Exception as error:  # pylint: disable=broad-except
+            for request in list(self._queue) + list(self._waiting.values()):
+                request.fail(error)
+            self._queue.clear()
+            self._waiting.clear()
+
+    def _next_request(self) -> Optional[_LinPendingRequest]:
+        """
+        Removes and returns the first queued request that can be transmitted
+        """
+        if self._waiting and (not self.pipeline or LIN_NAD_BROADCAST_ADDRESS in self._waiting):
+            return None
+        for request in list(self._queue):
+            if request.future.done():
+                # cancelled by the caller
+                self._queue.remove(request)
+            elif request.nad not in self._waiting and \
+                    (request.nad != LIN_NAD_BROADCAST_ADDRESS or not self._waiting):
+                self._queue.remove(request)
+                return request
+        return None
+
+    async def _transmit(self, request: _LinPendingRequest) -> None:
+        loop = asyncio.get_event_loop()
+        timing = self._timings.get(request.nad, self.timing)
+        try:
+            for (index, frame) in enumerate(request.frames):
+                if index > 0 and timing.st_min > 0:
+                    await asyncio.sleep(timing.st_min)
+                await asyncio.wait_for(self.transport.master_request(frame), timing.n_as_timeout)
+        except asyncio.TimeoutError:
+            request.fail(asyncio.TimeoutError(f"N_As timeout of node 0x{request.nad:02x} elapsed"))
+            return
+        except Exception as error:
+            # the request was already removed from the queue
+            request.fail(error)
+            raise
+        now = loop.time()
+        request.ready = now + self._p2_min.get(request.nad, self.p2_min)
+        request.deadline = now + request.timeout
+        self._waiting[request.nad] = request
+
+    async def _poll(self, now: float) -> None:
+        """
+        Sends a slave response header once a node may respond
+        """
+        ready = min(request.ready for request in self._waiting.values())
+        if ready > now:
+            await asyncio.sleep(ready - now)
+            return
+        data = await self.transport.slave_response()
+        if data is None:
+            await asyncio.sleep(self.poll_interval)
+            return
+        self._dispatch(data, asyncio.get_event_loop().time())
+
+    def _expire(self, now: float) -> None:
+        for (nad, request) in list(self._waiting.items()):
+            if now > request.deadline:
+                del self._waiting[nad]
+                self._receiver.discard(nad)
+                request.fail(asyncio.TimeoutError(f"no response from node 0x{nad:02x}"))
+
+    def _dispatch(self, data: bytes, timestamp: float) -> None:
+        nad = data[0]
+        if nad not in self._waiting and LIN_NAD_BROADCAST_ADDRESS in self._waiting:
+            nad = LIN_NAD_BROADCAST_ADDRESS
+        try:
+            pdu = self._receiver.receive(data, timestamp)
+        except (ValueError, TimeoutError) as error:
+            request = self._waiting.pop(nad, None)
+            if request is not None:
+                request.fail(error)
+            return
+        if pdu is None:
+            return
+        request = self._waiting.pop(nad, None)
+        if request is not None and not request.future.done():
+            request.future.set_result(pdu)
+
+def _positive_response(pdu: LinTransportPdu, sid: int) -> bytes:
+    """
+    Returns the data of a positive response following the response service identifier
+
+    :raises: ValueError if the response is negative or belongs to another service
+    """
+    if pdu.sid == LIN_RSID_NEGATIVE_RESPONSE:
+        code = pdu.data[2] if len(pdu.data) > 2 else None
+        raise ValueError(f"node 0x{pdu.nad:02x} rejected service 0x{sid:02x}, error code {code}")
+    if pdu.sid != rsid(sid):
+        raise ValueError(f"node 0x{pdu.nad:02x} responded to service 0x{sid:02x} with 0x{pdu.sid:02x}")
+    return pdu.data[1:]
+
+class LinSimulatedSlave():
+    """
+    LinSimulatedSlave responds to diagnostic requests the way the slave described in the LDF would
+
+    The node configuration services and ReadById are implemented, the node starts with its
+    initial NAD. Other services can be added through `handlers`, a handler receives the request
+    and returns the response or `None` if the node doesn't respond.
+
+    :param slave: Slave node
+    :type slave: LinSlave
+    :param serial_number: Serial number returned by ReadById
+    :type serial_number: int
+    """
+
+    def __init__(self, slave: LinSlave, serial_number: int = 0) -> None:
+        self.slave = slave
+        self.nad: int = slave.initial_nad if slave.initial_nad is not None else slave.configured_nad
+        self.serial_number = serial_number
+        # data returned by ReadById for user defined identifiers
+        self.identifiers: Dict[int, bytes] = {}
+        # protected identifiers assigned to the configurable frames
+        self.frame_ids: Dict[int, int] = {}
+        self.saved = False
+        self.handlers: Dict[int, Callable[[bytes], Optional[bytes]]] = {
+            LIN_SID_ASSIGN_NAD: self._assign_nad,
+            LIN_SID_ASSIGN_FRAME_ID: self._assign_frame_id,
+            LIN_SID_READ_BY_ID: self._read_by_id,
+            LIN_SID_SAVE_CONFIGURATION: self._save_configuration,
+            LIN_SID_ASSIGN_FRAME_ID_RANGE: self._assign_frame_id_range
+        }
+
+    def handle(self, nad: int, data: bytes) -> Optional[bytes]:
+        """
+        Processes a request
+
+        :param nad: Node address the request was sent to
+        :type nad: int
+        :param data: Request starting with the service identifier
+        :type data: bytes
+        :returns: The response or `None` if the request wasn't addressed to the node
+        :rtype: bytes
+        """
+        if nad != self.nad and nad != LIN_NAD_BROADCAST_ADDRESS:
+            return None
+        handler = self.handlers.get(data[0])
+        if handler is None:
+            return bytes((LIN_RSID_NEGATIVE_RESPONSE, data[0], LIN_NRC_SERVICE_NOT_SUPPORTED))
+        return handler(data)
+
+    def _matches(self, supplier_id: int, function_id: int) -> bool:
+        product_id = self.slave.product_id
+        if product_id is None:
+            return True
+        return supplier_id in (LIN_SUPPLIER_ID_WILDCARD, product_id.supplier_id) and \
+            function_id in (LIN_FUNCTION_ID_WILDCARD, product_id.function_id)
+
+    def _assign_nad(self, data: bytes) -> Optional[bytes]:
+        if not self._matches(data[1] | (data[2] << 8), data[3] | (data[4] << 8)):
+            return None
+        self.nad = data[5]
+        return bytes((rsid(LIN_SID_ASSIGN_NAD), ))
+
+    def _assign_frame_id(self, data: bytes) -> Optional[bytes]:
+        if not self._matches(data[1] | (data[2] << 8), LIN_FUNCTION_ID_WILDCARD):
+            return None
+        self.frame_ids[data[3] | (data[4] << 8)] = data[5]
+        return bytes((rsid(LIN_SID_ASSIGN_FRAME_ID), ))
+
+    def _assign_frame_id_range(self, data: bytes) -> Optional[bytes]:
+        for (index, pid) in enumerate(data[2:6], data[1]):
+            if pid == 0xFF:
+                continue
+            if pid == 0x00:
+                self.frame_ids.pop(index, None)
+            else:
+                self.frame_ids[index] = pid
+        return bytes((rsid(LIN_SID_ASSIGN_FRAME_ID_RANGE), ))
+
+    def _read_by_id(self, data: bytes) -> Optional[bytes]:
+        if not self._matches(data[2] | (data[3] << 8), data[4] | (data[5] << 8)):
+            return None
+        identifier = data[1]
+        response = bytes((rsid(LIN_SID_READ_BY_ID), ))
+        product_id = self.slave.product_id
+        if identifier == LIN_SID_READ_BY_ID_PRODUCT_ID and product_id is not None:
+            return response + bytes((product_id.supplier_id & 0xFF, product_id.supplier_id >> 8,
+                                     product_id.function_id & 0xFF, product_id.function_id >> 8,
+                                     product_id.variant or 0))
+        if identifier == LIN_SID_READ_BY_ID_SERIAL_NUMBER:
+            return response + self.serial_number.to_bytes(4, 'little')
+        if identifier in self.identifiers:
+            return response + self.identifiers[identifier]
+        return bytes((LIN_RSID_NEGATIVE_RESPONSE, LIN_SID_READ_BY_ID, LIN_NRC_SUBFUNCTION_NOT_SUPPORTED))
+
+    def _save_configuration(self, data: bytes) -> Optional[bytes]:
+        self.saved = True
+        return bytes((rsid(LIN_SID_SAVE_CONFIGURATION), ))
+
+class LinSimulatedTransport(LinDiagnosticTransport):
+    """
+    LinSimulatedTransport simulates the slaves of a cluster in the same process
+
+    Responses become available `P2_min` of the responding slave after the request, which allows
+    measuring the throughput of the client without hardware.
+
+    :Example:
+
+    ```
+    transport = LinSimulatedTransport(ldf.get_slaves())
+    transport.get_slave('LSM').identifiers[32] = b'\x01\x02\x03\x04\x05'
+    ```
+
+    :param slaves: Slave nodes to simulate
+    :type slaves: Iterable[LinSlave]
+    :param frame_time: Time in seconds each frame takes on the bus
+    :type frame_time: float
+    """
+
+    def __init__(self, slaves: Iterable[LinSlave], frame_time: float = 0) -> None:
+        self.slaves: List[LinSimulatedSlave] = [LinSimulatedSlave(slave) for slave in slaves]
+        self.frame_time = frame_time
+        self._receiver = LinTransportReceiver()
+        # time when the response is available and its remaining frames
+        self._responses: List[Tuple[float, Deque[bytes]]] = []
+
+    def get_slave(self, name: str) -> LinSimulatedSlave:
+        """
+        Returns the simulated slave with the given name
+
+        :raises: LookupError if there's no simulated slave with the name
+        """
+        for slave in self.slaves:
+            if slave.slave.name == name:
+                return slave
+        raise LookupError(f"No simulated slave named '{name}' found!")
+
+    async def master_request(self, data: bytes) -> None:
+        if self.frame_time > 0:
+            await asyncio.sleep(self.frame_time)
+        try:
+            pdu = self._receiver.receive(bytes(data))
+        except ValueError:
+            # slaves ignore malformed requests
+            return
+        if pdu is None:
+            return
+        now = asyncio.get_event_loop().time()
+        for slave in self.slaves:
+            nad = slave.nad
+            response = slave.handle(pdu.nad, pdu.data)
+            if response is not None:
+                self._responses.append((now + slave.slave.p2_min, deque(segment_pdu(nad, response))))
+
+    async def slave_response(self) -> Optional[bytes]:
+        if self.frame_time > 0:
+            await asyncio.sleep(self.frame_time)
+        now = asyncio.get_event_loop().time()
+        for (index, (ready, frames)) in enumerate(self._responses):
+            if ready <= now:
+                data = frames.popleft()
+                if not frames:
+                    del self._responses[index]
+                return data
+        return None
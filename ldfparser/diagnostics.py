@@ -1,6 +1,15 @@
-from typing import Iterable, Dict
+import struct
+from typing import Iterable, Dict, List, NamedTuple, Optional, Tuple, Union, TYPE_CHECKING
 
+from .checksum import LIN_PID_TABLE
 from .frame import LinUnconditionalFrame
+from .lin import LIN_VERSION_2_0
+from .schedule import (AssignFrameIdEntry, AssignFrameIdRangeEntry, AssignNadEntry, ConditionalChangeNadEntry,
+                       DataDumpEntry, FreeFormatEntry, SaveConfigurationEntry, ScheduleTableEntry,
+                       UnassignFrameIdEntry)
+
+if TYPE_CHECKING:
+    from .node import LinSlave
 
 # LIN Diagnostic Frame IDs
 LIN_MASTER_REQUEST_FRAME_ID = 0x3C
@@ -32,6 +41,16 @@ LIN_SID_READ_BY_ID_RESERVED_RANGE1 = range(2, 32)
 LIN_SID_READ_BY_ID_USER_DEFINED_RANGE = range(32, 64)
 LIN_SID_READ_BY_ID_RESERVED_RANGE2 = range(64, 256)
 
+# Wildcards matching any supplier and function (Specified in 4.2.3.2)
+LIN_SUPPLIER_ID_WILDCARD = 0x7FFF
+LIN_FUNCTION_ID_WILDCARD = 0xFFFF
+
+# Protected identifier that leaves the frame's assignment unchanged in AssignFrameIdRange
+LIN_PID_DO_NOT_CARE = 0xFF
+
+# Protected identifier that unassigns a frame in AssignFrameId
+LIN_PID_UNASSIGNED = 0x40
+
 def rsid(sid: int) -> int:
     """
     Returns the response service identifier for a given service id
@@ -71,6 +90,179 @@ def pci_byte(pci_type: int, length: int) -> int:
     """
     return (length & 0x0F) | (pci_type << 4)
 
+# Standard diagnostic frames consist of 8 byte aligned fields
+_DIAGNOSTIC_FRAME_LENGTH = 8
+_DIAGNOSTIC_FRAME_STRUCT = struct.Struct('8B')
+
+def _is_byte_aligned(frame: LinUnconditionalFrame) -> bool:
+    return frame.length == _DIAGNOSTIC_FRAME_LENGTH and \
+        [(offset, signal.width) for (offset, signal) in frame.signal_map] == \
+        [(offset, 8) for offset in range(0, 64, 8)]
+
+def assign_frame_id_ranges(slave: 'LinSlave') -> List[Tuple[int, List[int]]]:
+    """
+    Returns the AssignFrameIdRange requests that assign the configurable frames of a slave
+
+    Frames are assigned in groups of four consecutive message indices, indices without a
+    configurable frame are left unchanged.
+
+    Example:
+    >>> assign_frame_id_ranges(ldf.get_slave('LSM'))
+    [(0, [0x06, 0xC1, 0x42, 0x03])]
+
+    :param slave: Slave node
+    :type slave: LinSlave
+    :returns: Start index and the four protected identifiers of each request
+    :rtype: List[Tuple[int, List[int]]]
+    """
+    frames = slave.configurable_frames
+    if not frames:
+        return []
+    ranges = []
+    for start_index in range(0, max(frames.keys()) + 1, 4):
+        pids = [LIN_PID_TABLE[frames[index].frame_id] if index in frames else LIN_PID_DO_NOT_CARE
+                for index in range(start_index, start_index + 4)]
+        if any(pid != LIN_PID_DO_NOT_CARE for pid in pids):
+            ranges.append((start_index, pids))
+    return ranges
+
+def _node_ids(node: 'LinSlave') -> Tuple[int, int]:
+    if node.product_id is None:
+        return (LIN_SUPPLIER_ID_WILDCARD, LIN_FUNCTION_ID_WILDCARD)
+    return (node.product_id.supplier_id, node.product_id.function_id)
+
+def encode_configuration(slaves: Iterable['LinSlave'], assign_nad: bool = True,
+                         save_configuration: bool = False) -> bytes:
+    """
+    Encodes the node configuration requests of multiple slaves into a single buffer
+
+    For each slave the following master requests are encoded:
+
+    - AssignNAD from the initial to the configured NAD, if they differ
+    - AssignFrameIdRange requests of the configurable frames, see `assign_frame_id_ranges`,
+      or AssignFrameId requests for LIN 2.0 nodes
+    - SaveConfiguration, if requested
+
+    Example:
+    >>> data = encode_configuration(ldf.get_slaves())
+    >>> frames = [data[i:i + 8] for i in range(0, len(data), 8)]
+
+    :param slaves: Slave nodes to configure
+    :type slaves: Iterable[LinSlave]
+    :param assign_nad: If False, the nodes are expected to have their configured NADs already
+    :type assign_nad: bool
+    :param save_configuration: If True, the nodes are requested to save their configuration
+    :type save_configuration: bool
+    :returns: Consecutive 8 byte master request frame contents
+    :rtype: bytes
+    :raises: ValueError if a slave has no node address
+    """
+    pack = _DIAGNOSTIC_FRAME_STRUCT.pack
+    single_frame = pci_byte(LIN_PCI_SINGLE_FRAME, 6)
+    requests = []
+    for slave in slaves:
+        nad = slave.configured_nad if slave.configured_nad is not None else slave.initial_nad
+        if nad is None:
+            raise ValueError(f"{slave.name} has no node address")
+        (supplier_id, function_id) = _node_ids(slave)
+        if assign_nad and slave.initial_nad is not None and slave.initial_nad != nad:
+            requests.append(pack(slave.initial_nad, single_frame, LIN_SID_ASSIGN_NAD,
+                                 supplier_id & 0xFF, supplier_id >> 8, function_id & 0xFF, function_id >> 8,
+                                 nad))
+        if slave.lin_protocol == LIN_VERSION_2_0:
+            for (message_id, frame) in sorted(slave.configurable_frames.items()):
+                requests.append(pack(nad, single_frame, LIN_SID_ASSIGN_FRAME_ID,
+                                     supplier_id & 0xFF, supplier_id >> 8, message_id & 0xFF, message_id >> 8,
+                                     LIN_PID_TABLE[frame.frame_id]))
+        else:
+            for (start_index, pids) in assign_frame_id_ranges(slave):
+                requests.append(pack(nad, single_frame, LIN_SID_ASSIGN_FRAME_ID_RANGE, start_index, *pids))
+        if save_configuration:
+            requests.append(pack(nad, pci_byte(LIN_PCI_SINGLE_FRAME, 1), LIN_SID_SAVE_CONFIGURATION,
+                                 0xFF, 0xFF, 0xFF, 0xFF, 0xFF))
+    return b''.join(requests)
+
+def _assign_frame_id(entry: Union[AssignFrameIdEntry, UnassignFrameIdEntry], pid: int) -> bytes:
+    node = entry.node
+    message_ids = [message_id for (message_id, frame) in node.configurable_frames.items() if frame is entry.frame]
+    if not message_ids:
+        raise ValueError(f"{entry.frame.name} isn't a configurable frame of {node.name}")
+    (supplier_id, _) = _node_ids(node)
+    return _DIAGNOSTIC_FRAME_STRUCT.pack(node.configured_nad, pci_byte(LIN_PCI_SINGLE_FRAME, 6),
+                                         LIN_SID_ASSIGN_FRAME_ID, supplier_id & 0xFF, supplier_id >> 8,
+                                         message_ids[0] & 0xFF, message_ids[0] >> 8, pid)
+
+def encode_configuration_entry(entry: ScheduleTableEntry) -> bytes:
+    """
+    Encodes the master request sent in the slot of a node configuration or free format entry
+
+    AssignFrameIdRange entries without protected identifiers assign the configurable frames of
+    the node starting at the frame index.
+
+    Example:
+    >>> encode_configuration_entry(ldf.get_schedule_table('Configuration_Schedule').schedule[0])
+    b'\x01\x06\xb0\x4f\x4a\x41\x48\x21'
+
+    :param entry: Schedule table entry
+    :type entry: ScheduleTableEntry
+    :returns: Master request frame content
+    :rtype: bytes
+    :raises: ValueError if the entry isn't a configuration entry, its frame isn't configurable or
+        its fields don't fit into the request, such as a missing NAD or more than 5 data bytes
+    """
+    try:
+        return _encode_configuration_entry(entry)
+    except struct.error as error:
+        node = getattr(entry, 'node', None)
+        target = f" of {node.name}" if node is not None else ""
+        raise ValueError(f"{type(entry).__name__}{target} cannot be encoded: {error}") from error
+
+def _encode_configuration_entry(entry: ScheduleTableEntry) -> bytes:
+    pack = _DIAGNOSTIC_FRAME_STRUCT.pack
+    single_frame = pci_byte(LIN_PCI_SINGLE_FRAME, 6)
+    if isinstance(entry, FreeFormatEntry):
+        return bytes(entry.data)
+    if isinstance(entry, AssignNadEntry):
+        (supplier_id, function_id) = _node_ids(entry.node)
+        return pack(entry.node.initial_nad, single_frame, LIN_SID_ASSIGN_NAD, supplier_id & 0xFF, supplier_id >> 8,
+                    function_id & 0xFF, function_id >> 8, entry.node.configured_nad)
+    if isinstance(entry, AssignFrameIdRangeEntry):
+        pids = list(entry.pids)
+        if not pids:
+            frames = entry.node.configurable_frames
+            pids = [LIN_PID_TABLE[frames[index].frame_id] if index in frames else LIN_PID_DO_NOT_CARE
+                    for index in range(entry.frame_index, entry.frame_index + 4)]
+        pids += [LIN_PID_DO_NOT_CARE] * (4 - len(pids))
+        return pack(entry.node.configured_nad, single_frame, LIN_SID_ASSIGN_FRAME_ID_RANGE, entry.frame_index,
+                    *pids)
+    if isinstance(entry, ConditionalChangeNadEntry):
+        return pack(entry.nad, single_frame, LIN_SID_CONDITIONAL_CHANGE_NAD, entry.id, entry.byte, entry.mask,
+                    entry.inv, entry.new_nad)
+    if isinstance(entry, DataDumpEntry):
+        data = list(entry.data) + [0xFF] * (5 - len(entry.data))
+        return pack(entry.node.configured_nad, single_frame, LIN_SID_DATA_DUMP, *data)
+    if isinstance(entry, SaveConfigurationEntry):
+        return pack(entry.node.configured_nad, pci_byte(LIN_PCI_SINGLE_FRAME, 1), LIN_SID_SAVE_CONFIGURATION,
+                    0xFF, 0xFF, 0xFF, 0xFF, 0xFF)
+    if isinstance(entry, AssignFrameIdEntry):
+        return _assign_frame_id(entry, LIN_PID_TABLE[entry.frame.frame_id])
+    if isinstance(entry, UnassignFrameIdEntry):
+        return _assign_frame_id(entry, LIN_PID_UNASSIGNED)
+    raise ValueError(f"{type(entry).__name__} isn't a configuration entry")
+
+class LinDiagnosticResponseFields(NamedTuple):
+    """
+    Fields of a diagnostic response, the fields that the response frame doesn't contain are `None`
+    """
+    NAD: Optional[int] = None
+    PCI: Optional[int] = None
+    RSID: Optional[int] = None
+    D1: Optional[int] = None
+    D2: Optional[int] = None
+    D3: Optional[int] = None
+    D4: Optional[int] = None
+    D5: Optional[int] = None
+
 class LinDiagnosticFrame(LinUnconditionalFrame):
     """Base class for diagnostic communication"""
     pass
@@ -82,6 +274,8 @@ class LinDiagnosticRequest(LinDiagnosticFrame):
 
     def __init__(self, frame: LinDiagnosticFrame):
         super().__init__(frame.frame_id, frame.name, frame.length, dict(frame.signal_map))
+        # requests in standard frames are written directly into the frame content
+        self._byte_aligned = _is_byte_aligned(self)
 
     def encode_request(self, nad: int, pci: int, sid: int,
                        d1: int, d2: int, d3: int, d4: int, d5: int):
@@ -111,6 +305,8 @@ class LinDiagnosticRequest(LinDiagnosticFrame):
         :returns: Encoded frame
         :rtype: bytearray
         """
+        if self._byte_aligned:
+            return bytearray((nad, pci, sid, d1, d2, d3, d4, d5))
         return self.encode_raw([nad, pci, sid, d1, d2, d3, d4, d5])
 
     def encode_assign_nad(self, initial_nad: int, supplier_id: int, function_id: int,
@@ -223,6 +419,30 @@ class LinDiagnosticRequest(LinDiagnosticFrame):
                                    start_index,
                                    pids[0], pids[1], pids[2], pids[3])
 
+    def encode_assign_frame_id(self, nad: int, supplier_id: int, message_id: int,
+                               pid: int) -> bytearray:
+        """
+        Encodes an AssignFrameId diagnostic request into a frame, used by LIN 2.0 nodes
+
+        Example:
+        >>> encode_assign_frame_id(nad=0x01, supplier_id=0x7FFF, message_id=0x0001, pid=0xC1)
+
+        :param nad: Node Address
+        :type nad: int
+        :param supplier_id: Supplier ID
+        :type supplier_id: int
+        :param message_id: Message ID of the frame
+        :type message_id: int
+        :param pid: Protected identifier to assign
+        :type pid: int
+        :returns: Encoded frame
+        :rtype: bytearray
+        """
+        return self.encode_request(nad, pci_byte(LIN_PCI_SINGLE_FRAME, 6), LIN_SID_ASSIGN_FRAME_ID,
+                                   supplier_id & 0xFF, (supplier_id >> 8) & 0xFF,
+                                   message_id & 0xFF, (message_id >> 8) & 0xFF,
+                                   pid)
+
     def encode_read_by_id(self, nad: int, identifier: int, supplier_id: int,
                           function_id: int) -> bytearray:
         """
@@ -259,6 +479,8 @@ class LinDiagnosticResponse(LinDiagnosticFrame):
         super().__init__(frame.frame_id, frame.name, frame.length, dict(frame.signal_map))
         self._signal_remapper = dict(zip(map(lambda x: x[1].name, frame.signal_map),
                                          LinDiagnosticResponse._FIELDS))
+        # the fields of standard frames are read directly from the frame content
+        self._byte_aligned = _is_byte_aligned(self)
 
     def decode_response(self, data: bytearray) -> Dict[str, int]:
         """
@@ -273,5 +495,54 @@ class LinDiagnosticResponse(LinDiagnosticFrame):
         :returns: Dictionary of field keys and values
         :rtype: Dict[str, int]
         """
+        if self._byte_aligned:
+            return dict(zip(LinDiagnosticResponse._FIELDS, self.decode_response_fields(data)))
         message = self.decode_raw(data)
         return {self._signal_remapper[signal_name]: message[signal_name] for signal_name in message}
+
+    def decode_response_fields(self, data: bytearray) -> LinDiagnosticResponseFields:
+        """
+        Decodes a diagnostic response into a tuple of its fields
+
+        The fields of standard 8 byte frames are read directly from the frame content
+
+        Example:
+        >>> decode_response_fields(bytearray([0x00,0x01,0xF0,0xFF,0xFF,0xFF,0xFF,0xFF]))
+        LinDiagnosticResponseFields(NAD=0, PCI=1, RSID=240, D1=255, ...)
+
+        :param data: Frame content
+        :type data: bytearray
+        :returns: Fields of the response
+        :rtype: LinDiagnosticResponseFields
+        :raises: ValueError if the frame content isn't 8 bytes long
+        """
+        if self._byte_aligned:
+            if len(data) != _DIAGNOSTIC_FRAME_LENGTH:
+                raise ValueError(f"{self.name}: expected {_DIAGNOSTIC_FRAME_LENGTH} bytes, got {len(data)}")
+            return LinDiagnosticResponseFields._make(data)
+        message = self.decode_raw(data)
+        return LinDiagnosticResponseFields(**{self._signal_remapper[signal_name]: message[signal_name]
+                                              for signal_name in message})
+
+    def decode_responses(self, data: Union[Iterable[bytearray], bytes]) -> List[LinDiagnosticResponseFields]:
+        """
+        Decodes multiple diagnostic responses
+
+        Example:
+        >>> decode_responses(log_buffer)
+        [LinDiagnosticResponseFields(NAD=0, PCI=1, RSID=240, ...), ...]
+
+        :param data: Frame contents, or a single buffer of consecutive 8 byte frames
+        :type data: List[bytearray] or bytes
+        :returns: Fields of each response
+        :rtype: List[LinDiagnosticResponseFields]
+        :raises: ValueError if a frame content isn't 8 bytes long
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            if not self._byte_aligned:
+                raise ValueError(f"{self.name}: buffers can only be decoded from standard diagnostic frames")
+            if len(data) % _DIAGNOSTIC_FRAME_LENGTH != 0:
+                raise ValueError(f"{self.name}: buffer of {len(data)} bytes doesn't contain "
+                                 f"{_DIAGNOSTIC_FRAME_LENGTH} byte frames")
+            return list(map(LinDiagnosticResponseFields._make, _DIAGNOSTIC_FRAME_STRUCT.iter_unpack(data)))
+        return [self.decode_response_fields(frame) for frame in data]
@@ -3,16 +3,170 @@ Contains classes that are used to encode and decode Lin Signals.
 
 Signal encoding is specified in the LIN 2.1 Specification, section 9.2.6.1
 """
-from typing import List, Union, Any, TYPE_CHECKING
+import struct
+import sys
+from fractions import Fraction
+from math import gcd
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union, Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .signal import LinSignal
 
+# Lookup tables contain 2^width entries, wider signals are always decoded through the converters
+LIN_LOOKUP_TABLE_MAX_WIDTH = 12
+
+# Lookup table entry of raw values that none of the converters can decode
+_UNDECODABLE = object()
+
+# Validation policies of encoding types
+LIN_VALIDATION_STRICT = 'strict'
+LIN_VALIDATION_CLAMP = 'clamp'
+LIN_VALIDATION_UNCHECKED = 'unchecked'
+
+# Translation tables between BCD digits and their ASCII characters, bytes above 9 are translated
+# into a non-digit character
+_BCD_DECODE_TABLE = b'0123456789' + b'x' * 246
+_BCD_ENCODE_TABLE = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+def _join_records(values: Union[Sequence[Any], bytes], size: int) -> Optional[bytes]:
+    """
+    Returns the values of an array signal as one contiguous buffer
+
+    Buffers and NumPy arrays of bytes are returned as is, other sequences are joined if each
+    record is `size` bytes long, otherwise `None` is returned
+    """
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        buffer = bytes(values)
+    elif hasattr(values, 'dtype'):
+        if values.dtype.itemsize != 1:
+            raise ValueError(f"expected an array of bytes, got {values.dtype}")
+        buffer = values.tobytes()
+    else:
+        if not all(isinstance(value, (bytes, bytearray)) for value in values):
+            values = [bytes(value) for value in values]
+        if set(map(len, values)) - {size}:
+            return None
+        return b''.join(values)
+    if len(buffer) % size != 0:
+        raise ValueError(f"buffer of {len(buffer)} bytes doesn't contain {size} byte records")
+    return buffer
+
+def _split_records(buffer: bytes, size: int) -> Tuple[bytes, ...]:
+    """
+    Splits a contiguous buffer into records of `size` bytes
+    """
+    return struct.unpack(f'{size}s' * (len(buffer) // size), buffer)
+
+class PhysicalQuantity():
+    """
+    PhysicalQuantity is a decoded physical value along with its unit
+
+    Returned by `PhysicalValue.decode` when the unit is kept, the value is only formatted when it's
+    converted into a string, the unit is shared with the converter. Quantities are immutable, decoding
+    tables return the same instance for a raw value. Quantities compare equal to their formatted
+    strings, e.g. `PhysicalQuantity(12.3, 'rpm') == '12.300 rpm'`.
+
+    :param value: Physical value
+    :type value: float
+    :param unit: Unit of the value
+    :type unit: str
+    """
+    __slots__ = ('_value', '_unit')
+
+    def __init__(self, value: float, unit: str) -> None:
+        self._value = value
+        self._unit = unit
+
+    @property
+    def value(self) -> float:
+        """Physical value"""
+        return self._value
+
+    @property
+    def unit(self) -> str:
+        """Unit of the value"""
+        return self._unit
+
+    def __str__(self) -> str:
+        return f"{self.value:.03f} {self.unit}"
+
+    def __repr__(self) -> str:
+        return f"PhysicalQuantity({self.value!r}, {self.unit!r})"
+
+    def __format__(self, format_spec: str) -> str:
+        if not format_spec:
+            return str(self)
+        return f"{self.value:{format_spec}} {self.unit}"
+
+    def __float__(self) -> float:
+        return float(self.value)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, PhysicalQuantity):
+            return self.value == other.value and self.unit == other.unit
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+class FixedPointScale(NamedTuple):
+    """
+    FixedPointScale is the exact rational form of a physical value's scale and offset
+
+    The physical value of a raw value is `(raw * numerator + offset) / denominator`, the
+    `scale` methods return the numerator of this fraction, an integer expressed in units of
+    `1 / denominator`.
+
+    :Example:
+
+    `PhysicalValue(0, 254, 0.5, -40, '°C').fixed_point` is `FixedPointScale(1, 2, -80)`, the
+    raw value 100 is scaled to 20 half degrees, i.e. 10.0 °C
+    """
+    numerator: int
+    denominator: int
+    offset: int
+
+    def scale(self, raw: int) -> int:
+        """
+        Returns the physical value of the raw value in units of `1 / denominator`
+        """
+        return raw * self.numerator + self.offset
+
+    def scale_many(self, raws: Sequence[int]) -> Sequence[int]:
+        """
+        Scales multiple raw values, NumPy integer arrays are scaled in a single vectorized
+        operation and returned as an array, other sequences are returned as lists
+        """
+        if hasattr(raws, 'dtype'):
+            return raws * self.numerator + self.offset
+        numerator = self.numerator
+        offset = self.offset
+        return [raw * numerator + offset for raw in raws]
+
+    def to_float(self, raw: int) -> float:
+        """
+        Returns the physical value of the raw value as a floating point number
+        """
+        return self.scale(raw) / self.denominator
+
+class FixedPointValue(NamedTuple):
+    """
+    FixedPointValue is a raw signal value along with the scale of the physical value converter
+    that applies to it, `scale` is `None` when the value isn't a physical value
+    """
+    raw: Union[int, bytes]
+    scale: Optional[FixedPointScale]
+
 class ValueConverter():
     """
     Value converter is used to convert Lin signal values from and into
     their human readable form
     """
+    # Whether the converter decodes the bytes of array signals directly, otherwise array signals
+    # are converted into a big endian integer first
+    _decodes_bytes = False
 
     def encode(self, value: Any, signal: 'LinSignal') -> Union[int, List[int]]:
         """
@@ -26,6 +180,19 @@ class ValueConverter():
         """
         raise NotImplementedError()
 
+    def encode_many(self, values: Sequence[Any], signal: 'LinSignal') -> List[Union[int, List[int], bytes]]:
+        """
+        Converts multiple human readable values into raw values
+        """
+        return [self.encode(value, signal) for value in values]
+
+    def decode_many(self, values: Sequence[Union[int, List[int], bytes]], signal: 'LinSignal',
+                    keep_unit: bool = False) -> List[Any]:
+        """
+        Converts multiple raw values into their human readable form
+        """
+        return [self.decode(value, signal, keep_unit) for value in values]
+
 class PhysicalValue(ValueConverter):
     """
     Value converter for physical values
@@ -45,29 +212,55 @@ class PhysicalValue(ValueConverter):
         self.scale = scale
         self.offset = offset
         self.unit = unit
+        self._fixed_point: FixedPointScale = None
 
-    def encode(self, value: Union[str, int, float], signal: 'LinSignal') -> int:
+    @property
+    def fixed_point(self) -> FixedPointScale:
+        """
+        Returns the scale and offset as exact integers, decimal scales are taken as written, e.g.
+        a scale of `0.3937` becomes `3937 / 10000`
+
+        The result is computed once and cached
+        """
+        if self._fixed_point is None:
+            scale = Fraction(str(self.scale))
+            offset = Fraction(str(self.offset))
+            denominator = scale.denominator * offset.denominator // gcd(scale.denominator, offset.denominator)
+            self._fixed_point = FixedPointScale(int(scale * denominator), denominator,
+                                                int(offset * denominator))
+        return self._fixed_point
+
+    def _parse(self, value: Union[str, int, float]) -> float:
         if isinstance(value, str) and self.unit is not None and value.endswith(self.unit):
-            num = float(value[:-len(self.unit)])
-        else:
-            num = float(value)
+            return float(value[:-len(self.unit)])
+        return float(value)
 
-        raw = self.offset
+    def _raw(self, num: float) -> int:
         if self.scale != 0:
-            raw = round((num - self.offset) / self.scale)
+            return round((num - self.offset) / self.scale)
+        return self.offset
+
+    def _clamp(self, raw: int) -> int:
+        return min(max(raw, self.phy_min), self.phy_max)
+
+    def _distance(self, raw: int) -> int:
+        return abs(raw - self._clamp(raw))
+
+    def encode(self, value: Union[str, int, float], signal: 'LinSignal') -> int:
+        raw = self._raw(self._parse(value))
 
         if raw < self.phy_min or raw > self.phy_max:
             raise ValueError(f"value: {raw} out of range ({self.phy_min}, {self.phy_max})")
 
         return raw
 
-    def decode(self, value: int, signal: 'LinSignal', keep_unit: bool = False) -> float:
+    def decode(self, value: int, signal: 'LinSignal', keep_unit: bool = False) -> Union[float, PhysicalQuantity]:
         if value < self.phy_min or value > self.phy_max:
             raise ValueError(f"value: {value} out of range ({self.phy_min}, {self.phy_max})")
 
         decoded = float(value * self.scale + self.offset)
         if keep_unit:
-            return f"{decoded:.03f} {self.unit}"
+            return PhysicalQuantity(decoded, self.unit)
         return decoded
 
 class LogicalValue(ValueConverter):
@@ -103,34 +296,105 @@ class BCDValue(ValueConverter):
     """
     Value converter for Binary Coded Decimal values
     """
+    _decodes_bytes = True
 
     def encode(self, value: int, signal: 'LinSignal') -> List[int]:
-        if value > 10**int(signal.width / 8):
-            raise ValueError(f"cannot convert value {value} to bcd, out of {signal} bounds")
-        bcd = []
-        for i in range(int(signal.width / 8) - 1, -1, -1):
-            bcd.append(value // 10**i % 10)
-        return bcd
-
-    def decode(self, value: List[int], signal: 'LinSignal', keep_unit: bool = False) -> int:
-        out = 0
-        length = int(signal.width / 8)
-        for i in range(length):
-            if value[i] > 9:
-                raise ValueError('bcd digit larger than 9')
-            out += value[i] * 10**(length - i - 1)
-        return out
+        return list(self._encode_digits([value], signal))
+
+    def decode(self, value: Union[List[int], bytes], signal: 'LinSignal', keep_unit: bool = False) -> int:
+        digits = bytes(value[:signal.width // 8]).translate(_BCD_DECODE_TABLE)
+        if not digits:
+            return 0
+        if not digits.isdigit():
+            raise ValueError('bcd digit larger than 9')
+        return int(digits)
+
+    def _encode_digits(self, values: Sequence[int], signal: 'LinSignal') -> bytes:
+        size = signal.width // 8
+        limit = 10**size
+        for value in values:
+            if value < 0 or value >= limit:
+                raise ValueError(f"cannot convert value {value} to bcd, out of {signal} bounds")
+        return b''.join(b'%0*d' % (size, value) for value in values).translate(_BCD_ENCODE_TABLE)
+
+    def encode_many(self, values: Sequence[int], signal: 'LinSignal') -> List[bytes]:
+        """
+        Converts multiple numbers into BCD digits, the numbers are formatted and translated into
+        digits in a single pass
+
+        :returns: The digits of each number
+        :rtype: List[bytes]
+        :raises: ValueError if a number doesn't fit into the signal
+        """
+        return list(_split_records(self._encode_digits(values, signal), signal.width // 8))
+
+    def decode_many(self, values: Union[Sequence[Union[List[int], bytes]], bytes], signal: 'LinSignal',
+                    keep_unit: bool = False) -> List[int]:
+        """
+        Converts multiple BCD values into numbers, the digits of all values are validated and
+        translated in a single pass
+
+        :param values: Raw values of the signal, or a contiguous buffer of them, e.g. `bytes` or
+            a NumPy array of bytes with one row per value
+        :type values: List[bytes] or bytes
+        :returns: The numbers
+        :rtype: List[int]
+        :raises: ValueError if a digit is larger than 9
+        """
+        size = signal.width // 8
+        buffer = _join_records(values, size) if size > 0 else None
+        if buffer is None:
+            return [self.decode(value, signal, keep_unit) for value in values]
+        digits = buffer.translate(_BCD_DECODE_TABLE)
+        if digits and not digits.isdigit():
+            raise ValueError('bcd digit larger than 9')
+        return list(map(int, _split_records(digits, size)))
 
 class ASCIIValue(ValueConverter):
     """
     Value converter for ASCII values
     """
+    _decodes_bytes = True
 
     def encode(self, value: str, signal: 'LinSignal') -> List[int]:
         return list(value.encode())
 
-    def decode(self, value: List[int], signal: 'LinSignal', keep_unit: bool = False) -> str:
-        return bytes(value).decode()
+    def decode(self, value: Union[List[int], bytes], signal: 'LinSignal', keep_unit: bool = False) -> str:
+        if isinstance(value, list):
+            value = bytes(value)
+        return value.decode()
+
+    def encode_many(self, values: Sequence[str], signal: 'LinSignal') -> List[bytes]:
+        """
+        Converts multiple texts into bytes
+
+        :returns: The encoded texts
+        :rtype: List[bytes]
+        """
+        return [value.encode() for value in values]
+
+    def decode_many(self, values: Union[Sequence[Union[List[int], bytes]], bytes], signal: 'LinSignal',
+                    keep_unit: bool = False) -> List[str]:
+        """
+        Converts multiple raw values into texts, contiguous buffers are decoded in a single pass
+        if they only contain ASCII characters
+
+        :param values: Raw values of the signal, or a contiguous buffer of them, e.g. `bytes` or
+            a NumPy array of bytes with one row per value
+        :type values: List[bytes] or bytes
+        :returns: The texts
+        :rtype: List[str]
+        """
+        size = signal.width // 8
+        if size == 0 or not isinstance(values, (bytes, bytearray, memoryview)) and not hasattr(values, 'dtype'):
+            return [value.decode() if isinstance(value, (bytes, bytearray)) else bytes(value).decode()
+                    for value in values]
+        buffer = _join_records(values, size)
+        try:
+            text = buffer.decode('ascii')
+        except UnicodeDecodeError:
+            return [record.decode() for record in _split_records(buffer, size)]
+        return [text[i:i + size] for i in range(0, len(text), size)]
 
 class LinSignalEncodingType():
     """
@@ -155,15 +419,119 @@ class LinSignalEncodingType():
     ```
     """
 
-    def __init__(self, name: str, converters: List[ValueConverter]):
+    def __init__(self, name: str, converters: List[ValueConverter], validation: str = LIN_VALIDATION_STRICT):
         self.name: str = name
         self._converters: List[ValueConverter] = converters
         self._signals: List['LinSignal'] = []
+        self._value_tables: Dict[int, List[Any]] = {}
+        self._unit_tables: Dict[int, List[Any]] = {}
+        self._logical_table: Dict[str, int] = {}
+        self._physical_values: List[PhysicalValue] = [converter for converter in converters
+                                                      if isinstance(converter, PhysicalValue)]
+        # logical values decoded by the unchecked policy, values covered by a preceding physical value
+        # are decoded as physical values
+        self._logical_decoded: Dict[int, Union[str, int]] = {}
+        for (index, converter) in enumerate(converters):
+            if not isinstance(converter, LogicalValue):
+                continue
+            if not any(previous.phy_min <= converter.phy_value <= previous.phy_max
+                       for previous in converters[:index] if isinstance(previous, PhysicalValue)):
+                self._logical_decoded.setdefault(converter.phy_value,
+                                                 converter.info if converter.info is not None else converter.phy_value)
+        self._validation: str = None
+        self.validation = validation
+
+    @property
+    def validation(self) -> str:
+        """
+        Returns the validation policy of the encoding type
+
+        - `'strict'`: values that none of the converters accept raise a `ValueError`
+        - `'clamp'`: numeric values outside the physical ranges are clamped into the nearest
+          physical range, unknown texts still raise a `ValueError`
+        - `'unchecked'`: values that none of the converters accept are converted by the first
+          physical value without range checks
+
+        The encode and decode paths of the policy are selected when it's set, values that are
+        valid are converted the same way by every policy.
+        """
+        return self._validation
+
+    @validation.setter
+    def validation(self, validation: str) -> None:
+        if validation == LIN_VALIDATION_STRICT:
+            (self._encode_policy, self._decode_policy) = (self._encode, self._decode)
+        elif validation == LIN_VALIDATION_CLAMP:
+            (self._encode_policy, self._decode_policy) = (self._encode_clamp, self._decode_clamp)
+        elif validation == LIN_VALIDATION_UNCHECKED:
+            (self._encode_policy, self._decode_policy) = (self._encode_unchecked, self._decode_unchecked)
+        else:
+            raise ValueError(f"{self.name}: unknown validation policy '{validation}'")
+        self._validation = validation
+
+    def build_lookup_table(self, signal: 'LinSignal') -> bool:
+        """
+        Precomputes the decoded value of every raw value the signal can take, afterwards signals
+        of the same width are decoded with a single list index. The raw values of logical value
+        texts are also stored for encoding.
+
+        Tables are shared by the signals of the same width, see `lookup_table_size` for the
+        memory used.
+
+        :param signal: Signal using this encoding type
+        :type signal: LinSignal
+        :returns: True if the table was built, array signals, signals wider than
+            `LIN_LOOKUP_TABLE_MAX_WIDTH` and BCD/ASCII encoding types have no tables
+        :rtype: bool
+        """
+        if signal.is_array() or signal.width > LIN_LOOKUP_TABLE_MAX_WIDTH or \
+                any(converter._decodes_bytes for converter in self._converters):
+            return False
+        if signal.width not in self._value_tables:
+            self._value_tables[signal.width] = self._decode_all(signal, False)
+            self._unit_tables[signal.width] = self._decode_all(signal, True)
+        for converter in self._converters:
+            if isinstance(converter, LogicalValue) and isinstance(converter.info, str):
+                try:
+                    self._logical_table.setdefault(converter.info, self._encode(converter.info, signal))
+                except ValueError:
+                    pass
+        return True
+
+    def _decode_all(self, signal: 'LinSignal', keep_unit: bool) -> List[Any]:
+        table = []
+        for value in range(1 << signal.width):
+            try:
+                table.append(self._decode(value, signal, keep_unit))
+            except ValueError:
+                table.append(_UNDECODABLE)
+        return table
+
+    @property
+    def lookup_table_size(self) -> int:
+        """
+        Returns the approximate memory used by the lookup tables in bytes
+        """
+        if not self._value_tables:
+            return 0
+        size = sys.getsizeof(self._logical_table)
+        values = {}
+        for table in list(self._value_tables.values()) + list(self._unit_tables.values()):
+            size += sys.getsizeof(table)
+            values.update((id(value), value) for value in table if value is not _UNDECODABLE)
+        return size + sum(sys.getsizeof(value) for value in values.values())
 
     def encode(self, value: Union[str, int, float], signal: 'LinSignal') -> int:
         """
         Encodes the given value into the physical value
         """
+        if isinstance(value, str):
+            raw = self._logical_table.get(value)
+            if raw is not None:
+                return raw
+        return self._encode_policy(value, signal)
+
+    def _encode(self, value: Union[str, int, float], signal: 'LinSignal') -> int:
         for encoder in self._converters:
             try:
                 return encoder.encode(value, signal)
@@ -171,17 +539,176 @@ class LinSignalEncodingType():
                 pass
         raise ValueError(f"cannot encode '{value}' as {self.name}")
 
-    def decode(self, value: int, signal: 'LinSignal', keep_unit: bool = False) -> Union[str, int, float]:
+    def decode(self, value: Union[int, bytes], signal: 'LinSignal', keep_unit: bool = False) -> Union[str, int, float]:
         """
         Decodes the given physical value into the signal value
+
+        Array values are passed to BCD and ASCII converters as is, other converters receive the
+        array as a big endian integer
         """
+        table = (self._unit_tables if keep_unit else self._value_tables).get(signal.width)
+        if table is not None and type(value) is int and 0 <= value < len(table):
+            decoded = table[value]
+            if decoded is not _UNDECODABLE:
+                return decoded
+        return self._decode_policy(value, signal, keep_unit)
+
+    def _decode(self, value: Union[int, bytes], signal: 'LinSignal', keep_unit: bool = False) -> Union[str, int, float]:
+        number = value
+        if isinstance(value, (bytes, bytearray, memoryview, list)):
+            number = int.from_bytes(value, "big")
         for decoder in self._converters:
             try:
-                return decoder.decode(value, signal, keep_unit)
+                return decoder.decode(value if decoder._decodes_bytes else number, signal, keep_unit)
+            except ValueError:
+                pass
+        raise ValueError(f"cannot decode {value} as {self.name}")
+
+    def _nearest_physical_value(self, raws: List[int]) -> Tuple[PhysicalValue, int]:
+        """
+        Returns the physical value converter closest to its raw value and the raw value clamped
+        into the converter's range
+        """
+        nearest = None
+        for (physical_value, raw) in zip(self._physical_values, raws):
+            distance = physical_value._distance(raw)
+            if nearest is None or distance < nearest[0]:
+                nearest = (distance, physical_value, raw)
+        return (nearest[1], nearest[1]._clamp(nearest[2]))
+
+    def _encode_clamp(self, value: Union[str, int, float], signal: 'LinSignal') -> int:
+        try:
+            return self._encode(value, signal)
+        except ValueError:
+            if not self._physical_values:
+                raise
+        # raises a ValueError if the value isn't a number
+        raws = [physical_value._raw(physical_value._parse(value)) for physical_value in self._physical_values]
+        return self._nearest_physical_value(raws)[1]
+
+    def _decode_clamp(self, value: Union[int, bytes], signal: 'LinSignal', keep_unit: bool = False) -> Union[str, int, float]:
+        try:
+            return self._decode(value, signal, keep_unit)
+        except ValueError:
+            if not self._physical_values or not isinstance(value, int):
+                raise
+        (physical_value, raw) = self._nearest_physical_value([value] * len(self._physical_values))
+        return physical_value.decode(raw, signal, keep_unit)
+
+    def _encode_unchecked(self, value: Union[str, int, float], signal: 'LinSignal') -> int:
+        try:
+            return self._encode(value, signal)
+        except ValueError:
+            if not self._physical_values:
+                raise
+        physical_value = self._physical_values[0]
+        return physical_value._raw(physical_value._parse(value))
+
+    def _decode_unchecked(self, value: Union[int, bytes], signal: 'LinSignal', keep_unit: bool = False) -> Union[str, int, float]:
+        if not self._physical_values or not isinstance(value, int):
+            return self._decode(value, signal, keep_unit)
+        decoded = self._logical_decoded.get(value, _UNDECODABLE)
+        if decoded is not _UNDECODABLE:
+            return decoded
+        for physical_value in self._physical_values:
+            if physical_value.phy_min <= value <= physical_value.phy_max:
+                break
+        else:
+            physical_value = self._physical_values[0]
+        decoded = float(value * physical_value.scale + physical_value.offset)
+        if keep_unit:
+            return PhysicalQuantity(decoded, physical_value.unit)
+        return decoded
+
+    def decode_fixed_point(self, value: Union[int, bytes], signal: 'LinSignal') -> FixedPointValue:
+        """
+        Decodes the value without converting it into a floating point number
+
+        The converter that would decode the value is looked up the same way as in `decode`, if
+        it's a physical value converter its exact scale is returned along with the raw value.
+
+        :Example:
+
+        ```
+        raw, scale = encoding_type.decode_fixed_point(100, signal)
+        column.append(scale.scale(raw))
+        ```
+
+        :param value: Raw signal value
+        :type value: int
+        :param signal: Signal being decoded
+        :type signal: LinSignal
+        :returns: The raw value and the scale of the physical value converter or `None`
+        :rtype: FixedPointValue
+        :raises: ValueError if none of the converters can decode the value
+        """
+        number = value
+        if isinstance(value, (bytes, bytearray, memoryview, list)):
+            number = int.from_bytes(value, "big")
+        for converter in self._converters:
+            if isinstance(converter, PhysicalValue):
+                if converter.phy_min <= number <= converter.phy_max:
+                    return FixedPointValue(number, converter.fixed_point)
+                continue
+            try:
+                converter.decode(value if converter._decodes_bytes else number, signal)
+                return FixedPointValue(value, None)
             except ValueError:
                 pass
         raise ValueError(f"cannot decode {value} as {self.name}")
 
+    def _batch_converter(self, signal: 'LinSignal') -> Optional[ValueConverter]:
+        """
+        Returns the converter that converts batches of the signal's values on its own, only
+        array signals of encoding types with a single BCD or ASCII converter have one
+        """
+        if signal.is_array() and len(self._converters) == 1 and self._converters[0]._decodes_bytes:
+            return self._converters[0]
+        return None
+
+    def encode_many(self, values: Sequence[Any], signal: 'LinSignal') -> List[Union[int, List[int], bytes]]:
+        """
+        Encodes multiple values of the signal
+
+        Array signals of BCD and ASCII encoding types are converted in a single pass, other
+        values are encoded one by one
+
+        :param values: Signal values
+        :type values: List[Union[str, int, float]]
+        :param signal: Signal being encoded
+        :type signal: LinSignal
+        :returns: Raw values
+        :rtype: List[Union[int, List[int], bytes]]
+        :raises: ValueError if a value cannot be encoded
+        """
+        converter = self._batch_converter(signal)
+        if converter is not None:
+            return converter.encode_many(values, signal)
+        return [self.encode(value, signal) for value in values]
+
+    def decode_many(self, values: Sequence[Union[int, bytes]], signal: 'LinSignal',
+                    keep_unit: bool = False) -> List[Any]:
+        """
+        Decodes multiple raw values of the signal
+
+        Array signals of BCD and ASCII encoding types are converted in a single pass, other
+        values are decoded one by one
+
+        :param values: Raw signal values
+        :type values: List[Union[int, bytes]]
+        :param signal: Signal being decoded
+        :type signal: LinSignal
+        :param keep_unit: If True, physical values are returned along with their units
+        :type keep_unit: bool
+        :returns: Decoded values
+        :rtype: List[Union[str, int, float]]
+        :raises: ValueError if a value cannot be decoded
+        """
+        converter = self._batch_converter(signal)
+        if converter is not None:
+            return converter.decode_many(values, signal, keep_unit)
+        return [self.decode(value, signal, keep_unit) for value in values]
+
     def get_converters(self) -> List[ValueConverter]:
         return self._converters
 
@@ -2,15 +2,22 @@
 LIN Frame utilities
 """
 import warnings
-from typing import Dict, List, Tuple, Union, TYPE_CHECKING
+from typing import (Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union,
+                    TYPE_CHECKING)
 
 import bitstruct
 
+from .checksum import LIN_PID_TABLE
+from .encoding import FixedPointValue, PhysicalValue, LIN_VALIDATION_CLAMP, LIN_VALIDATION_STRICT
+
 if TYPE_CHECKING:
-    from .signal import LinSignal
+    from .signal import LinSignal, LinSignalGroup
     from .encoding import LinSignalEncodingType
     from .schedule import ScheduleTable
 
+LIN_BYTE_ORDER_LITTLE_ENDIAN = 'little'
+LIN_BYTE_ORDER_BIG_ENDIAN = 'big'
+
 class LinFrame():
     # pylint: disable=too-few-public-methods
     """
@@ -46,14 +53,70 @@ class LinUnconditionalFrame(LinFrame):
     :param pad_with_zero: If True, pad with zeros during frame encoding. Otherwise, pad with ones.
         Default: True
     :type pad_with_zero: Boolean
+    :param byte_order: Byte order of signals spanning multiple bytes, `'little'` or `'big'`,
+        set by the `LIN_sig_byte_order_big_endian` header of ISO 17987 LDFs. Default: `'little'`
+    :type byte_order: str
+    :raises: ValueError if the byte order is unknown
     """
 
-    def __init__(self, frame_id: int, name: str, length: int, signals: Dict[int, 'LinSignal'], pad_with_zero: bool = True):
+    def __init__(self, frame_id: int, name: str, length: int, signals: Dict[int, 'LinSignal'],
+                 pad_with_zero: bool = True, byte_order: str = LIN_BYTE_ORDER_LITTLE_ENDIAN):
         super().__init__(frame_id, name)
         self.publisher = None
         self.length = length
+        self.byte_order = byte_order
         self.signal_map = sorted(signals.items(), key=lambda x: x[0])
-        self._packer = LinUnconditionalFrame._frame_pattern(self.name, self.length, self.signal_map, pad_with_zero)
+        # the layout is only validated, signals are packed through the precompiled fields
+        LinUnconditionalFrame._frame_pattern(self.name, self.length, self.signal_map, pad_with_zero)
+        self._fields: Dict[str, '_LinSignalField'] = {
+            signal.name: _create_signal_field(offset, signal, byte_order) for (offset, signal) in self.signal_map
+        }
+        self._projections: Dict[Tuple[str, ...], 'LinFrameProjection'] = {}
+        self._invalid_defaults: Set[str] = set()
+        self._default_payload: int = self._initial_payload(pad_with_zero)
+        self._default_data: bytes = self._default_payload.to_bytes(self.length, "little")
+        # array values are read back from the content as bytes, the same way they're decoded
+        self._default_values: Dict[str, Union[int, List[int], bytes]] = {
+            name: field.extract(self._default_payload)
+            if field.signal.is_array() and name not in self._invalid_defaults else field.signal.init_value
+            for (name, field) in self._fields.items()
+        }
+
+    def _initial_payload(self, pad_with_zero: bool) -> int:
+        """
+        Returns the frame content containing the initial values of all signals as an integer
+        """
+        payload = 0
+        padding = (1 << (self.length * 8)) - 1
+        for field in self._fields.values():
+            try:
+                payload = field.insert(payload, field.signal.init_value)
+            except ValueError:
+                # the signal can only be encoded when a valid value is supplied
+                self._invalid_defaults.add(field.name)
+            padding &= ~(field.mask << field.offset)
+        if not pad_with_zero:
+            payload |= padding
+        return payload
+
+    @property
+    def default_payload(self) -> bytes:
+        """
+        Returns the frame content when every signal has its initial value
+
+        The content is computed once when the frame is created
+        """
+        return self._default_data
+
+    @property
+    def default_values(self) -> Dict[str, Union[int, bytes]]:
+        """
+        Returns the initial raw values of the signals in the frame
+
+        Array signals are returned as `bytes`, like `decode_raw` returns them
+        """
+        return {name: list(value) if isinstance(value, list) else value
+                for (name, value) in self._default_values.items()}
 
     @staticmethod
     def _frame_pattern(
@@ -101,10 +164,8 @@ class LinUnconditionalFrame(LinFrame):
                 frame_offset += padding
             if frame_offset + signal.width > frame_bits:
                 raise ValueError(f"{frame_name}: {signal.name} at bit {offset} spans outside frame!")
-            if signal.is_array():
-                pattern += "u8" * int(signal.width / 8)
-            else:
-                pattern += f"u{signal.width}"
+            # array signals are packed as a single wide field
+            pattern += f"u{signal.width}"
             frame_offset += signal.width
             prev_signal = signal
         if frame_offset < frame_bits:
@@ -114,13 +175,6 @@ class LinUnconditionalFrame(LinFrame):
     def _get_signal(self, name: str):
         return next((signal for _, signal in self.signal_map if signal.name == name), None)
 
-    @staticmethod
-    def _flip_bytearray(data: bytearray) -> bytearray:
-        flipped = bytearray()
-        for i in data:
-            flipped.append(int('{:08b}'.format(i)[::-1], 2))
-        return flipped
-
     def encode(self,
                data: Dict[str, Union[str, int, float]],
                encoding_types: Dict[str, 'LinSignalEncodingType'] = None) -> bytearray:
@@ -144,55 +198,10 @@ class LinUnconditionalFrame(LinFrame):
                  as is (float and string values)
         """
         converted = {}
-
-        def default_encoder(_value, _signal):
-            if isinstance(_value, (int, list)):
-                return _value
-
-            raise ValueError(f'No encoding type found for {_signal} ({value})')
-
         for (signal_name, value) in data.items():
-            signal = self._get_signal(signal_name)
-            encoder = default_encoder
-            if encoding_types is not None and signal_name in encoding_types:
-                encoder = encoding_types[signal_name].encode
-            elif signal.encoding_type is not None:
-                encoder = signal.encoding_type.encode
-
-            if signal.is_array():
-                if not isinstance(value, list):
-                    num_of_bytes = int(signal.width / 8)
-                    value = [b for b in int.to_bytes(encoder(value, signal), num_of_bytes, "big")]
-                converted[signal_name] = value
-            else:
-                converted[signal_name] = encoder(value, signal)
-
+            converted[signal_name] = self._fields[signal_name].encode(value, encoding_types)
         return self.encode_raw(converted)
 
-    def _signal_map_to_message(self, signals: Dict[str, int]) -> List[int]:
-        message = []
-        for (_, signal) in self.signal_map:
-            if signal.name in signals.keys():
-                if signal.is_array():
-                    message += signals.get(signal.name)
-                else:
-                    message.append(signals.get(signal.name))
-            else:
-                if signal.is_array():
-                    message += signal.init_value
-                else:
-                    message.append(signal.init_value)
-        return message
-
-    def _signal_list_to_message(self, signals: List[Union[int, List[int]]]) -> List[int]:
-        message = []
-        for signal in signals:
-            if isinstance(signal, int):
-                message.append(signal)
-            elif isinstance(signal, List[int]):
-                message += signal
-        return message
-
     def encode_raw(self, data: Union[Dict[str, int], List[int]]) -> bytearray:
         """
         Encodes signal values into the LIN frame content
@@ -212,17 +221,121 @@ class LinUnconditionalFrame(LinFrame):
         :rtype: bytearray
         """
         if isinstance(data, List):
-            message = self._signal_list_to_message(data)
-        elif isinstance(data, Dict):
-            message = self._signal_map_to_message(data)
+            if len(data) != len(self.signal_map):
+                raise ValueError(f"{self.name}: expected {len(self.signal_map)} values, got {len(data)}")
+            values = {}
+            for ((_, signal), value) in zip(self.signal_map, data):
+                if signal.is_array() and isinstance(value, int):
+                    # array values are packed as little endian integers, the first element
+                    # being the lowest addressed byte
+                    value = value.to_bytes(signal.width // 8, "little")
+                values[signal.name] = value
+            return self._encode_fields(values)
+        if isinstance(data, Dict):
+            return self._encode_fields(data)
+        raise TypeError(f"Cannot encode {data} as a frame!")
+
+    def _encode_fields(self, data: Dict[str, Union[int, List[int]]]) -> bytearray:
+        """
+        Encodes the given raw values on top of the default frame content
+        """
+        self._check_defaults(data.keys())
+        payload = self._default_payload
+        for (signal_name, value) in data.items():
+            field = self._fields.get(signal_name)
+            if field is not None:
+                payload = field.insert(payload, value)
+        return bytearray(payload.to_bytes(self.length, "little"))
+
+    def encode_many(self,
+                    rows: Union[Iterable[Dict[str, Any]], Mapping[str, Sequence[Any]]],
+                    encoding_types: Dict[str, 'LinSignalEncodingType'] = None,
+                    contiguous: bool = False) -> Union[List[bytearray], bytes]:
+        """
+        Encodes signal values into multiple frames
+
+        Encoding types are resolved once for every signal instead of once per frame. Rows can be
+        given as a list of dictionaries, the same way as `encode`, or as a mapping of signal
+        names to columns of values. NumPy arrays in a column mapping are converted in a single
+        vectorized operation if the signal's encoding type consists of one physical value.
+
+        Example:
+        >>> frame.encode_many({'MotorSpeed': [0, 500, 1000], 'MotorDirection': ['CW', 'CW', 'CCW']})
+        [bytearray(b'\x00\x00'), bytearray(b'\x32\x00'), bytearray(b'\x64\x01')]
+
+        :param rows: Signal values of each frame, signals that are not supplied will default to
+            their initial values
+        :type rows: List[Dict[str, Union[str, int, float]]] or Dict[str, List[Union[str, int, float]]]
+        :param encoding_types: Mapping of signal names to encoding types
+        :type encoding_types: Dict[str, LinSignalEncodingType]
+        :param contiguous: If True, the frames are returned as a single buffer of
+            `len(rows) * length` bytes, otherwise as a list of frame contents
+        :type contiguous: bool
+        :returns: Frame contents
+        :rtype: List[bytearray] or bytes
+        :raises: LookupError if a signal is not part of the frame, ValueError if a value cannot
+            be encoded or the columns have different lengths
+        """
+        if isinstance(rows, Mapping):
+            payloads = self._encode_columns(rows, encoding_types)
         else:
-            raise TypeError(f"Cannot encode {data} as a frame!")
-        return LinUnconditionalFrame._flip_bytearray(self._packer.pack(*message))
+            payloads = self._encode_rows(rows, encoding_types)
+        length = self.length
+        if contiguous:
+            return b''.join(payload.to_bytes(length, "little") for payload in payloads)
+        return [bytearray(payload.to_bytes(length, "little")) for payload in payloads]
+
+    def _check_defaults(self, names: Iterable[str]) -> None:
+        if self._invalid_defaults and not self._invalid_defaults.issubset(names):
+            missing = ', '.join(sorted(self._invalid_defaults.difference(names)))
+            raise ValueError(f"{self.name}: initial value of {missing} cannot be encoded")
+
+    def _field_encoder(self, name: str, encoding_types: Dict[str, 'LinSignalEncodingType']) -> Tuple['_LinSignalField', Callable]:
+        field = self._fields.get(name)
+        if field is None:
+            raise LookupError(f"No signal named '{name}' found in {self.name}!")
+        return (field, field.encoder(encoding_types))
+
+    def _encode_rows(self, rows: Iterable[Dict[str, Any]],
+                     encoding_types: Dict[str, 'LinSignalEncodingType']) -> List[int]:
+        encoders: Dict[str, Tuple[_LinSignalField, Callable]] = {}
+        default = self._default_payload
+        payloads = []
+        for row in rows:
+            self._check_defaults(row.keys())
+            payload = default
+            for (name, value) in row.items():
+                encoder = encoders.get(name)
+                if encoder is None:
+                    encoder = self._field_encoder(name, encoding_types)
+                    encoders[name] = encoder
+                payload = encoder[0].insert(payload, encoder[1](value))
+            payloads.append(payload)
+        return payloads
+
+    def _encode_columns(self, columns: Mapping[str, Sequence[Any]],
+                        encoding_types: Dict[str, 'LinSignalEncodingType']) -> List[int]:
+        self._check_defaults(columns.keys())
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"{self.name}: columns have different lengths {sorted(lengths)}")
+        count = lengths.pop() if lengths else 0
+        payloads = [self._default_payload] * count
+        for (name, column) in columns.items():
+            (field, encoder) = self._field_encoder(name, encoding_types)
+            raws = field.encode_column(column, encoding_types)
+            if raws is None:
+                raws = [encoder(value) for value in column]
+            insert = field.insert
+            payloads = [insert(payload, raw) for (payload, raw) in zip(payloads, raws)]
+        return payloads
 
     def decode(self,
                data: bytearray,
                encoding_types: Dict[str, 'LinSignalEncodingType'] = None,
-               keep_unit: bool = False) -> Dict[str, Union[str, int, float]]:
+               keep_unit: bool = False,
+               signals: List[str] = None,
+               fixed_point: bool = False) -> Dict[str, Union[str, int, float, FixedPointValue]]:
         """
         Decodes a LIN frame into the signals that it contains
 
@@ -230,34 +343,81 @@ class LinUnconditionalFrame(LinFrame):
             data = 0xFC 0x38
             frame_layout = u6p2u8u1u1p6
 
+        When `signals` is given only those signals are extracted and converted, see `projection`
+
+        :param signals: Names of the signals to decode, by default all signals are decoded
+        :type signals: List[str]
+        :param fixed_point: If True, signals are decoded into `FixedPointValue` objects holding
+            the raw value and the exact scale of the physical value instead of floats, see
+            `LinSignalEncodingType.decode_fixed_point`
+        :type fixed_point: bool
         """
-        def default_decoder(_value, *args):
-            return _value
+        if signals is not None:
+            return self.projection(signals).decode(data, encoding_types, keep_unit, fixed_point)
 
         parsed = self.decode_raw(data)
+        if fixed_point:
+            return {signal_name: self._fields[signal_name].decode_fixed_point(value, encoding_types)
+                    for (signal_name, value) in parsed.items()}
         converted = {}
         for (signal_name, value) in parsed.items():
-            signal = self._get_signal(signal_name)
-            decoder = default_decoder
-            if encoding_types is not None and signal_name in encoding_types:
-                decoder = encoding_types[signal_name].decode
-            elif signal.encoding_type is not None:
-                decoder = signal.encoding_type.decode
-
-            if signal.is_array():
-                if decoder is not default_decoder:
-                    value = int.from_bytes(value, "big")
-                converted[signal_name] = decoder(value, signal, keep_unit)
-            else:
-                converted[signal_name] = decoder(value, signal, keep_unit)
-
+            converted[signal_name] = self._fields[signal_name].decode(value, encoding_types, keep_unit)
         return converted
 
+    def decode_many(self,
+                    payloads: Union[Iterable[bytearray], bytes],
+                    encoding_types: Dict[str, 'LinSignalEncodingType'] = None,
+                    keep_unit: bool = False,
+                    columns: bool = False) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
+        """
+        Decodes multiple LIN frames
+
+        Signals are decoded column by column, encoding types are resolved once for every signal
+        and BCD and ASCII arrays are converted in a single pass, see
+        `LinSignalEncodingType.decode_many`.
+
+        Example:
+        >>> frame.decode_many([bytearray(b'\x00\x00'), bytearray(b'\x32\x00')], columns=True)
+        {'MotorSpeed': [0, 500], 'MotorDirection': ['CW', 'CW']}
+
+        :param payloads: Frame contents, or a single buffer of frame contents, e.g. the output of
+            `encode_many(..., contiguous=True)`
+        :type payloads: List[bytearray] or bytes
+        :param encoding_types: Mapping of signal names to encoding types
+        :type encoding_types: Dict[str, LinSignalEncodingType]
+        :param keep_unit: If True, physical values are returned along with their units
+        :type keep_unit: bool
+        :param columns: If True, a mapping of signal names to columns of values is returned,
+            otherwise a list of mappings, one per frame
+        :type columns: bool
+        :returns: Decoded signal values
+        :rtype: List[Dict[str, Union[str, int, float]]] or Dict[str, List[Union[str, int, float]]]
+        :raises: ValueError if a value cannot be decoded or the buffer's size isn't a multiple of
+            the frame length
+        """
+        length = self.length
+        if isinstance(payloads, (bytes, bytearray, memoryview)):
+            if len(payloads) % length != 0:
+                raise ValueError(f"{self.name}: buffer of {len(payloads)} bytes doesn't contain {length} byte frames")
+            payloads = [payloads[i:i + length] for i in range(0, len(payloads), length)]
+        payloads = [int.from_bytes(data, "little") for data in payloads]
+        decoded = {}
+        for field in self._fields.values():
+            extract = field.extract
+            decoded[field.name] = field.decode_column([extract(payload) for payload in payloads],
+                                                      encoding_types, keep_unit)
+        if columns:
+            return decoded
+        names = list(decoded.keys())
+        return [dict(zip(names, values)) for values in zip(*decoded.values())] if names else [{} for _ in payloads]
+
     def decode_raw(self,
-                   data: bytearray) -> Dict[str, int]:
+                   data: bytearray) -> Dict[str, Union[int, bytes]]:
         """
         Decodes a LIN frame into the signals that it contains
 
+        Array signals are returned as `bytes`
+
         Example:
             data = 0xFC 0x30 0xFF,
             frame_layout = u6p2u1u1p6u8
@@ -272,22 +432,36 @@ class LinUnconditionalFrame(LinFrame):
         :param data: LinFrame content as a bytearray
         :type data: bytearray
         :returns: mapping of signal names to signal values
-        :rtype: Dict[str, int]
+        :rtype: Dict[str, Union[int, bytes]]
+        :raises: ValueError if the data is shorter than the frame
+        """
+        if len(data) < self.length:
+            raise ValueError(f"{self.name}: expected {self.length} bytes, got {len(data)}")
+        payload = int.from_bytes(data[:self.length], "little")
+        return {name: field.extract(payload) for (name, field) in self._fields.items()}
+
+    def projection(self, signals: List[str]) -> 'LinFrameProjection':
+        """
+        Returns a projection that decodes only the given signals of this frame
+
+        Projections are cached, requesting the same list of signals again returns the same object
+
+        Example:
+        >>> frame.projection(['MotorRPM', 'Fault']).decode(bytearray([0x10, 0x00]))
+        {'MotorRPM': 16, 'Fault': 0}
+
+        :param signals: Names of the signals to decode
+        :type signals: List[str]
+        :returns: Frame projection
+        :rtype: LinFrameProjection
+        :raises: LookupError if a signal is not part of the frame
         """
-        unpacked = self._packer.unpack(LinUnconditionalFrame._flip_bytearray(data))
-        message = {}
-        signal_index = 0
-        index = 0
-        while index < len(unpacked):
-            if self.signal_map[signal_index][1].is_array():
-                array_size = int(self.signal_map[signal_index][1].width / 8)
-                message[self.signal_map[signal_index][1].name] = list(unpacked[index:index + array_size])
-                index += array_size - 1
-            else:
-                message[self.signal_map[signal_index][1].name] = unpacked[index]
-            signal_index += 1
-            index += 1
-        return message
+        key = tuple(signals)
+        projection = self._projections.get(key)
+        if projection is None:
+            projection = LinFrameProjection(self, key)
+            self._projections[key] = projection
+        return projection
 
     # These methods are kept for compatibility with versions before 0.11.0
 
@@ -354,11 +528,432 @@ class LinUnconditionalFrame(LinFrame):
             output[signal_name] = converters[signal_name].decode(value, self._get_signal(signal_name))
         return output
 
+class _LinSignalField():
+    """
+    Precomputed location of a signal inside the frame content
+
+    The frame content is treated as a little endian integer, bit `offset` of that integer
+    is the first bit of the signal
+    """
+    __slots__ = ('name', 'offset', 'width', 'mask', 'signal')
+
+    def __init__(self, offset: int, signal: 'LinSignal') -> None:
+        self.name = signal.name
+        self.offset = offset
+        self.width = signal.width
+        self.mask = (1 << signal.width) - 1
+        self.signal = signal
+
+    def extract(self, payload: int) -> Union[int, bytes]:
+        """
+        Returns the raw value of the signal from the frame content, array signals are returned
+        as `bytes`
+        """
+        if self.signal.is_array():
+            return ((payload >> self.offset) & self.mask).to_bytes(self.width // 8, "little")
+        return (payload >> self.offset) & self.mask
+
+    def insert(self, payload: int, value: Union[int, List[int], bytes]) -> int:
+        """
+        Returns the frame content with the signal's bits replaced by the given raw value
+
+        :raises: ValueError if the value doesn't fit into the signal
+        """
+        if self.signal.is_array():
+            if isinstance(value, int) or len(value) != self.width // 8:
+                raise ValueError(f"{self.name}: expected {self.width // 8} bytes, got {value}")
+            raw = int.from_bytes(value, "little")
+        else:
+            raw = value
+        if raw < 0 or raw > self.mask:
+            raise ValueError(f"{self.name}: value {value} doesn't fit into {self.width} bits")
+        return (payload & ~(self.mask << self.offset)) | (raw << self.offset)
+
+    def encoding_type(self, encoding_types: Dict[str, 'LinSignalEncodingType'] = None) -> 'LinSignalEncodingType':
+        """
+        Returns the encoding type to use for the signal, custom encoding types take precedence
+        """
+        if encoding_types is not None and self.name in encoding_types:
+            return encoding_types[self.name]
+        return self.signal.encoding_type
+
+    def encode(self, value: Union[str, int, float, List[int], bytes],
+               encoding_types: Dict[str, 'LinSignalEncodingType'] = None) -> Union[int, List[int], bytes]:
+        """
+        Converts the value into the raw value of the signal
+
+        :raises: ValueError if the value cannot be encoded
+        """
+        encoding_type = self.encoding_type(encoding_types)
+        if self.signal.is_array() and isinstance(value, (list, bytes, bytearray)):
+            return value
+        if encoding_type is not None:
+            raw = encoding_type.encode(value, self.signal)
+            if self.signal.is_array() and isinstance(raw, int):
+                return raw.to_bytes(self.width // 8, "big")
+            return raw
+        if isinstance(value, int):
+            if self.signal.is_array():
+                return value.to_bytes(self.width // 8, "big")
+            return value
+        raise ValueError(f'No encoding type found for {self.signal} ({value})')
+
+    def encoder(self, encoding_types: Dict[str, 'LinSignalEncodingType'] = None) -> Callable[[Any], Union[int, List[int], bytes]]:
+        """
+        Returns a function that converts values into raw values the same way as `encode`, the
+        encoding type is only resolved once
+        """
+        encoding_type = self.encoding_type(encoding_types)
+        if self.signal.is_array() or encoding_type is None:
+            return lambda value: self.encode(value, encoding_types)
+        encode = encoding_type.encode
+        signal = self.signal
+        return lambda value: encode(value, signal)
+
+    def encode_column(self, column: Sequence[Any],
+                      encoding_types: Dict[str, 'LinSignalEncodingType'] = None) -> Optional[List[Union[int, bytes]]]:
+        """
+        Converts a column of values into raw values in a single operation
+
+        Supported are NumPy arrays of scalar signals whose encoding type consists of a single
+        physical value, and array signals of BCD and ASCII encoding types
+
+        :returns: The raw values or `None` if the column has to be converted value by value
+        :raises: ValueError if a value is out of range and the encoding type validates strictly
+        """
+        encoding_type = self.encoding_type(encoding_types)
+        if encoding_type is None:
+            return None
+        if self.signal.is_array():
+            if encoding_type._batch_converter(self.signal) is None or \
+                    any(isinstance(value, (list, bytes, bytearray)) for value in column):
+                return None
+            return encoding_type.encode_many(column, self.signal)
+        if not hasattr(column, 'dtype'):
+            return None
+        converters = encoding_type.get_converters()
+        if len(converters) != 1 or not isinstance(converters[0], PhysicalValue) or \
+                converters[0].scale == 0 or column.dtype.kind not in 'iuf':
+            return None
+        converter = converters[0]
+        raws = ((column - converter.offset) / converter.scale).round()
+        if encoding_type.validation == LIN_VALIDATION_CLAMP:
+            raws = raws.clip(converter.phy_min, converter.phy_max)
+        elif encoding_type.validation == LIN_VALIDATION_STRICT and len(raws) > 0 and \
+                (raws.min() < converter.phy_min or raws.max() > converter.phy_max):
+            raise ValueError(f"{self.name}: values out of range ({converter.phy_min}, {converter.phy_max})")
+        return [int(raw) for raw in raws.tolist()]
+
+    def decode(self, value: Union[int, bytes],
+               encoding_types: Dict[str, 'LinSignalEncodingType'] = None,
+               keep_unit: bool = False) -> Union[str, int, float, bytes]:
+        """
+        Converts the raw value of the signal using its encoding type
+        """
+        encoding_type = self.encoding_type(encoding_types)
+        if encoding_type is None:
+            return value
+        return encoding_type.decode(value, self.signal, keep_unit)
+
+    def decode_column(self, raws: List[Union[int, bytes]],
+                      encoding_types: Dict[str, 'LinSignalEncodingType'] = None,
+                      keep_unit: bool = False) -> List[Union[str, int, float, bytes]]:
+        """
+        Converts multiple raw values of the signal using its encoding type
+        """
+        encoding_type = self.encoding_type(encoding_types)
+        if encoding_type is None:
+            return raws
+        return encoding_type.decode_many(raws, self.signal, keep_unit)
+
+    def decode_fixed_point(self, value: Union[int, bytes],
+                           encoding_types: Dict[str, 'LinSignalEncodingType'] = None) -> FixedPointValue:
+        """
+        Returns the raw value of the signal along with the scale of its physical value
+        """
+        encoding_type = self.encoding_type(encoding_types)
+        if encoding_type is None:
+            return FixedPointValue(value, None)
+        return encoding_type.decode_fixed_point(value, self.signal)
+
+class _LinBigEndianSignalField(_LinSignalField):
+    """
+    Precomputed location of a big endian signal inside the frame content
+
+    The signal occupies the same bits as a little endian signal at the same offset, but the
+    segment in the lowest addressed byte holds the most significant bits of the value
+    """
+    __slots__ = ('segments',)
+
+    def __init__(self, offset: int, signal: 'LinSignal') -> None:
+        super().__init__(offset, signal)
+        # (bit position in the frame, segment mask, bit position in the value) of each byte
+        self.segments: Tuple[Tuple[int, int, int], ...] = ()
+        end = offset + signal.width
+        position = offset
+        value_shift = signal.width
+        while position < end:
+            length = min(end, (position // 8 + 1) * 8) - position
+            value_shift -= length
+            self.segments += ((position, (1 << length) - 1, value_shift), )
+            position += length
+
+    def extract(self, payload: int) -> int:
+        value = 0
+        for (position, mask, value_shift) in self.segments:
+            value |= ((payload >> position) & mask) << value_shift
+        return value
+
+    def insert(self, payload: int, value: int) -> int:
+        if value < 0 or value > self.mask:
+            raise ValueError(f"{self.name}: value {value} doesn't fit into {self.width} bits")
+        payload &= ~(self.mask << self.offset)
+        for (position, mask, value_shift) in self.segments:
+            payload |= ((value >> value_shift) & mask) << position
+        return payload
+
+def _create_signal_field(offset: int, signal: 'LinSignal', byte_order: str) -> _LinSignalField:
+    """
+    Returns the field matching the byte order, only scalar signals spanning multiple bytes are
+    affected by the byte order
+    """
+    if byte_order == LIN_BYTE_ORDER_LITTLE_ENDIAN:
+        return _LinSignalField(offset, signal)
+    if byte_order != LIN_BYTE_ORDER_BIG_ENDIAN:
+        raise ValueError(f"{signal.name}: unknown byte order '{byte_order}'")
+    if signal.is_array() or offset // 8 == (offset + signal.width - 1) // 8:
+        return _LinSignalField(offset, signal)
+    return _LinBigEndianSignalField(offset, signal)
+
+class LinFrameProjection():
+    """
+    LinFrameProjection decodes a fixed subset of the signals in a frame
+
+    The bit offsets of the selected signals are resolved once, decoding cost depends only on the
+    number of projected signals
+
+    :param frame: Frame that contains the signals
+    :type frame: LinUnconditionalFrame
+    :param signals: Names of the signals to decode
+    :type signals: Iterable[str]
+    :raises: LookupError if a signal is not part of the frame
+    """
+
+    def __init__(self, frame: LinUnconditionalFrame, signals: Iterable[str]) -> None:
+        self.frame = frame
+        self._fields: List[_LinSignalField] = []
+        for name in signals:
+            field = frame._fields.get(name)
+            if field is None:
+                raise LookupError(f"No signal named '{name}' found in {frame.name}!")
+            self._fields.append(field)
+
+    @property
+    def signals(self) -> List['LinSignal']:
+        """Returns the projected signals"""
+        return [field.signal for field in self._fields]
+
+    def decode_raw(self, data: bytearray) -> Dict[str, Union[int, List[int]]]:
+        """
+        Decodes the projected signals into their raw values
+
+        :param data: LinFrame content
+        :type data: bytearray
+        :returns: mapping of signal names to signal values
+        :rtype: Dict[str, int]
+        """
+        payload = int.from_bytes(data, "little")
+        return {field.name: field.extract(payload) for field in self._fields}
+
+    def decode(self,
+               data: bytearray,
+               encoding_types: Dict[str, 'LinSignalEncodingType'] = None,
+               keep_unit: bool = False,
+               fixed_point: bool = False) -> Dict[str, Union[str, int, float, FixedPointValue]]:
+        """
+        Decodes the projected signals through their encoding types
+
+        :param data: LinFrame content
+        :type data: bytearray
+        :param encoding_types: Mapping of signal names to encoding types, by default the encoding
+            type assigned to the signal is used
+        :type encoding_types: Dict[str, LinSignalEncodingType]
+        :param keep_unit: Whether physical values should keep their units
+        :type keep_unit: bool
+        :param fixed_point: If True, signals are decoded into `FixedPointValue` objects, see
+            `LinUnconditionalFrame.decode`
+        :type fixed_point: bool
+        :returns: mapping of signal names to signal values
+        :rtype: Dict[str, Union[str, int, float]]
+        """
+        payload = int.from_bytes(data, "little")
+        if fixed_point:
+            return {field.name: field.decode_fixed_point(field.extract(payload), encoding_types)
+                    for field in self._fields}
+        return {field.name: field.decode(field.extract(payload), encoding_types, keep_unit)
+                for field in self._fields}
+
+class FrameState():
+    """
+    FrameState holds the current content of a frame and updates it one signal at a time
+
+    Setting a signal only rewrites the bits of that signal, the rest of the frame content is kept
+    as is. Every change marks the state as dirty, publishers can use this to determine whether the
+    frame has to be sent again.
+
+    :Example:
+
+    ```
+    state = FrameState(ldf.get_unconditional_frame('LSM_Frm1'))
+    state.set('LeftIntLightsSwitch', 'Off')
+    if state.dirty:
+        send(state.payload)
+        state.clean()
+    ```
+
+    :param frame: Frame to hold the state of
+    :type frame: LinUnconditionalFrame
+    :param encoding_types: Mapping of signal names to encoding types, by default the encoding
+        type assigned to the signal is used
+    :type encoding_types: Dict[str, LinSignalEncodingType]
+    """
+
+    def __init__(self, frame: LinUnconditionalFrame,
+                 encoding_types: Dict[str, 'LinSignalEncodingType'] = None) -> None:
+        self.frame = frame
+        self.encoding_types = encoding_types
+        self.dirty_signals: Set[str] = set()
+        self._payload: int = frame._default_payload
+        self._data: bytearray = None
+        self._group_offsets: Dict[str, int] = {}
+
+    @property
+    def dirty(self) -> bool:
+        """Returns whether any signal has changed since the state was last cleaned"""
+        return len(self.dirty_signals) > 0
+
+    @property
+    def payload(self) -> bytearray:
+        """
+        Returns the current frame content
+
+        The content is only packed again after a signal has changed
+        """
+        if self._data is None:
+            self._data = bytearray(self._payload.to_bytes(self.frame.length, "little"))
+        return self._data
+
+    def clean(self) -> None:
+        """Clears the dirty flags"""
+        self.dirty_signals.clear()
+
+    def _field(self, name: str) -> _LinSignalField:
+        field = self.frame._fields.get(name)
+        if field is None:
+            raise LookupError(f"No signal named '{name}' found in {self.frame.name}!")
+        return field
+
+    def set_raw(self, name: str, value: Union[int, List[int], bytes]) -> None:
+        """
+        Sets the raw value of a signal
+
+        :param name: Name of the signal
+        :type name: str
+        :param value: Raw signal value
+        :type value: int or bytes or List[int] in case of array signals
+        :raises: LookupError if the signal is not part of the frame, ValueError if the value
+            doesn't fit into the signal
+        """
+        field = self._field(name)
+        payload = field.insert(self._payload, value)
+        if payload != self._payload:
+            self._payload = payload
+            self._data = None
+            self.dirty_signals.add(name)
+
+    def set(self, name: str, value: Union[str, int, float, List[int]]) -> None:
+        """
+        Sets the value of a signal, the value is converted using the signal's encoding type
+
+        :param name: Name of the signal
+        :type name: str
+        :param value: Signal value, string for logical values and integer or float for physical
+            values
+        :type value: str or int or float
+        :raises: LookupError if the signal is not part of the frame, ValueError if the value
+            cannot be encoded
+        """
+        self.set_raw(name, self._field(name).encode(value, self.encoding_types))
+
+    def set_group_raw(self, group: 'LinSignalGroup', data: Dict[str, Union[int, List[int]]]) -> None:
+        """
+        Sets the raw values of a signal group's members in a single update
+
+        Members that are not supplied keep their current values
+
+        :param group: Signal group contained by the frame
+        :type group: LinSignalGroup
+        :param data: Mapping of signal names to raw values
+        :type data: Dict[str, int]
+        :raises: LookupError if the frame doesn't contain the group, ValueError if a value doesn't
+            fit into its signal
+        """
+        offset = self._group_offsets.get(group.name)
+        if offset is None:
+            offset = group.get_frame_offset(self.frame)
+            self._group_offsets[group.name] = offset
+        image = group._pack(data, (self._payload >> offset) & group._mask)
+        payload = (self._payload & ~(group._mask << offset)) | (image << offset)
+        if payload != self._payload:
+            for name in data:
+                field = self.frame._fields[name]
+                if field.extract(payload) != field.extract(self._payload):
+                    self.dirty_signals.add(name)
+            self._payload = payload
+            self._data = None
+
+    def set_group(self, group: 'LinSignalGroup', data: Dict[str, Union[str, int, float, List[int]]]) -> None:
+        """
+        Sets the values of a signal group's members in a single update, the values are converted
+        using the signals' encoding types
+
+        :param group: Signal group contained by the frame
+        :type group: LinSignalGroup
+        :param data: Mapping of signal names to values
+        :type data: Dict[str, Union[str, int, float]]
+        :raises: LookupError if the frame doesn't contain the group, ValueError if a value cannot
+            be encoded
+        """
+        self.set_group_raw(group, group._convert(data, self.encoding_types))
+
+    def update(self, data: Dict[str, Union[str, int, float, List[int]]]) -> None:
+        """
+        Sets the values of multiple signals
+
+        :param data: Mapping of signal names to values
+        :type data: Dict[str, Union[str, int, float]]
+        """
+        for (name, value) in data.items():
+            self.set(name, value)
+
+    def get_raw(self, name: str) -> Union[int, bytes]:
+        """
+        Returns the current raw value of a signal, array signals are returned as `bytes`
+
+        :param name: Name of the signal
+        :type name: str
+        :raises: LookupError if the signal is not part of the frame
+        """
+        return self._field(name).extract(self._payload)
+
 class LinEventTriggeredFrame(LinFrame):
-    # pylint: disable=too-few-public-methods
     """
     LinEventTriggeredFrame is LinFrame in the schedule table that can contain different
     unconditional frames from different nodes
+
+    The first byte of the frame content is the protected identifier of the unconditional frame
+    that was sent, the associated frames are indexed by their protected identifiers when the
+    event triggered frame is created.
     """
 
     def __init__(self, frame_id: int, name: str, frames: List[LinUnconditionalFrame],
@@ -366,6 +961,71 @@ class LinEventTriggeredFrame(LinFrame):
         super().__init__(frame_id, name)
         self.frames = frames
         self.collision_resolving_schedule_table = collision_resolving_schedule_table
+        self._associated_frames: Dict[int, Tuple[LinUnconditionalFrame, LinFrameProjection]] = {
+            LIN_PID_TABLE[frame.frame_id]: (frame, frame.projection([signal.name for (_, signal) in frame.signal_map]))
+            for frame in frames if 0 <= frame.frame_id < len(LIN_PID_TABLE)
+        }
+
+    def _associated(self, data: bytearray) -> Tuple[LinUnconditionalFrame, LinFrameProjection]:
+        associated = self._associated_frames.get(data[0]) if len(data) > 0 else None
+        if associated is None:
+            pid = f"0x{data[0]:02x}" if len(data) > 0 else "none"
+            raise LookupError(f"{self.name}: no associated frame with protected id {pid} found!")
+        return associated
+
+    def get_associated_frame(self, data: bytearray) -> LinUnconditionalFrame:
+        """
+        Returns the unconditional frame carried by the event triggered frame
+
+        The publisher of the returned frame is the node that responded
+
+        :param data: LinFrame content
+        :type data: bytearray
+        :returns: Unconditional frame
+        :rtype: LinUnconditionalFrame
+        :raises: LookupError if the first byte isn't the protected identifier of an associated frame
+        """
+        return self._associated(data)[0]
+
+    def decode(self,
+               data: bytearray,
+               encoding_types: Dict[str, 'LinSignalEncodingType'] = None,
+               keep_unit: bool = False) -> Tuple[LinUnconditionalFrame, Dict[str, Union[str, int, float]]]:
+        """
+        Decodes an event triggered frame using the associated frame that it carries
+
+        Example:
+        >>> (frame, values) = event_frame.decode(bytearray([0x42, 0x00]))
+        >>> frame.publisher.name
+        'LSM'
+
+        :param data: LinFrame content
+        :type data: bytearray
+        :param encoding_types: Mapping of signal names to encoding types, by default the encoding
+            type assigned to the signal is used
+        :type encoding_types: Dict[str, LinSignalEncodingType]
+        :param keep_unit: Whether physical values should keep their units
+        :type keep_unit: bool
+        :returns: The associated frame and the mapping of signal names to signal values
+        :rtype: Tuple[LinUnconditionalFrame, Dict[str, Union[str, int, float]]]
+        :raises: LookupError if the first byte isn't the protected identifier of an associated frame
+        """
+        (frame, codec) = self._associated(data)
+        return (frame, codec.decode(data, encoding_types, keep_unit))
+
+    def decode_raw(self, data: bytearray) -> Tuple[LinUnconditionalFrame, Dict[str, int]]:
+        """
+        Decodes an event triggered frame into raw signal values using the associated frame that
+        it carries
+
+        :param data: LinFrame content
+        :type data: bytearray
+        :returns: The associated frame and the mapping of signal names to raw signal values
+        :rtype: Tuple[LinUnconditionalFrame, Dict[str, int]]
+        :raises: LookupError if the first byte isn't the protected identifier of an associated frame
+        """
+        (frame, codec) = self._associated(data)
+        return (frame, codec.decode_raw(data))
 
 class LinSporadicFrame():
     # pylint: disable=too-few-public-methods
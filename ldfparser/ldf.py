@@ -4,12 +4,13 @@ Lin Description File handler objects
 from typing import Union, Dict, List
 
 from .lin import LinVersion, Iso17987Version, J2602Version
-from .frame import LinFrame, LinSporadicFrame, LinUnconditionalFrame, LinEventTriggeredFrame
+from .frame import LIN_BYTE_ORDER_LITTLE_ENDIAN, LinFrame, LinSporadicFrame, LinUnconditionalFrame, LinEventTriggeredFrame
 from .diagnostics import LinDiagnosticFrame, LinDiagnosticRequest, LinDiagnosticResponse
-from .signal import LinSignal
-from .encoding import LinSignalEncodingType
+from .signal import LinSignal, LinSignalGroup
+from .encoding import LIN_VALIDATION_STRICT, LinSignalEncodingType
 from .node import LinMaster, LinSlave
-from .schedule import ScheduleTable
+from .schedule import ScheduleTable, ScheduleTimeline
+from .bus import LinBusDecoder
 
 class LDF():
     # pylint: disable=too-many-instance-attributes,too-many-public-methods
@@ -28,10 +29,13 @@ class LDF():
         self._language_version: Union[LinVersion, Iso17987Version, J2602Version] = None
         self._baudrate: int = None
         self._channel: str = None
+        self._byte_order: str = LIN_BYTE_ORDER_LITTLE_ENDIAN
         self._master: LinMaster = None
         self._slaves: Dict[str, LinSlave] = {}
         self._signals: Dict[str, LinSignal] = {}
         self._diagnostic_signals: Dict[str, LinSignal] = {}
+        self._signal_groups: Dict[str, LinSignalGroup] = {}
+        self._signal_group_index: Dict[str, LinSignalGroup] = {}
         self._unconditional_frames: Dict[str, LinUnconditionalFrame] = {}
         self._event_triggered_frames: Dict[str, LinEventTriggeredFrame] = {}
         self._sporadic_frames: Dict[str, LinSporadicFrame] = {}
@@ -43,6 +47,8 @@ class LDF():
         self._schedule_tables: Dict[str, ScheduleTable] = {}
         self._comments: List[str] = []
         self._pad_with_zero = pad_with_zero
+        self._lookup_table_width: int = 0
+        self._validation: str = LIN_VALIDATION_STRICT
 
     def get_protocol_version(self) -> Union[LinVersion, Iso17987Version, J2602Version]:
         """Returns the protocol version of the LIN network"""
@@ -60,6 +66,20 @@ class LDF():
         """Returns the channel name"""
         return self._channel
 
+    def get_lookup_table_size(self) -> int:
+        """
+        Returns the approximate memory used by the decoding lookup tables of the encoding types
+        in bytes, see `parse_ldf(lookup_table_width=...)`
+        """
+        return sum(encoding_type.lookup_table_size for encoding_type in self._signal_encoding_types.values())
+
+    def get_byte_order(self) -> str:
+        """
+        Returns the byte order of signals spanning multiple bytes, `'big'` when the LDF contains
+        the `LIN_sig_byte_order_big_endian` header, otherwise `'little'`
+        """
+        return self._byte_order
+
     def get_master(self) -> LinMaster:
         """
         Returns the master node controlling the LIN network
@@ -277,6 +297,46 @@ class LDF():
         """
         return self._diagnostic_signals.values()
 
+    def get_signal_group(self, name: str) -> LinSignalGroup:
+        """
+        Returns the signal group with the given name
+
+        :param name: Name of the signal group to find
+        :type name: str
+        :returns: Signal group
+        :rtype: LinSignalGroup
+        :raises: LookupError if the given signal group is not found
+        """
+        group = self._signal_groups.get(name)
+        if group is None:
+            raise LookupError(f"No signal group named '{name}' found!")
+        return group
+
+    def get_signal_groups(self) -> List[LinSignalGroup]:
+        """
+        Returns all signal groups
+
+        :returns: List of signal groups
+        :rtype: List[LinSignalGroup]
+        """
+        return self._signal_groups.values()
+
+    def get_signal_group_of(self, signal: Union[str, LinSignal]) -> LinSignalGroup:
+        """
+        Returns the signal group that the given signal is a member of
+
+        :param signal: Signal or name of the signal
+        :type signal: str or LinSignal
+        :returns: Signal group
+        :rtype: LinSignalGroup
+        :raises: LookupError if the signal isn't a member of any group
+        """
+        name = signal.name if isinstance(signal, LinSignal) else signal
+        group = self._signal_group_index.get(name)
+        if group is None:
+            raise LookupError(f"Signal '{name}' is not part of any signal group!")
+        return group
+
     def get_schedule_table(self, name: str) -> ScheduleTable:
         """
         Returns the schedule table with the given name
@@ -301,6 +361,32 @@ class LDF():
         """
         return self._schedule_tables.values()
 
+    def add_schedule_table(self, table: ScheduleTable) -> None:
+        """
+        Adds a schedule table, e.g. one created by `optimize_schedule`, to the LDF
+
+        :param table: Schedule table
+        :type table: ScheduleTable
+        :raises: ValueError if a schedule table with the same name already exists
+        """
+        if table.name in self._schedule_tables:
+            raise ValueError(f"Schedule table '{table.name}' already exists!")
+        self._schedule_tables[table.name] = table
+
+    def schedule_timeline(self, name: str, start: float = 0.0) -> ScheduleTimeline:
+        """
+        Returns the timeline of the schedule table with the given name, timed by the master
+
+        :param name: Name of the schedule table to start with
+        :type name: str
+        :param start: Timestamp of the first slot in seconds
+        :type start: float
+        :returns: Schedule timeline
+        :rtype: ScheduleTimeline
+        :raises: LookupError if the given schedule table is not found
+        """
+        return ScheduleTimeline(self._master, self.get_schedule_table(name), start)
+
     def get_signal_encoding_type(self, name: str) -> LinSignalEncodingType:
         """
         Returns the signal encoding type with the given name
@@ -325,6 +411,25 @@ class LDF():
         """
         return self._signal_encoding_types.values()
 
+    def bus_decoder(self, encoding_types: Dict[str, LinSignalEncodingType] = None,
+                    keep_unit: bool = False) -> LinBusDecoder:
+        """
+        Returns a decoder for frames received on the bus
+
+        The decoder covers the unconditional, event triggered and diagnostic frames of the network
+
+        :param encoding_types: Mapping of signal names to encoding types, by default the encoding
+            type assigned to the signal is used
+        :type encoding_types: Dict[str, LinSignalEncodingType]
+        :param keep_unit: Whether physical values should keep their units
+        :type keep_unit: bool
+        :returns: Bus decoder
+        :rtype: LinBusDecoder
+        """
+        frames = list(self._unconditional_frames.values()) + list(self._event_triggered_frames.values()) + \
+            list(self._diagnostic_frames.values())
+        return LinBusDecoder(frames, encoding_types, keep_unit)
+
     @property
     def master_request_frame(self) -> LinDiagnosticRequest:
         return self._master_request_frame
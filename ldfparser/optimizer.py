@@ -0,0 +1,211 @@
+"""
+Generation of schedule tables from the required refresh periods of frames and signals
+"""
+import math
+import random
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from .analysis import frame_length, frame_timings
+from .schedule import LinFrameEntry, ScheduleTable
+
+if TYPE_CHECKING:
+    from .ldf import LDF
+
+# Consecutive placements that fail before a cycle length is given up
+_MAX_MISSES = 100
+
+class _ScheduleFrame(NamedTuple):
+    frame: object
+    # shortest slot that fits the frame and the jitter of the master, in timebase ticks
+    slot: int
+    # longest allowed interval between two transmissions, in timebase ticks
+    period: int
+    nominal: float
+
+class _Schedule(NamedTuple):
+    # (start, frame) pairs in timebase ticks, sorted by start
+    slots: List[Tuple[int, _ScheduleFrame]]
+    cycle: int
+    load: float
+    jitter: int
+
+def _required_periods(ldf: 'LDF', periods: Dict[str, float]) -> Dict[str, Tuple[object, float]]:
+    """
+    Resolves frame and signal names into frames with the shortest period required for each frame
+    """
+    required: Dict[str, Tuple[object, float]] = {}
+    for (name, period) in periods.items():
+        if period <= 0:
+            raise ValueError(f"{name}: period must be positive, got {period}")
+        try:
+            frames = [ldf.get_frame(name)]
+        except LookupError:
+            try:
+                frames = ldf.get_signal(name).frames
+            except LookupError:
+                raise LookupError(f"No frame or signal named '{name}' found!") from None
+            if not frames:
+                raise ValueError(f"{name}: signal isn't carried by any frame")
+        for frame in frames:
+            if frame.name not in required or period < required[frame.name][1]:
+                required[frame.name] = (frame, period)
+    return required
+
+def _place(frames: List[_ScheduleFrame], cycle: int, phases: List[float]) -> Optional[_Schedule]:
+    """
+    Places the transmissions of each frame evenly over the cycle, starting at its phase, slots
+    that collide are moved to the end of the previous slot
+
+    :returns: The schedule or `None` if it doesn't fit into the cycle or misses a period
+    """
+    requests = []
+    for (order, (frame, phase)) in enumerate(zip(frames, phases)):
+        count = math.ceil(cycle / frame.period)
+        spacing = cycle / count
+        for index in range(count):
+            requests.append((phase * spacing + index * spacing, order, frame))
+    requests.sort(key=lambda request: (request[0], request[1]))
+    slots = []
+    end = 0
+    for (target, _, frame) in requests:
+        start = max(math.floor(target), end)
+        slots.append((start, frame))
+        end = start + frame.slot
+    if end > cycle:
+        return None
+    jitter = 0
+    starts: Dict[str, List[int]] = {}
+    for (start, frame) in slots:
+        starts.setdefault(frame.frame.name, []).append(start)
+    for frame in frames:
+        frame_starts = starts[frame.frame.name]
+        intervals = [following - start for (start, following) in zip(frame_starts, frame_starts[1:])]
+        intervals.append(cycle - frame_starts[-1] + frame_starts[0])
+        if max(intervals) > frame.period:
+            return None
+        jitter += max(intervals) - min(intervals)
+    return _Schedule(slots, cycle, _cycle_load(frames, cycle), jitter)
+
+def _cycle_load(frames: List[_ScheduleFrame], cycle: int) -> float:
+    return sum(math.ceil(cycle / frame.period) * frame.nominal for frame in frames) / cycle
+
+def _cycle_candidates(frames: List[_ScheduleFrame]) -> List[int]:
+    """
+    Returns cycle lengths worth trying, multiples of the periods that can hold every frame once
+    """
+    minimum = sum(frame.slot for frame in frames)
+    periods = sorted({frame.period for frame in frames})
+    candidates = {period * multiple for period in periods for multiple in range(1, 5)}
+    candidates.add(max(minimum, periods[0]))
+    return sorted(cycle for cycle in candidates if cycle >= minimum)
+
+def _schedule_frames(ldf: 'LDF', periods: Dict[str, float]) -> List[_ScheduleFrame]:
+    """
+    Returns the frames to schedule with their slot lengths and periods in timebase ticks, frames
+    with short periods come first like in rate monotonic scheduling
+    """
+    master = ldf.get_master()
+    timings = frame_timings(ldf.get_baudrate(), master.max_header_length, master.response_tolerance)
+    frames = []
+    for (frame, period) in _required_periods(ldf, periods).values():
+        timing = timings[frame_length(frame)]
+        slot = math.ceil((timing.maximum + (master.jitter or 0.0)) / master.timebase - 1e-9)
+        ticks = math.floor(period / master.timebase + 1e-9)
+        if ticks < slot:
+            raise ValueError(f"{frame.name}: period of {period * 1000} ms is shorter than its slot")
+        frames.append(_ScheduleFrame(frame, slot, ticks, timing.nominal))
+    frames.sort(key=lambda frame: (frame.period, frame.frame.name))
+    return frames
+
+def _search(frames: List[_ScheduleFrame], attempts: int, seed: int,
+            time_budget: Optional[float] = None) -> Optional[_Schedule]:
+    """
+    Returns the schedule with the lowest bus load and among those the lowest jitter found within
+    the given number of attempts per cycle, the time budget only cuts the search short
+    """
+    generator = random.Random(seed)
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    loads = {cycle: _cycle_load(frames, cycle) for cycle in _cycle_candidates(frames)}
+    best: Optional[_Schedule] = None
+    for cycle in sorted(loads, key=lambda cycle: (loads[cycle], cycle)):
+        if best is not None and loads[cycle] > best.load:
+            # only the jitter could improve at the same load
+            break
+        # the first attempt spreads the phases evenly, further attempts pick them randomly
+        phases = [index / len(frames) for index in range(len(frames))]
+        misses = 0
+        for _ in range(attempts):
+            schedule = _place(frames, cycle, phases)
+            if schedule is None:
+                misses += 1
+            else:
+                misses = 0
+                if best is None or schedule.jitter < best.jitter:
+                    best = schedule
+            if (best is not None and best.jitter == 0) or misses >= _MAX_MISSES:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                return best
+            phases = [generator.random() for _ in frames]
+    return best
+
+def optimize_schedule(ldf: 'LDF', periods: Dict[str, float], name: str = 'Optimized_Schedule',
+                      attempts: int = 1000, seed: int = 0, time_budget: Optional[float] = None) -> ScheduleTable:
+    """
+    Creates a schedule table that sends frames at least as often as required
+
+    Cycle lengths that are multiples of the required periods are tried in the order of the bus
+    load they cause. Within a cycle the transmissions of each frame are spread evenly and the
+    phases of the frames are searched randomly, the schedule whose intervals vary the least is
+    kept. A cycle length is given up after the number of attempts or once placing the frames
+    keeps failing, the search stops when no cycle with the same load is left. The result only
+    depends on the seed, unless the optional time budget cuts the search short. Slots are
+    multiples of the timebase and long enough for the maximum frame time plus the jitter of the
+    master.
+
+    :Example:
+
+    ```
+    table = optimize_schedule(ldf, {'CEM_Frm1': 0.02, 'LSM_Frm1': 0.05, 'RightIntLightsSwitch': 0.1})
+    ldf.add_schedule_table(table)
+    save_ldf(ldf, 'network.ldf')
+    ```
+
+    :param ldf: LDF containing the frames
+    :type ldf: LDF
+    :param periods: Longest allowed interval in seconds between transmissions indexed by frame
+        or signal names, signals require every frame carrying them to be sent that often
+    :type periods: Dict[str, float]
+    :param name: Name of the schedule table
+    :type name: str
+    :param attempts: Maximum number of phase combinations tried per cycle length
+    :type attempts: int
+    :param seed: Seed of the random search, the same seed produces the same schedule
+    :type seed: int
+    :param time_budget: Time in seconds after which the search is stopped, by default it isn't
+        limited, a budget makes the result depend on the speed of the machine
+    :type time_budget: float
+    :returns: Schedule table
+    :rtype: ScheduleTable
+    :raises: LookupError if a frame or signal is not found, ValueError if no schedule meets the
+        periods
+    """
+    frames = _schedule_frames(ldf, periods)
+    if not frames:
+        raise ValueError(f"{name}: no frames to schedule")
+    best = _search(frames, attempts, seed, time_budget)
+    if best is None:
+        raise ValueError(f"{name}: no schedule meets the required periods")
+
+    timebase = ldf.get_master().timebase
+    table = ScheduleTable(name)
+    ends = [start for (start, _) in best.slots[1:]] + [best.cycle]
+    # the first slot starts the cycle, idle time before it is added to the last slot
+    ends[-1] += best.slots[0][0]
+    for ((start, frame), end) in zip(best.slots, ends):
+        entry = LinFrameEntry()
+        entry.frame = frame.frame
+        entry.delay = round((end - start) * timebase, 9)
+        table.schedule.append(entry)
+    return table
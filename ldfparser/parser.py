@@ -6,9 +6,11 @@ from lark import Lark
 from .diagnostics import LIN_MASTER_REQUEST_FRAME_ID, LIN_SLAVE_RESPONSE_FRAME_ID, LinDiagnosticFrame, LinDiagnosticRequest, LinDiagnosticResponse
 from .schedule import AssignFrameIdEntry, AssignFrameIdRangeEntry, AssignNadEntry, ConditionalChangeNadEntry, DataDumpEntry, FreeFormatEntry, MasterRequestEntry, SaveConfigurationEntry, ScheduleTable, SlaveResponseEntry, UnassignFrameIdEntry, LinFrameEntry
 
-from .frame import LinEventTriggeredFrame, LinSporadicFrame, LinUnconditionalFrame
-from .signal import LinSignal
-from .encoding import ASCIIValue, BCDValue, LinSignalEncodingType, LogicalValue, PhysicalValue, ValueConverter
+from .frame import LIN_BYTE_ORDER_LITTLE_ENDIAN, LinEventTriggeredFrame, LinSporadicFrame, LinUnconditionalFrame
+from .signal import LinSignal, LinSignalGroup
+from .encoding import (LIN_LOOKUP_TABLE_MAX_WIDTH, LIN_VALIDATION_STRICT, LIN_VALIDATION_CLAMP,
+                       LIN_VALIDATION_UNCHECKED, ASCIIValue, BCDValue, LinSignalEncodingType, LogicalValue,
+                       PhysicalValue, ValueConverter)
 from .lin import LIN_VERSION_2_0, LIN_VERSION_2_1, J2602Version, parse_lin_version
 from .node import LinMaster, LinProductId, LinSlave
 from .ldf import LDF
@@ -50,7 +52,8 @@ def parseLDFtoDict(path: str, captureComments: bool = False, encoding: str = Non
     warnings.warn("'parseLDFtoDict' is deprecated, use 'parse_ldf_to_dict' instead", DeprecationWarning)
     return parse_ldf_to_dict(path, captureComments, encoding)
 
-def parse_ldf(path: str, capture_comments: bool = False, encoding: str = None, pad_with_zero: bool = True) -> LDF:
+def parse_ldf(path: str, capture_comments: bool = False, encoding: str = None, pad_with_zero: bool = True,
+              lookup_table_width: int = 0, validation: str = LIN_VALIDATION_STRICT) -> LDF:
     """
     Parses an LDF file into an object
 
@@ -61,9 +64,23 @@ def parse_ldf(path: str, capture_comments: bool = False, encoding: str = None, p
     :param pad_with_zero: If True, pad with zeros during frame encoding. Otherwise, pad with ones.
         Default: True
     :type pad_with_zero: Boolean
+    :param lookup_table_width: Signals up to this width get precomputed decoding tables from their
+        encoding types, at most `LIN_LOOKUP_TABLE_MAX_WIDTH`, 0 disables the tables. Default: 0
+    :type lookup_table_width: int
+    :param validation: Validation policy of the signal encoding types, `'strict'`, `'clamp'` or
+        `'unchecked'`, see `LinSignalEncodingType.validation`. Default: `'strict'`
+    :type validation: str
+    :raises: ValueError if the lookup table width is out of range or the validation policy is
+        unknown
     """
+    if lookup_table_width < 0 or lookup_table_width > LIN_LOOKUP_TABLE_MAX_WIDTH:
+        raise ValueError(f"lookup table width {lookup_table_width} is invalid, must be 0-{LIN_LOOKUP_TABLE_MAX_WIDTH}")
+    if validation not in (LIN_VALIDATION_STRICT, LIN_VALIDATION_CLAMP, LIN_VALIDATION_UNCHECKED):
+        raise ValueError(f"validation policy '{validation}' is invalid")
     json = parse_ldf_to_dict(path, capture_comments, encoding)
     ldf = LDF(pad_with_zero=pad_with_zero)
+    ldf._lookup_table_width = lookup_table_width
+    ldf._validation = validation
     ldf._source = json
 
     _populate_ldf_header(json, ldf)
@@ -71,6 +88,7 @@ def parse_ldf(path: str, capture_comments: bool = False, encoding: str = None, p
     _populate_ldf_frames(json, ldf)
     _populate_ldf_event_triggered_frames(json, ldf)
     _populate_ldf_sporadic_frames(json, ldf)
+    _populate_ldf_signal_groups(json, ldf)
     _populate_diagnostic_signals(json, ldf)
     _populate_diagnostic_frames(json, ldf)
     _populate_ldf_nodes(json, ldf)
@@ -99,6 +117,7 @@ def _populate_ldf_header(json: dict, ldf: LDF):
     ldf._language_version = parse_lin_version(_require_key(json, 'language_version', 'LDF missing language version.'))
     ldf._baudrate = _require_key(json, 'speed', 'LDF missing speed definition.')
     ldf._channel = json.get('channel_name')
+    ldf._byte_order = json.get('endianness', LIN_BYTE_ORDER_LITTLE_ENDIAN)
 
 def _populate_ldf_signals(json: dict, ldf: LDF):
     for signal in _require_key(json, 'signals', 'LDF missing Signals section.'):
@@ -125,7 +144,8 @@ def _populate_ldf_frames(json: dict, ldf: LDF):
             elif 48 <= frame['frame_id'] <= 63:
                 length = 8
 
-        frame_obj = LinUnconditionalFrame(frame['frame_id'], frame['name'], length, signals, pad_with_zero=ldf._pad_with_zero)
+        frame_obj = LinUnconditionalFrame(frame['frame_id'], frame['name'], length, signals, pad_with_zero=ldf._pad_with_zero,
+                                          byte_order=ldf.get_byte_order())
         ldf._unconditional_frames[frame['name']] = frame_obj
 
         for (_, signal) in signals.items():
@@ -153,6 +173,18 @@ def _populate_ldf_sporadic_frames(json: dict, ldf: LDF):
             frames.append(ldf.get_unconditional_frame(a))
         ldf._sporadic_frames[frame['name']] = LinSporadicFrame(frame['name'], frames)
 
+def _populate_ldf_signal_groups(json: dict, ldf: LDF):
+    if "signal_groups" not in json:
+        return
+    for group in json['signal_groups']:
+        signals = {}
+        for (signal, offset) in group['signals'].items():
+            signals[offset] = ldf.get_signal(signal)
+        group_obj = LinSignalGroup(group['name'], group['size'], signals, ldf.get_byte_order())
+        ldf._signal_groups[group_obj.name] = group_obj
+        for signal in group_obj.signals:
+            ldf._signal_group_index[signal.name] = group_obj
+
 def _populate_ldf_nodes(json: dict, ldf: LDF):
     nodes = _require_key(json, 'nodes', 'Missing Nodes section.')
 
@@ -381,13 +413,15 @@ def _populate_ldf_encoding_types(json: dict, ldf: LDF):
         converters = []
         for encoding_value in encoding_type['values']:
             converters.append(_convert_encoding_value(encoding_value))
-        ldf._signal_encoding_types[encoding_type['name']] = LinSignalEncodingType(encoding_type['name'], converters)
+        ldf._signal_encoding_types[encoding_type['name']] = LinSignalEncodingType(encoding_type['name'], converters, ldf._validation)
     for representations in json['signal_representations']:
         for signal in representations['signals']:
             signal_obj = ldf.get_signal(signal)
             signal_obj.encoding_type = ldf._signal_encoding_types[representations['encoding']]
             ldf._signal_representations[signal_obj] = ldf._signal_encoding_types[representations['encoding']]
             ldf._signal_encoding_types[representations['encoding']]._signals.append(signal_obj)
+            if signal_obj.width <= ldf._lookup_table_width:
+                signal_obj.encoding_type.build_lookup_table(signal_obj)
 
 def _convert_encoding_value(json: dict) -> ValueConverter:
     if json['type'] == 'logical':
@@ -0,0 +1,423 @@
+"""
+Real-time execution of schedule tables
+
+The runner plays the role of the master task, it sends the slots of a schedule table through a
+`LinBusBackend` at the times given by `ScheduleTimeline`. Slot deadlines are computed from the
+start of the run and the elapsed timebase ticks, a late slot doesn't delay the following ones.
+"""
+import asyncio
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+
+from .client import LinDiagnosticTransport
+from .diagnostics import LIN_MASTER_REQUEST_FRAME_ID, LIN_SLAVE_RESPONSE_FRAME_ID, encode_configuration_entry
+from .frame import FrameState, LinSporadicFrame, LinUnconditionalFrame
+from .node import LinMaster
+from .schedule import MasterRequestEntry, ScheduleSlot, ScheduleTable, ScheduleTimeline, SlaveResponseEntry
+
+if TYPE_CHECKING:
+    from .encoding import LinSignalEncodingType
+
+class LinClock():
+    """
+    Monotonic clock that the schedule runner is timed by, by default the clock of the event loop
+
+    Simulations and tests replace the clock to run schedules faster than real time.
+    """
+
+    def time(self) -> float:
+        """
+        Returns the current time in seconds
+
+        :returns: Time in seconds
+        :rtype: float
+        """
+        return asyncio.get_event_loop().time()
+
+    async def sleep(self, delay: float) -> None:
+        """
+        Waits until the given time elapsed
+
+        :param delay: Time in seconds
+        :type delay: float
+        """
+        await asyncio.sleep(delay)
+
+class LinBusBackend():
+    """
+    Interface between the schedule runner and the bus
+
+    A backend transmits frame headers and the responses published by the master, implementations
+    wrap LIN interfaces, see `LinLoopbackBackend` for a backend without hardware.
+    """
+
+    async def send_frame(self, frame_id: int, data: bytes) -> None:
+        """
+        Transmits a frame header followed by the response of the master
+
+        :param frame_id: Frame identifier
+        :type frame_id: int
+        :param data: Frame content
+        :type data: bytes
+        """
+        raise NotImplementedError()
+
+    async def send_header(self, frame_id: int) -> Optional[bytes]:
+        """
+        Transmits a frame header that a slave responds to
+
+        :param frame_id: Frame identifier
+        :type frame_id: int
+        :returns: The frame content sent by a slave or `None` if no slave responded
+        :rtype: bytes
+        """
+        raise NotImplementedError()
+
+class LinLoopbackBackend(LinBusBackend):
+    """
+    LinLoopbackBackend records the frames of the runner and answers headers from preset responses
+
+    Master requests and slave response headers are passed to a diagnostic transport when one is
+    given, such as `LinSimulatedTransport`.
+
+    :Example:
+
+    ```
+    backend = LinLoopbackBackend(LinSimulatedTransport(ldf.get_slaves()))
+    backend.responses[0x02] = b'\\x01\\x00'
+    ```
+
+    :param transport: Transport that handles the diagnostic frames
+    :type transport: LinDiagnosticTransport
+    :param clock: Clock that timestamps the frames, the clock of the event loop by default
+    :type clock: LinClock
+    """
+
+    def __init__(self, transport: LinDiagnosticTransport = None, clock: LinClock = None) -> None:
+        self.transport = transport
+        self.clock = clock if clock is not None else LinClock()
+        # frame contents or functions returning them, indexed by frame identifiers
+        self.responses: Dict[int, Union[bytes, Callable[[], Optional[bytes]]]] = {}
+        # (timestamp, frame_id, data) of every header, data is None if nobody responded
+        self.frames: List[Tuple[float, int, Optional[bytes]]] = []
+
+    async def send_frame(self, frame_id: int, data: bytes) -> None:
+        self.frames.append((self.clock.time(), frame_id, bytes(data)))
+        if frame_id == LIN_MASTER_REQUEST_FRAME_ID and self.transport is not None:
+            await self.transport.master_request(data)
+
+    async def send_header(self, frame_id: int) -> Optional[bytes]:
+        timestamp = self.clock.time()
+        if frame_id == LIN_SLAVE_RESPONSE_FRAME_ID and self.transport is not None:
+            data = await self.transport.slave_response()
+        else:
+            data = self.responses.get(frame_id)
+            if callable(data):
+                data = data()
+        self.frames.append((timestamp, frame_id, None if data is None else bytes(data)))
+        return data
+
+class LinScheduleStatistics():
+    """
+    Timing statistics of the slots sent by a schedule runner
+
+    The lateness of a slot is the time between its nominal start and the moment its header was
+    passed to the backend. Lateness is collected in a histogram of equal bins, the last bin also
+    counts every slot that was later.
+
+    :param bin_width: Width of the histogram bins in seconds
+    :type bin_width: float
+    :param bins: Number of histogram bins
+    :type bins: int
+    """
+
+    def __init__(self, bin_width: float = 0.0005, bins: int = 20) -> None:
+        if bin_width <= 0 or bins <= 0:
+            raise ValueError(f"histogram needs positive bins, got {bins} bins of {bin_width} s")
+        self.bin_width = bin_width
+        self.histogram: List[int] = [0] * bins
+        # slots sent
+        self.slots = 0
+        # slots whose header started later than the jitter of the master allows
+        self.late = 0
+        # slots skipped because they were already over when the runner got to them
+        self.skipped = 0
+        self.maximum = 0.0
+        self._total = 0.0
+
+    @property
+    def average(self) -> float:
+        """Returns the average lateness of the slots sent in seconds"""
+        return self._total / self.slots if self.slots else 0.0
+
+    def record(self, lateness: float, late: bool = False) -> None:
+        """
+        Counts a slot that was sent
+
+        :param lateness: Lateness of the slot in seconds
+        :type lateness: float
+        :param late: Whether the slot started after its latest start
+        :type late: bool
+        """
+        self.histogram[min(int(lateness / self.bin_width), len(self.histogram) - 1)] += 1
+        self.slots += 1
+        self.late += late
+        self.maximum = max(self.maximum, lateness)
+        self._total += lateness
+
+    def to_dict(self) -> Dict[str, Union[int, float, List[int]]]:
+        return {
+            'slots': self.slots,
+            'late': self.late,
+            'skipped': self.skipped,
+            'average': self.average,
+            'maximum': self.maximum,
+            'bin_width': self.bin_width,
+            'histogram': list(self.histogram)
+        }
+
+class _LinScheduleTransport(LinDiagnosticTransport):
+    """
+    Diagnostic transport that sends through the diagnostic slots of a schedule runner
+    """
+
+    def __init__(self, runner: 'LinScheduleRunner') -> None:
+        self.runner = runner
+
+    async def master_request(self, data: bytes) -> None:
+        future = asyncio.get_event_loop().create_future()
+        self.runner._master_requests.append((bytes(data), future))
+        await future
+
+    async def slave_response(self) -> Optional[bytes]:
+        future = asyncio.get_event_loop().create_future()
+        self.runner._slave_responses.append(future)
+        return await future
+
+class LinScheduleRunner():
+    """
+    LinScheduleRunner sends the slots of schedule tables in real time
+
+    Slot deadlines are derived from a monotonic `LinClock` and the number of elapsed timebase
+    ticks, so the schedule doesn't drift regardless of how long the callbacks and the backend
+    take. Slots that are already over when the runner gets to them are skipped and
+    counted in the statistics instead of being sent in a burst.
+
+    Frames published by the master are sent from a `FrameState`, callbacks registered for a frame
+    are called at the start of its slot and may return signal values that are encoded into the
+    state. Headers of frames published by slaves are sent and the responses are passed to the
+    listeners. Sporadic frames send the first associated frame whose state changed since it was
+    last sent. Master request slots send the requests queued through `transport`, slave response
+    slots pass the responses back, configuration slots send the request of their entry.
+
+    :Example:
+
+    ```
+    runner = LinScheduleRunner(ldf.get_master(), ldf.get_schedule_table('Normal_Schedule'), backend)
+    runner.on_slot('CEM_Frm1', lambda slot: {'InternalLightsRequest': 'on'})
+    runner.add_listener(lambda slot, data: print(slot.frame.name, data))
+    statistics = await runner.run(duration=10.0)
+    ```
+
+    :param master: Master node whose timebase and jitter apply
+    :type master: LinMaster
+    :param table: Schedule table to start with
+    :type table: ScheduleTable
+    :param backend: Backend that transmits the frames
+    :type backend: LinBusBackend
+    :param encoding_types: Mapping of signal names to encoding types used by the frame states
+    :type encoding_types: Dict[str, LinSignalEncodingType]
+    :param statistics: Statistics to collect the slot timing in
+    :type statistics: LinScheduleStatistics
+    :param clock: Clock that the slots are timed by, the clock of the event loop by default
+    :type clock: LinClock
+    :raises: ValueError if the timebase isn't positive or the table has no slots
+    """
+
+    def __init__(self, master: LinMaster, table: ScheduleTable, backend: LinBusBackend,
+                 encoding_types: Dict[str, 'LinSignalEncodingType'] = None,
+                 statistics: LinScheduleStatistics = None, clock: LinClock = None) -> None:
+        self.master = master
+        self.backend = backend
+        self.clock = clock if clock is not None else LinClock()
+        self.encoding_types = encoding_types
+        self.statistics = statistics if statistics is not None else LinScheduleStatistics()
+        self.transport: LinDiagnosticTransport = _LinScheduleTransport(self)
+        self._timeline = ScheduleTimeline(master, table)
+        self._states: Dict[str, FrameState] = {}
+        self._callbacks: Dict[str, Callable[[ScheduleSlot], Optional[Dict]]] = {}
+        self._listeners: List[Callable[[ScheduleSlot, bytes], None]] = []
+        self._master_requests: Deque[Tuple[bytes, asyncio.Future]] = deque()
+        self._slave_responses: Deque[asyncio.Future] = deque()
+        self._running = False
+
+    @property
+    def table(self) -> ScheduleTable:
+        """Returns the schedule table that is running"""
+        return self._timeline.table
+
+    def switch(self, table: ScheduleTable, at_end: bool = False) -> None:
+        """
+        Switches to another schedule table, see `ScheduleTimeline.switch`
+
+        :param table: Schedule table to switch to
+        :type table: ScheduleTable
+        :param at_end: If True, the current table finishes its cycle first
+        :type at_end: bool
+        :raises: ValueError if the table has no slots
+        """
+        self._timeline.switch(table, at_end)
+
+    def state(self, frame: LinUnconditionalFrame) -> FrameState:
+        """
+        Returns the state that the master sends the frame from
+
+        :param frame: Frame published by the master
+        :type frame: LinUnconditionalFrame
+        :returns: Frame state
+        :rtype: FrameState
+        """
+        state = self._states.get(frame.name)
+        if state is None:
+            state = self._states[frame.name] = FrameState(frame, self.encoding_types)
+        return state
+
+    def on_slot(self, name: str, callback: Callable[[ScheduleSlot], Optional[Dict]]) -> None:
+        """
+        Registers a function called at the start of each slot of a frame
+
+        The values returned for frames published by the master are encoded into the frame before
+        it's sent, the return value is ignored for other frames.
+
+        :param name: Name of the frame
+        :type name: str
+        :param callback: Function of the slot returning signal values or `None`
+        :type callback: Callable[[ScheduleSlot], Optional[Dict[str, Union[str, int, float, List[int]]]]]
+        """
+        self._callbacks[name] = callback
+
+    def add_listener(self, listener: Callable[[ScheduleSlot, bytes], None]) -> None:
+        """
+        Registers a function called with every response sent by the slaves
+
+        :param listener: Function of the slot and the frame content
+        :type listener: Callable[[ScheduleSlot, bytes], None]
+        """
+        self._listeners.append(listener)
+
+    def stop(self) -> None:
+        """Stops the runner before the next slot"""
+        self._running = False
+
+    async def run(self, duration: float = None, count: int = None) -> LinScheduleStatistics:
+        """
+        Sends slots until the runner is stopped, the duration elapsed or the number of slots was
+        reached, a run continues the schedule where the previous one stopped
+
+        :param duration: Time in seconds after which no further slot is started
+        :type duration: float
+        :param count: Maximum number of slots, skipped slots included
+        :type count: int
+        :returns: Timing statistics
+        :rtype: LinScheduleStatistics
+        :raises: Errors of the backend, pending diagnostic requests fail with the same error
+        """
+        clock = self.clock
+        timeline = self._timeline
+        now = clock.time()
+        # the next slot starts now
+        origin = now - timeline.timestamp
+        end = None if duration is None else now + duration
+        self._running = True
+        processed = 0
+        try:
+            while self._running and (count is None or processed < count):
+                deadline = origin + timeline.timestamp
+                if end is not None and deadline >= end:
+                    break
+                slot = next(timeline)
+                processed += 1
+                now = clock.time()
+                while now < deadline:
+                    await clock.sleep(deadline - now)
+                    now = clock.time()
+                lateness = now - deadline
+                if lateness >= slot.duration:
+                    self.statistics.skipped += 1
+                    continue
+                self.statistics.record(lateness, lateness > slot.latest - slot.timestamp)
+                await self._send(slot)
+        except Exception as error:
+            futures = [future for (_, future) in self._master_requests] + list(self._slave_responses)
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            self._master_requests.clear()
+            self._slave_responses.clear()
+            raise
+        finally:
+            self._running = False
+        return self.statistics
+
+    async def _send(self, slot: ScheduleSlot) -> None:
+        if slot.frame is not None:
+            await self._send_frame(slot)
+        elif isinstance(slot.entry, SlaveResponseEntry):
+            data = await self.backend.send_header(LIN_SLAVE_RESPONSE_FRAME_ID)
+            while self._slave_responses:
+                future = self._slave_responses.popleft()
+                if not future.done():
+                    future.set_result(data)
+                    break
+            self._notify(slot, data)
+        elif isinstance(slot.entry, MasterRequestEntry):
+            await self._send_master_request()
+        else:
+            await self.backend.send_frame(LIN_MASTER_REQUEST_FRAME_ID, encode_configuration_entry(slot.entry))
+
+    async def _send_master_request(self) -> None:
+        """
+        Sends the first queued master request, the slot stays empty if there is none
+        """
+        while self._master_requests:
+            (data, future) = self._master_requests.popleft()
+            if future.done():
+                # cancelled by the transport's caller
+                continue
+            try:
+                await self.backend.send_frame(LIN_MASTER_REQUEST_FRAME_ID, data)
+            except Exception as error:
+                if not future.done():
+                    future.set_exception(error)
+                raise
+            if not future.done():
+                future.set_result(None)
+            return
+
+    async def _send_frame(self, slot: ScheduleSlot) -> None:
+        frame = slot.frame
+        callback = self._callbacks.get(frame.name)
+        values = callback(slot) if callback is not None else None
+        if isinstance(frame, LinSporadicFrame):
+            for associated in frame.frames:
+                state = self._states.get(associated.name)
+                if state is not None and state.dirty:
+                    await self._publish(state)
+                    return
+        elif isinstance(frame, LinUnconditionalFrame) and isinstance(frame.publisher, LinMaster):
+            state = self.state(frame)
+            if values:
+                state.update(values)
+            await self._publish(state)
+        else:
+            self._notify(slot, await self.backend.send_header(frame.frame_id))
+
+    async def _publish(self, state: FrameState) -> None:
+        await self.backend.send_frame(state.frame.frame_id, bytes(state.payload))
+        state.clean()
+
+    def _notify(self, slot: ScheduleSlot, data: Optional[bytes]) -> None:
+        if data is None:
+            return
+        for listener in self._listeners:
+            listener(slot, data)
@@ -1,9 +1,12 @@
-
-from typing import List, TYPE_CHECKING
+"""
+Schedule tables and their expansion into a timeline of frame slots
+"""
+import math
+from typing import Iterator, List, NamedTuple, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .frame import LinFrame
-    from .node import LinNode
+    from .node import LinMaster, LinNode
 
 class ScheduleTable():
 
@@ -89,3 +92,158 @@ class FreeFormatEntry(ScheduleTableEntry):
     def __init__(self) -> None:
         super().__init__()
         self.data: List[int] = []
+
+class ScheduleSlot(NamedTuple):
+    """
+    A slot of a schedule table at a point in time
+
+    :param timestamp: Nominal start of the slot in seconds
+    :type timestamp: float
+    :param latest: Latest start of the frame header, the timestamp plus the jitter of the master
+    :type latest: float
+    :param duration: Length of the slot in seconds, the entry's delay rounded up to the timebase
+    :type duration: float
+    :param table: Schedule table the slot belongs to
+    :type table: ScheduleTable
+    :param index: Position of the entry in the schedule table
+    :type index: int
+    :param entry: Schedule table entry
+    :type entry: ScheduleTableEntry
+    :param frame: Frame of frame entries, `None` for diagnostic and configuration entries
+    :type frame: LinFrame
+    """
+    timestamp: float
+    latest: float
+    duration: float
+    table: ScheduleTable
+    index: int
+    entry: ScheduleTableEntry
+    frame: Optional['LinFrame']
+
+class ScheduleTimeline():
+    """
+    ScheduleTimeline expands schedule tables into the slots that the master sends
+
+    The timeline is an endless iterator, each step returns the next `ScheduleSlot`. Slots are
+    aligned to the timebase of the master, timestamps are computed from the number of elapsed
+    timebase ticks so they don't accumulate rounding errors over long runs. Only the slot lengths
+    of the current table are stored, stepping takes constant time and memory.
+
+    :Example:
+
+    ```
+    timeline = ScheduleTimeline(ldf.get_master(), ldf.get_schedule_table('Normal_Schedule'))
+    for slot in timeline.slots(until=1.0):
+        print(slot.timestamp, slot.entry)
+    timeline.switch(ldf.get_schedule_table('Diagnostic_Schedule'))
+    ```
+
+    :param master: Master node whose timebase and jitter apply
+    :type master: LinMaster
+    :param table: Schedule table to start with
+    :type table: ScheduleTable
+    :param start: Timestamp of the first slot in seconds
+    :type start: float
+    :raises: ValueError if the timebase isn't positive or the table has no slots
+    """
+
+    def __init__(self, master: 'LinMaster', table: ScheduleTable, start: float = 0.0) -> None:
+        if not master.timebase or master.timebase <= 0:
+            raise ValueError(f"{master.name}: timebase must be positive, got {master.timebase}")
+        self.timebase = master.timebase
+        self.jitter = master.jitter or 0.0
+        self.start = start
+        self._tick = 0
+        self._index = 0
+        self._pending: Optional[ScheduleTable] = None
+        self._pending_at_end = False
+        self._load(table)
+
+    def _ticks(self, delay: float) -> int:
+        # tolerates the rounding errors of delays parsed from milliseconds
+        return max(math.ceil(delay / self.timebase - 1e-9), 0)
+
+    def _load(self, table: ScheduleTable) -> None:
+        slot_ticks = [self._ticks(entry.delay) for entry in table.schedule]
+        if sum(slot_ticks) == 0:
+            raise ValueError(f"{table.name}: schedule table has no slots")
+        self.table = table
+        self._entries = table.schedule
+        self._slot_ticks = slot_ticks
+        self._cycle_ticks = sum(slot_ticks)
+        self._index = 0
+
+    @property
+    def timestamp(self) -> float:
+        """Returns the start of the next slot in seconds"""
+        return self.start + self._tick * self.timebase
+
+    @property
+    def cycle_time(self) -> float:
+        """Returns the time in seconds that one cycle of the current table takes"""
+        return self._cycle_ticks * self.timebase
+
+    def switch(self, table: ScheduleTable, at_end: bool = False) -> None:
+        """
+        Switches to another schedule table, the new table starts with its first entry
+
+        :param table: Schedule table to switch to
+        :type table: ScheduleTable
+        :param at_end: If True, the current table finishes its cycle first, otherwise the new
+            table starts after the current slot
+        :type at_end: bool
+        :raises: ValueError if the table has no slots
+        """
+        if sum(self._ticks(entry.delay) for entry in table.schedule) == 0:
+            raise ValueError(f"{table.name}: schedule table has no slots")
+        self._pending = table
+        self._pending_at_end = at_end
+
+    def __iter__(self) -> 'ScheduleTimeline':
+        return self
+
+    def __next__(self) -> ScheduleSlot:
+        if self._pending is not None and (not self._pending_at_end or self._index == 0):
+            self._load(self._pending)
+            self._pending = None
+        index = self._index
+        entry = self._entries[index]
+        ticks = self._slot_ticks[index]
+        timestamp = self.start + self._tick * self.timebase
+        self._tick += ticks
+        self._index = (index + 1) % len(self._entries)
+        return ScheduleSlot(timestamp, timestamp + self.jitter, ticks * self.timebase, self.table, index,
+                            entry, entry.frame if isinstance(entry, LinFrameEntry) else None)
+
+    def slots(self, until: float = None, count: int = None) -> Iterator[ScheduleSlot]:
+        """
+        Returns the next slots, bounded by time, count or both
+
+        :param until: Slots starting at or after this timestamp aren't returned
+        :type until: float
+        :param count: Maximum number of slots
+        :type count: int
+        :returns: Iterator of slots, endless if no bound is given
+        :rtype: Iterator[ScheduleSlot]
+        """
+        returned = 0
+        while count is None or returned < count:
+            if until is not None and self.timestamp >= until:
+                return
+            returned += 1
+            yield next(self)
+
+    def fast_forward(self, timestamp: float) -> None:
+        """
+        Skips the slots that start before the given timestamp, whole cycles are skipped at once
+
+        :param timestamp: Timestamp in seconds
+        :type timestamp: float
+        """
+        target = math.ceil((timestamp - self.start) / self.timebase - 1e-9)
+        while self._tick < target and (self._index != 0 or self._pending is not None):
+            next(self)
+        if self._tick < target:
+            self._tick += (target - self._tick) // self._cycle_ticks * self._cycle_ticks
+        while self._tick < target:
+            next(self)
@@ -1,7 +1,9 @@
 """
 LIN Signal
 """
-from typing import List, Union, TYPE_CHECKING
+from typing import Dict, List, Tuple, Union, TYPE_CHECKING
+
+from .frame import LIN_BYTE_ORDER_LITTLE_ENDIAN, _LinSignalField, _create_signal_field
 
 if TYPE_CHECKING:
     from .node import LinNode
@@ -70,3 +72,164 @@ class LinSignal:
         if isinstance(init_value, int) and (width < 1 or width > 16):
             raise ValueError(f"scalar signal {name}:{width} must be 1-16 bits long")
         return LinSignal(name, width, init_value)
+
+class LinSignalGroup:
+    """
+    LinSignalGroup describes signals that are always updated together
+
+    The layout of the member signals is compiled when the group is created, the group is encoded
+    into and decoded from a single image of `size` bits.
+
+    :param name: Name of the signal group
+    :type name: str
+    :param size: Size of the signal group in bits
+    :type size: int
+    :param signals: Signals of the group
+    :type signals: Dict[int, LinSignal] where the key is the offset inside the group
+    :param byte_order: Byte order of signals spanning multiple bytes, `'little'` or `'big'`
+    :type byte_order: str
+    :raises: ValueError if the signals would overlap or span outside the group
+    """
+
+    def __init__(self, name: str, size: int, signals: Dict[int, LinSignal],
+                 byte_order: str = LIN_BYTE_ORDER_LITTLE_ENDIAN):
+        self.name: str = name
+        self.size: int = size
+        self.byte_order: str = byte_order
+        self.signal_map: List[Tuple[int, LinSignal]] = sorted(signals.items(), key=lambda x: x[0])
+        self._fields: Dict[str, '_LinSignalField'] = {}
+        self._mask: int = 0
+        group_offset = 0
+        prev_signal = None
+        for (offset, signal) in self.signal_map:
+            if offset < group_offset:
+                raise ValueError(f"{name}: {signal.name} at bit {offset} is overlapping {prev_signal.name}")
+            if offset + signal.width > size:
+                raise ValueError(f"{name}: {signal.name} at bit {offset} spans outside group!")
+            field = _create_signal_field(offset, signal, byte_order)
+            self._fields[signal.name] = field
+            self._mask |= field.mask << offset
+            group_offset = offset + signal.width
+            prev_signal = signal
+        self._default_image: int = 0
+        for field in self._fields.values():
+            try:
+                self._default_image = field.insert(self._default_image, field.signal.init_value)
+            except ValueError:
+                # invalid initial values are left as zeros, the same as the padding
+                pass
+
+    @property
+    def signals(self) -> List[LinSignal]:
+        """Returns the member signals ordered by their offsets"""
+        return [signal for (_, signal) in self.signal_map]
+
+    @property
+    def length(self) -> int:
+        """Returns the size of the group in bytes"""
+        return (self.size + 7) // 8
+
+    def _pack(self, raw: Dict[str, Union[int, List[int]]], image: int = None) -> int:
+        if image is None:
+            image = self._default_image
+        for (signal_name, value) in raw.items():
+            field = self._fields.get(signal_name)
+            if field is None:
+                raise LookupError(f"No signal named '{signal_name}' found in {self.name}!")
+            image = field.insert(image, value)
+        return image
+
+    def encode_raw(self, data: Dict[str, Union[int, List[int]]]) -> bytearray:
+        """
+        Encodes raw signal values into the group image
+
+        :param data: Mapping of signal names to raw values, signals that are not supplied will
+            default to their initial values
+        :type data: Dict[str, int]
+        :returns: Group image
+        :rtype: bytearray
+        :raises: LookupError if a signal is not part of the group
+        """
+        return bytearray(self._pack(data).to_bytes(self.length, "little"))
+
+    def encode(self, data: Dict[str, Union[str, int, float, List[int]]],
+               encoding_types: Dict[str, 'LinSignalEncodingType'] = None) -> bytearray:
+        """
+        Encodes signal values into the group image using the signals' encoding types
+
+        :param data: Mapping of signal names to values
+        :type data: Dict[str, Union[str, int, float]]
+        :param encoding_types: Mapping of signal names to encoding types
+        :type encoding_types: Dict[str, LinSignalEncodingType]
+        :returns: Group image
+        :rtype: bytearray
+        :raises: LookupError if a signal is not part of the group, ValueError if a value cannot
+            be encoded
+        """
+        return self.encode_raw(self._convert(data, encoding_types))
+
+    def _convert(self, data: Dict[str, Union[str, int, float, List[int]]],
+                 encoding_types: Dict[str, 'LinSignalEncodingType'] = None) -> Dict[str, Union[int, List[int]]]:
+        converted = {}
+        for (signal_name, value) in data.items():
+            field = self._fields.get(signal_name)
+            if field is None:
+                raise LookupError(f"No signal named '{signal_name}' found in {self.name}!")
+            converted[signal_name] = field.encode(value, encoding_types)
+        return converted
+
+    def decode_raw(self, data: bytearray) -> Dict[str, Union[int, List[int]]]:
+        """
+        Decodes the group image into raw signal values
+
+        :param data: Group image
+        :type data: bytearray
+        :returns: Mapping of signal names to raw values
+        :rtype: Dict[str, int]
+        """
+        image = int.from_bytes(data, "little")
+        return {name: field.extract(image) for (name, field) in self._fields.items()}
+
+    def decode(self, data: bytearray,
+               encoding_types: Dict[str, 'LinSignalEncodingType'] = None,
+               keep_unit: bool = False) -> Dict[str, Union[str, int, float]]:
+        """
+        Decodes the group image using the signals' encoding types
+
+        :param data: Group image
+        :type data: bytearray
+        :param encoding_types: Mapping of signal names to encoding types
+        :type encoding_types: Dict[str, LinSignalEncodingType]
+        :param keep_unit: Whether physical values should keep their units
+        :type keep_unit: bool
+        :returns: Mapping of signal names to values
+        :rtype: Dict[str, Union[str, int, float]]
+        """
+        image = int.from_bytes(data, "little")
+        return {name: field.decode(field.extract(image), encoding_types, keep_unit)
+                for (name, field) in self._fields.items()}
+
+    def get_frame_offset(self, frame: 'LinUnconditionalFrame') -> int:
+        """
+        Returns the bit offset of the group inside the given frame
+
+        :param frame: Frame that contains the group
+        :type frame: LinUnconditionalFrame
+        :returns: Offset of the group's first bit
+        :rtype: int
+        :raises: LookupError if the frame doesn't contain every member signal at the same
+            relative position with the same byte order
+        """
+        offsets = set()
+        for (name, field) in self._fields.items():
+            frame_field = frame._fields.get(name)
+            if frame_field is None:
+                raise LookupError(f"{frame.name} doesn't contain {name} of {self.name}")
+            offsets.add(frame_field.offset - field.offset)
+        if len(offsets) != 1 or frame.byte_order != self.byte_order:
+            raise LookupError(f"{frame.name} doesn't contain the layout of {self.name}")
+        offset = offsets.pop()
+        if offset % 8 != 0 and self.byte_order != LIN_BYTE_ORDER_LITTLE_ENDIAN:
+            # big endian signals are split at byte boundaries, the group has to be byte aligned
+            raise LookupError(f"{frame.name} doesn't contain the layout of {self.name}")
+        return offset
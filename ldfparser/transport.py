@@ -0,0 +1,363 @@
+"""
+LIN transport layer, segmentation and reassembly of diagnostic messages
+
+Diagnostic messages longer than 6 bytes are transported in a first frame followed by consecutive
+frames, see LIN 2.1 Specification, section 3.2.
+"""
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .diagnostics import LIN_PCI_CONSECUTIVE_FRAME, LIN_PCI_FIRST_FRAME, LIN_PCI_SINGLE_FRAME, pci_byte
+from .node import LinSlave
+
+# Largest message that fits into the 12 bit length of a first frame
+LIN_TRANSPORT_MAX_LENGTH = 4095
+
+# Data bytes carried by each frame type
+_SINGLE_FRAME_DATA = 6
+_FIRST_FRAME_DATA = 5
+_CONSECUTIVE_FRAME_DATA = 6
+
+_PADDING = b'\xFF' * 6
+
+class LinTransportTiming(NamedTuple):
+    """
+    Transport layer timing parameters of a node in seconds
+
+    :param st_min: Minimum time between two frames of a request sent to the node
+    :type st_min: float
+    :param n_as_timeout: Maximum time until a frame that's ready is transmitted
+    :type n_as_timeout: float
+    :param n_cr_timeout: Maximum time between two frames of a received message
+    :type n_cr_timeout: float
+    """
+    st_min: float = 0
+    n_as_timeout: float = 1
+    n_cr_timeout: float = 1
+
+class LinTransportPdu(NamedTuple):
+    """
+    A complete diagnostic message
+
+    :param nad: Node address
+    :type nad: int
+    :param data: Message content starting with the (response) service identifier
+    :type data: bytes
+    :param timestamp: Time when the last frame of the message was received
+    :type timestamp: float
+    """
+    nad: int
+    data: bytes
+    timestamp: Optional[float] = None
+
+    @property
+    def sid(self) -> int:
+        """Returns the (response) service identifier of the message"""
+        return self.data[0]
+
+def transport_timings(slaves: Iterable[LinSlave]) -> Dict[int, LinTransportTiming]:
+    """
+    Returns the transport layer timing of slave nodes indexed by their configured and initial
+    node addresses
+
+    :param slaves: Slave nodes
+    :type slaves: Iterable[LinSlave]
+    :returns: Timing parameters indexed by node address
+    :rtype: Dict[int, LinTransportTiming]
+    """
+    timings = {}
+    for slave in slaves:
+        timing = LinTransportTiming(slave.st_min, slave.n_as_timeout, slave.n_cr_timeout)
+        for nad in (slave.configured_nad, slave.initial_nad):
+            if nad is not None:
+                timings.setdefault(nad, timing)
+    return timings
+
+def segment_pdu(nad: int, data: bytes) -> List[bytes]:
+    """
+    Segments a diagnostic message into frames
+
+    Example:
+    >>> segment_pdu(0x01, bytes([0xB2, 0x00, 0xFF, 0x7F, 0xFF, 0xFF]))
+    [b'\x01\x06\xb2\x00\xff\x7f\xff\xff']
+
+    :param nad: Node address
+    :type nad: int
+    :param data: Message content starting with the service identifier
+    :type data: bytes
+    :returns: Frame contents, a single frame or a first frame followed by consecutive frames,
+        unused bytes of the last frame are filled with 0xFF
+    :rtype: List[bytes]
+    :raises: ValueError if the message is empty or longer than `LIN_TRANSPORT_MAX_LENGTH`
+    """
+    length = len(data)
+    if length == 0 or length > LIN_TRANSPORT_MAX_LENGTH:
+        raise ValueError(f"message length {length} is invalid, must be 1-{LIN_TRANSPORT_MAX_LENGTH}")
+    data = bytes(data)
+    if length <= _SINGLE_FRAME_DATA:
+        return [bytes((nad, pci_byte(LIN_PCI_SINGLE_FRAME, length))) + data + _PADDING[length:]]
+    frames = [bytes((nad, pci_byte(LIN_PCI_FIRST_FRAME, length >> 8), length & 0xFF)) + data[:_FIRST_FRAME_DATA]]
+    counter = 1
+    for position in range(_FIRST_FRAME_DATA, length, _CONSECUTIVE_FRAME_DATA):
+        chunk = data[position:position + _CONSECUTIVE_FRAME_DATA]
+        frames.append(bytes((nad, pci_byte(LIN_PCI_CONSECUTIVE_FRAME, counter))) + chunk +
+                      _PADDING[len(chunk):])
+        counter = (counter + 1) & 0x0F
+    return frames
+
+class _LinTransportMessage():
+    """
+    Message being reassembled, the buffer is allocated once with the length from the first frame
+    """
+    __slots__ = ('buffer', 'position', 'counter', 'timestamp')
+
+    def __init__(self, length: int, timestamp: Optional[float]) -> None:
+        self.buffer = bytearray(length)
+        self.position = 0
+        self.counter = 1
+        self.timestamp = timestamp
+
+class LinTransportReceiver():
+    """
+    LinTransportReceiver reassembles diagnostic frames into complete messages
+
+    Messages of different nodes are reassembled independently, so interleaved traffic of multiple
+    nodes can be received. Each message is copied into a buffer allocated once when its first
+    frame is received.
+
+    :Example:
+
+    ```
+    receiver = LinTransportReceiver(ldf.get_slaves())
+    for (timestamp, data) in slave_responses:
+        pdu = receiver.receive(data, timestamp)
+        if pdu is not None:
+            print(pdu.nad, pdu.data.hex())
+    ```
+
+    :param slaves: Slave nodes whose `N_Cr_timeout` applies to their messages
+    :type slaves: Iterable[LinSlave]
+    :param timing: Timing of nodes that aren't in `slaves`
+    :type timing: LinTransportTiming
+    """
+
+    def __init__(self, slaves: Iterable[LinSlave] = (), timing: LinTransportTiming = LinTransportTiming()) -> None:
+        self.timing = timing
+        self._timings: Dict[int, LinTransportTiming] = transport_timings(slaves)
+        self._messages: Dict[int, _LinTransportMessage] = {}
+
+    @property
+    def pending(self) -> List[int]:
+        """Returns the addresses of nodes with partially received messages"""
+        return list(self._messages.keys())
+
+    def reset(self) -> None:
+        """Discards all partially received messages"""
+        self._messages.clear()
+
+    def discard(self, nad: int) -> None:
+        """Discards the partially received message of a node"""
+        self._messages.pop(nad, None)
+
+    def receive(self, data: bytes, timestamp: float = None) -> Optional[LinTransportPdu]:
+        """
+        Processes a received diagnostic frame
+
+        A new single or first frame replaces a message of the same node that's still being
+        received. Timeouts are only checked when timestamps are given.
+
+        :param data: Frame content
+        :type data: bytes
+        :param timestamp: Reception time in seconds
+        :type timestamp: float
+        :returns: The message if the frame completed it, otherwise `None`
+        :rtype: LinTransportPdu
+        :raises: ValueError if the frame is malformed or unexpected, TimeoutError if the
+            consecutive frame arrived after `N_Cr_timeout`, in both cases the node's message is
+            discarded
+        """
+        if len(data) < 2:
+            raise ValueError(f"frame of {len(data)} bytes has no NAD and PCI")
+        nad = data[0]
+        pci = data[1]
+        pci_type = pci >> 4
+        if pci_type == LIN_PCI_SINGLE_FRAME:
+            length = pci & 0x0F
+            self._messages.pop(nad, None)
+            if length == 0 or length > _SINGLE_FRAME_DATA:
+                raise ValueError(f"single frame of node 0x{nad:02x} has invalid length {length}")
+            return LinTransportPdu(nad, bytes(data[2:2 + length]), timestamp)
+        if pci_type == LIN_PCI_FIRST_FRAME:
+            # a first frame cut off before its length byte is rejected as too short
+            length = ((pci & 0x0F) << 8) | data[2] if len(data) > 2 else 0
+            if length <= _SINGLE_FRAME_DATA:
+                self._messages.pop(nad, None)
+                raise ValueError(f"first frame of node 0x{nad:02x} has invalid length {length}")
+            message = _LinTransportMessage(length, timestamp)
+            message.buffer[0:_FIRST_FRAME_DATA] = data[3:3 + _FIRST_FRAME_DATA]
+            message.position = _FIRST_FRAME_DATA
+            self._messages[nad] = message
+            return None
+        if pci_type == LIN_PCI_CONSECUTIVE_FRAME:
+            return self._receive_consecutive_frame(nad, pci, data, timestamp)
+        raise ValueError(f"frame of node 0x{nad:02x} has unknown PCI type {pci_type}")
+
+    def _receive_consecutive_frame(self, nad: int, pci: int, data: bytes,
+                                   timestamp: Optional[float]) -> Optional[LinTransportPdu]:
+        message = self._messages.get(nad)
+        if message is None:
+            raise ValueError(f"unexpected consecutive frame of node 0x{nad:02x}")
+        if timestamp is not None and message.timestamp is not None and \
+                timestamp - message.timestamp > self._timings.get(nad, self.timing).n_cr_timeout:
+            del self._messages[nad]
+            raise TimeoutError(f"N_Cr timeout of node 0x{nad:02x} elapsed")
+        if pci & 0x0F != message.counter:
+            del self._messages[nad]
+            raise ValueError(f"consecutive frame of node 0x{nad:02x} out of sequence, "
+                             f"expected {message.counter}, got {pci & 0x0F}")
+        buffer = message.buffer
+        position = message.position
+        end = min(position + _CONSECUTIVE_FRAME_DATA, len(buffer))
+        buffer[position:end] = data[2:2 + end - position]
+        if end == len(buffer):
+            del self._messages[nad]
+            return LinTransportPdu(nad, bytes(buffer), timestamp)
+        message.position = end
+        message.counter = (message.counter + 1) & 0x0F
+        message.timestamp = timestamp
+        return None
+
+    def expire(self, timestamp: float) -> List[int]:
+        """
+        Discards messages whose next consecutive frame wasn't received within `N_Cr_timeout`
+
+        :param timestamp: Current time in seconds
+        :type timestamp: float
+        :returns: Addresses of the nodes whose messages timed out
+        :rtype: List[int]
+        """
+        expired = [nad for (nad, message) in self._messages.items()
+                   if message.timestamp is not None and
+                   timestamp - message.timestamp > self._timings.get(nad, self.timing).n_cr_timeout]
+        for nad in expired:
+            del self._messages[nad]
+        return expired
+
+    def receive_stream(self, records: Iterable[Tuple[Optional[float], bytes]],
+                       skip_errors: bool = False) -> Iterator[LinTransportPdu]:
+        """
+        Reassembles a stream of diagnostic frames
+
+        :param records: Pairs of reception times and frame contents
+        :type records: Iterable[Tuple[float, bytes]]
+        :param skip_errors: If True, malformed frames and timed out messages are skipped,
+            otherwise the error is raised
+        :type skip_errors: bool
+        :returns: The complete messages
+        :rtype: Iterator[LinTransportPdu]
+        """
+        receive = self.receive
+        for (timestamp, data) in records:
+            try:
+                pdu = receive(data, timestamp)
+            except (ValueError, TimeoutError):
+                if skip_errors:
+                    continue
+                raise
+            if pdu is not None:
+                yield pdu
+
+class LinTransportSender():
+    """
+    LinTransportSender segments diagnostic messages into master request frames
+
+    Messages are sent in the order they were queued, frames of a message are spaced at least
+    `ST_min` of the addressed node apart. A frame must be transmitted within `N_As_timeout`
+    after it's ready, otherwise the message is discarded.
+
+    :Example:
+
+    ```
+    sender = LinTransportSender(ldf.get_slaves())
+    sender.send(0x01, bytes([0xB4, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07]), timestamp=0.0)
+    # in every master request slot of the schedule
+    data = sender.next_frame(timestamp)
+    ```
+
+    :param slaves: Slave nodes whose `ST_min` and `N_As_timeout` apply to their requests
+    :type slaves: Iterable[LinSlave]
+    :param timing: Timing of nodes that aren't in `slaves`
+    :type timing: LinTransportTiming
+    """
+
+    def __init__(self, slaves: Iterable[LinSlave] = (), timing: LinTransportTiming = LinTransportTiming()) -> None:
+        self.timing = timing
+        self._timings: Dict[int, LinTransportTiming] = transport_timings(slaves)
+        # (node address, remaining frames) of each queued message
+        self._queue: Deque[Tuple[int, Deque[bytes]]] = deque()
+        # time when the next frame is ready to be transmitted
+        self._ready: Optional[float] = None
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of messages waiting to be sent"""
+        return len(self._queue)
+
+    def send(self, nad: int, data: bytes, timestamp: float = None) -> int:
+        """
+        Queues a diagnostic message
+
+        :param nad: Node address
+        :type nad: int
+        :param data: Message content starting with the service identifier
+        :type data: bytes
+        :param timestamp: Current time in seconds
+        :type timestamp: float
+        :returns: Number of frames the message was segmented into
+        :rtype: int
+        :raises: ValueError if the message length is invalid
+        """
+        frames = segment_pdu(nad, data)
+        if not self._queue:
+            self._ready = timestamp
+        self._queue.append((nad, deque(frames)))
+        return len(frames)
+
+    def next_frame(self, timestamp: float = None) -> Optional[bytes]:
+        """
+        Returns the frame to transmit in the current master request slot
+
+        Timing is only enforced when timestamps are given.
+
+        :param timestamp: Time of the master request slot in seconds
+        :type timestamp: float
+        :returns: The frame content or `None` if there's nothing to send or `ST_min` hasn't
+            elapsed yet
+        :rtype: bytes
+        :raises: TimeoutError if the frame was ready for longer than `N_As_timeout`, the
+            message is discarded
+        """
+        if not self._queue:
+            return None
+        (nad, frames) = self._queue[0]
+        timing = self._timings.get(nad, self.timing)
+        ready = self._ready
+        if timestamp is not None and ready is not None:
+            if timestamp < ready:
+                return None
+            if timestamp - ready > timing.n_as_timeout:
+                self._queue.popleft()
+                self._ready = timestamp
+                raise TimeoutError(f"N_As timeout of node 0x{nad:02x} elapsed")
+        data = frames.popleft()
+        if frames:
+            self._ready = None if timestamp is None else timestamp + timing.st_min
+        else:
+            self._queue.popleft()
+            self._ready = timestamp
+        return data
+
+    def cancel(self) -> None:
+        """Discards all queued messages"""
+        self._queue.clear()
+        self._ready = None
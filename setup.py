@@ -26,6 +26,7 @@ setup(
             "pytest-cov",
             "pytest-benchmark",
             "jsonschema",
+            "numpy",
             # Linting
             "pylint",
             "flake8"
@@ -0,0 +1,160 @@
+import csv
+import io
+import json
+import os
+import pytest
+
+from ldfparser.analysis import (LinFrameTiming, ScheduleIndex, SignalRefresh, bus_load, frame_timings,
+                                schedule_table_load, signal_refresh, write_csv, write_json)
+from ldfparser.parser import parse_ldf
+from ldfparser.schedule import LinFrameEntry, ScheduleTable, SlaveResponseEntry
+from ldfparser.frame import LinUnconditionalFrame
+
+ldf_directory = os.path.join(os.path.dirname(__file__), 'ldf')
+
+@pytest.mark.unit
+class TestFrameTimings:
+
+    def test_nominal(self):
+        timings = frame_timings(19200)
+        assert len(timings) == 9
+        assert timings[8].nominal == pytest.approx((34 + 90) / 19200)
+        assert timings[2].nominal == pytest.approx((34 + 30) / 19200)
+
+    def test_maximum(self):
+        assert frame_timings(19200)[8].maximum == pytest.approx((48 + 90 * 1.4) / 19200)
+        expected = LinFrameTiming(pytest.approx(54 / 10000), pytest.approx((24 + 20 * 1.3) / 10000))
+        assert frame_timings(10000, 24, 0.3)[1] == expected
+
+    def test_cached(self):
+        assert frame_timings(19200, 48, 0.4) is frame_timings(19200, 48, 0.4)
+
+    @pytest.mark.parametrize('baudrate', [0, None, -19200])
+    def test_invalid_baudrate(self, baudrate):
+        with pytest.raises(ValueError):
+            frame_timings(baudrate)
+
+def create_entry(entry, delay):
+    entry.delay = delay
+    return entry
+
+@pytest.mark.unit
+class TestScheduleTableLoad:
+
+    @pytest.fixture
+    def table(self):
+        frame = LinUnconditionalFrame(0x10, 'Frame', 2, {})
+        frame_entry = create_entry(LinFrameEntry(), 0.01)
+        frame_entry.frame = frame
+        table = ScheduleTable('Table')
+        table.schedule = [frame_entry, create_entry(SlaveResponseEntry(), 0.01)]
+        return table
+
+    def test_load(self, table):
+        timings = frame_timings(19200)
+        load = schedule_table_load(table, timings)
+        assert [(slot.name, slot.length) for slot in load.slots] == [('Frame', 2), ('SlaveResp', 8)]
+        assert load.cycle_time == pytest.approx(0.02)
+        assert load.nominal_load == pytest.approx((timings[2].nominal + timings[8].nominal) / 0.02)
+        assert load.maximum_load == pytest.approx((timings[2].maximum + timings[8].maximum) / 0.02)
+        assert load.overruns == []
+
+    def test_overrun(self, table):
+        load = schedule_table_load(table, frame_timings(19200), jitter=0.001)
+        assert [slot.name for slot in load.overruns] == ['SlaveResp']
+        assert load.to_dict()['slots'][1]['overrun'] is True
+
+    def test_empty(self):
+        load = schedule_table_load(ScheduleTable('Empty'), frame_timings(19200))
+        assert (load.cycle_time, load.nominal_load, load.maximum_load) == (0, 0.0, 0.0)
+
+@pytest.mark.unit
+class TestBusLoad:
+
+    def test_all_tables(self):
+        ldf = parse_ldf(os.path.join(ldf_directory, 'lin22.ldf'))
+        loads = bus_load(ldf)
+        assert [load.table.name for load in loads] == [table.name for table in ldf.get_schedule_tables()]
+
+    def test_selected_tables(self):
+        ldf = parse_ldf(os.path.join(ldf_directory, 'lin22.ldf'))
+        (load, ) = bus_load(ldf, ['Normal_Schedule'])
+        assert [slot.name for slot in load.slots] == ['CEM_Frm1', 'LSM_Frm2', 'RSM_Frm2', 'Node_Status_Event']
+        assert load.slots[3].length == 2
+        assert load.cycle_time == pytest.approx(0.055)
+        with pytest.raises(LookupError):
+            bus_load(ldf, ['NotExistingSchedule'])
+
+    def test_master_timing_parameters(self):
+        ldf = parse_ldf(os.path.join(ldf_directory, 'j2602_1.ldf'))
+        (load, ) = bus_load(ldf)
+        timings = frame_timings(ldf.get_baudrate(), 24, 0.3)
+        assert load.slots[0].maximum == timings[load.slots[0].length].maximum
+
+    def test_sporadic_frames(self):
+        ldf = parse_ldf(os.path.join(ldf_directory, 'ldf_with_sporadic_frames.ldf'))
+        (load, ) = bus_load(ldf)
+        assert load.slots[0].name == 'SF_REQ_POST_RUN'
+        assert load.slots[0].length == max(frame.length for frame in ldf.get_sporadic_frame('SF_REQ_POST_RUN').frames)
+
+    def test_slot_overruns(self):
+        ldf = parse_ldf(os.path.join(ldf_directory, 'lin_schedules.ldf'))
+        (load, ) = bus_load(ldf, ['Diagnostic_Schedule'])
+        assert [slot.name for slot in load.overruns] == ['MasterReq', 'SlaveResp']
+
+@pytest.mark.unit
+class TestScheduleIndex:
+
+    def test_slots(self):
+        ldf = parse_ldf(os.path.join(ldf_directory, 'lin22.ldf'))
+        index = ScheduleIndex(ldf.get_schedule_tables())
+        assert index.cycle_time('Normal_Schedule') == pytest.approx(0.055)
+        assert index.slots('Normal_Schedule', 'LSM_Frm2') == [(pytest.approx(0.015), 1, False)]
+        assert index.slots('Normal_Schedule', 'LSM_Frm1') == [(pytest.approx(0.045), 3, True)]
+        assert index.slots('Normal_Schedule', 'NotExistingFrame') == []
+        with pytest.raises(LookupError):
+            index.slots('NotExistingSchedule', 'LSM_Frm1')
+
+@pytest.mark.unit
+class TestSignalRefresh:
+
+    @pytest.fixture
+    def ldf(self):
+        return parse_ldf(os.path.join(ldf_directory, 'lin22.ldf'))
+
+    def test_single_slot(self, ldf):
+        (refresh, ) = signal_refresh(ldf, [ldf.get_signal('InternalLightsRequest')], ['Normal_Schedule'])
+        assert (refresh.signal, refresh.table, refresh.count) == ('InternalLightsRequest', 'Normal_Schedule', 1)
+        assert (refresh.minimum, refresh.average, refresh.maximum) == pytest.approx((0.055, 0.055, 0.055))
+        timing = frame_timings(ldf.get_baudrate())[ldf.get_frame('CEM_Frm1').length]
+        assert refresh.latency == pytest.approx(0.055 + timing.maximum + ldf.get_master().jitter)
+        assert not refresh.conditional
+
+    def test_event_triggered(self, ldf):
+        (refresh, ) = signal_refresh(ldf, [ldf.get_signal('LeftIntLightsSwitch')], ['Normal_Schedule'])
+        assert refresh.conditional
+
+    def test_uneven_slots(self):
+        ldf = parse_ldf(os.path.join(ldf_directory, 'lin22.ldf'))
+        table = ldf.get_schedule_table('Normal_Schedule')
+        table.schedule.insert(2, table.schedule[0])
+        (refresh, ) = signal_refresh(ldf, [ldf.get_signal('InternalLightsRequest')], ['Normal_Schedule'])
+        assert refresh.count == 2
+        assert (refresh.minimum, refresh.average, refresh.maximum) == pytest.approx((0.03, 0.035, 0.04))
+
+    def test_all_signals(self, ldf):
+        results = signal_refresh(ldf)
+        carried = {signal.name for signal in ldf.get_signals() if signal.frames}
+        assert {refresh.signal for refresh in results} == carried
+        assert {refresh.table for refresh in results} <= {table.name for table in ldf.get_schedule_tables()}
+
+    def test_export(self, ldf):
+        results = signal_refresh(ldf, tables=['Normal_Schedule'])
+        output = io.StringIO()
+        write_json(results, output)
+        assert json.loads(output.getvalue())[0] == json.loads(json.dumps(results[0].to_dict()))
+        output = io.StringIO(newline='')
+        write_csv(results, output)
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        assert rows[0] == list(SignalRefresh._fields)
+        assert len(rows) == len(results) + 1
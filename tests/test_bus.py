@@ -0,0 +1,123 @@
+import os
+import pytest
+
+from ldfparser.bus import LIN_SYNC_BYTE, build_schedule_cycle, build_wire_frame
+from ldfparser.checksum import checksum, protected_id
+from ldfparser.frame import LinUnconditionalFrame
+from ldfparser.lin import LIN_VERSION_2_1
+from ldfparser.parser import parse_ldf
+from ldfparser.signal import LinSignal
+
+@pytest.fixture(scope="module")
+def ldf():
+    path = os.path.join(os.path.dirname(__file__), "ldf", "lin22.ldf")
+    return parse_ldf(path)
+
+@pytest.mark.unit
+class TestBuildWireFrame:
+
+    def test_unconditional_frame(self, ldf):
+        frame = ldf.get_frame('LSM_Frm1')
+        wire = build_wire_frame(frame, {'LeftIntLightsSwitch': 'Off'}, ldf.get_protocol_version())
+        assert wire == bytearray([LIN_SYNC_BYTE, 0x42, 0x00, 0x00, 0xBD])
+
+    def test_default_values(self, ldf):
+        frame = ldf.get_frame('LSM_Frm1')
+        wire = build_wire_frame(frame, None, ldf.get_protocol_version())
+        assert wire[2:-1] == frame.default_payload
+
+    def test_invalid_default_values(self):
+        frame = LinUnconditionalFrame(0x10, 'Frame', 1, {0: LinSignal('Signal', 4, 0x1F)})
+        with pytest.raises(ValueError):
+            build_wire_frame(frame, None, LIN_VERSION_2_1)
+        assert build_wire_frame(frame, {'Signal': 1}, LIN_VERSION_2_1)[2] == 0x01
+
+    def test_event_triggered_frame(self, ldf):
+        frame = ldf.get_frame('Node_Status_Event')
+        wire = build_wire_frame(frame, {'LeftIntLightsSwitch': 'Off'}, ldf.get_protocol_version())
+        assert wire[:4] == bytearray([LIN_SYNC_BYTE, protected_id(0x06), protected_id(0x02), 0x00])
+        assert wire[-1] == checksum(0x06, wire[2:-1], ldf.get_protocol_version())
+
+    def test_event_triggered_frame_unknown_signal(self, ldf):
+        frame = ldf.get_frame('Node_Status_Event')
+        with pytest.raises(LookupError):
+            build_wire_frame(frame, {'LSMerror': 0}, ldf.get_protocol_version())
+
+@pytest.mark.unit
+class TestBuildScheduleCycle:
+
+    def test_frames(self, ldf):
+        table = ldf.get_schedule_table('Normal_Schedule')
+        cycle = build_schedule_cycle(table, ldf.get_protocol_version(),
+                                     {'CEM_Frm1': {'InternalLightsRequest': 'on'}})
+        expected = build_wire_frame(ldf.get_frame('CEM_Frm1'), {'InternalLightsRequest': 'on'},
+                                    ldf.get_protocol_version())
+        for frame in ['LSM_Frm2', 'RSM_Frm2', 'Node_Status_Event']:
+            expected += build_wire_frame(ldf.get_frame(frame), None, ldf.get_protocol_version())
+        assert cycle == expected
+
+    def test_diagnostic_entries(self, ldf):
+        cycle = build_schedule_cycle(ldf.get_schedule_table('SRF_schedule'), ldf.get_protocol_version())
+        assert cycle == bytearray([LIN_SYNC_BYTE, 0x7D])
+        cycle = build_schedule_cycle(ldf.get_schedule_table('Configuration_Schedule'),
+                                     ldf.get_protocol_version())
+        assert cycle[-11:] == bytearray([LIN_SYNC_BYTE, 0x3C, 1, 2, 3, 4, 5, 6, 7, 8, 0xDB])
+
+@pytest.mark.unit
+class TestLinBusDecoder:
+
+    def test_decode(self, ldf):
+        decoder = ldf.bus_decoder()
+        (frame, values) = decoder.decode(0x42, b'\x00\x00')
+        assert frame is ldf.get_frame('LSM_Frm1')
+        assert values == {'LeftIntLightsSwitch': 'Off'}
+
+    def test_decode_raw(self, ldf):
+        decoder = ldf.bus_decoder()
+        assert decoder.decode_raw(0x42, b'\x00\x05')[1] == {'LeftIntLightsSwitch': 5}
+
+    def test_decode_keep_unit(self, ldf):
+        decoder = ldf.bus_decoder(keep_unit=True)
+        assert decoder.decode(0x42, b'\x00\x05')[1] == {'LeftIntLightsSwitch': '105.000 lux'}
+
+    @pytest.mark.parametrize('pid', [0x02, 0x7F, 0x3C, 0x100])
+    def test_decode_unknown(self, ldf, pid):
+        decoder = ldf.bus_decoder()
+        with pytest.raises(LookupError):
+            decoder.decode(pid, b'\x00\x00')
+
+    def test_decode_stream(self, ldf):
+        decoder = ldf.bus_decoder()
+        records = [(0x42, b'\x00\x00'), (0x02, b'\x00\x00'), (0x142, b'\x00\x00'), (0xC1, b'\x01')]
+        decoded = list(decoder.decode_stream(records, skip_unknown=True))
+        assert [frame.name for (frame, _) in decoded] == ['LSM_Frm1', 'CEM_Frm1']
+        assert decoded[1][1] == {'InternalLightsRequest': 'on'}
+        with pytest.raises(LookupError):
+            list(decoder.decode_stream(records))
+
+    @pytest.mark.parametrize('pid', [0x142, -1])
+    def test_decode_stream_invalid_pid(self, ldf, pid):
+        decoder = ldf.bus_decoder()
+        with pytest.raises(LookupError):
+            list(decoder.decode_stream([(pid, b'\x00\x00')]))
+
+    def test_decode_event_triggered_frame(self, ldf):
+        decoder = ldf.bus_decoder()
+        (frame, values) = decoder.decode(0x06, b'\x42\x00')
+        assert frame is ldf.get_frame('LSM_Frm1')
+        assert frame.publisher.name == 'LSM'
+        assert values == {'LeftIntLightsSwitch': 'Off'}
+        assert decoder.get_frame(0x06) is ldf.get_frame('Node_Status_Event')
+
+    def test_decode_stream_event_triggered_collision(self, ldf):
+        decoder = ldf.bus_decoder()
+        records = [(0x06, b'\xFF\xFF'), (0x06, b'\x42\x00')]
+        decoded = list(decoder.decode_stream(records, skip_unknown=True))
+        assert [frame.name for (frame, _) in decoded] == ['LSM_Frm1']
+
+    def test_decode_diagnostic_frames(self):
+        path = os.path.join(os.path.dirname(__file__), "ldf", "lin_diagnostics.ldf")
+        ldf = parse_ldf(path)
+        (frame, values) = ldf.bus_decoder().decode(0x7D, b'\x01\x02\x03\x04\x05\x06\x07\x08')
+        assert frame.frame_id == 0x3D
+        assert list(values.values()) == [1, 2, 3, 4, 5, 6, 7, 8]
@@ -0,0 +1,73 @@
+import pytest
+
+from ldfparser.checksum import (LIN_CHECKSUM_CLASSIC, LIN_CHECKSUM_ENHANCED, checksum,
+                                checksum_type, checksums, classic_checksum, enhanced_checksum,
+                                frame_id_of, protected_id, validate_frames)
+from ldfparser.lin import LIN_VERSION_1_3, LIN_VERSION_2_1, ISO17987_2015, J2602Version
+
+@pytest.mark.parametrize(
+    ('frame_id', 'expected'),
+    [
+        (0x00, 0x80),
+        (0x01, 0xC1),
+        (0x0A, 0xCA),
+        (0x3C, 0x3C),
+        (0x3D, 0x7D),
+        (0x3F, 0xBF)
+    ]
+)
+@pytest.mark.unit
+def test_protected_id(frame_id, expected):
+    assert protected_id(frame_id) == expected
+    assert frame_id_of(expected) == frame_id
+
+@pytest.mark.unit
+def test_protected_id_invalid():
+    with pytest.raises(ValueError):
+        protected_id(64)
+    with pytest.raises(ValueError):
+        frame_id_of(0x0A)
+
+@pytest.mark.unit
+def test_enhanced_checksum():
+    assert enhanced_checksum(0x4A, [0x55, 0x93, 0xE5]) == 0xE6
+
+@pytest.mark.unit
+def test_classic_checksum():
+    assert classic_checksum([0x4A, 0x55, 0x93, 0xE5]) == 0xE6
+    assert classic_checksum([0xFF] * 8) == 0x00
+    assert classic_checksum([]) == 0xFF
+
+@pytest.mark.parametrize(
+    ('frame_id', 'version', 'expected'),
+    [
+        (0x0A, LIN_VERSION_1_3, LIN_CHECKSUM_CLASSIC),
+        (0x0A, LIN_VERSION_2_1, LIN_CHECKSUM_ENHANCED),
+        (0x0A, ISO17987_2015, LIN_CHECKSUM_ENHANCED),
+        (0x0A, J2602Version(1, 0, 1), LIN_CHECKSUM_ENHANCED),
+        (0x3C, LIN_VERSION_2_1, LIN_CHECKSUM_CLASSIC),
+        (0x3D, ISO17987_2015, LIN_CHECKSUM_CLASSIC)
+    ]
+)
+@pytest.mark.unit
+def test_checksum_type(frame_id, version, expected):
+    assert checksum_type(frame_id, version) == expected
+
+@pytest.mark.unit
+def test_checksum():
+    assert checksum(0x0A, [0x55, 0x93, 0xE5], LIN_VERSION_2_1) == 0x66
+    assert checksum(0x0A, [0x55, 0x93, 0xE5], LIN_VERSION_1_3) == classic_checksum([0x55, 0x93, 0xE5])
+
+@pytest.mark.unit
+def test_checksums():
+    frames = [(0x0A, [0x55, 0x93, 0xE5]), (0x3C, [0x01] * 8)]
+    assert checksums(frames, LIN_VERSION_2_1) == [0x66, classic_checksum([0x01] * 8)]
+
+@pytest.mark.unit
+def test_validate_frames():
+    frames = [
+        (0xCA, [0x55, 0x93, 0xE5], 0x66),
+        (0xCA, [0x55, 0x93, 0xE5], 0x67),
+        (0x4A, [0x55, 0x93, 0xE5], 0xE6)
+    ]
+    assert validate_frames(frames, LIN_VERSION_2_1) == [True, False, False]
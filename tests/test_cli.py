@@ -20,7 +20,11 @@ from ldfparser.cli import main
     ['ldfparser', '--ldf', './tests/ldf/lin22.ldf', 'frame', '--id', '0x01'],
     ['ldfparser', '--ldf', './tests/ldf/lin22.ldf', 'frame', '--name', 'LSM_Frm1'],
     ['ldfparser', '--ldf', './tests/ldf/lin22.ldf', 'signal', '--list'],
-    ['ldfparser', '--ldf', './tests/ldf/lin22.ldf', 'signal', '--name', 'InternalLightsRequest']
+    ['ldfparser', '--ldf', './tests/ldf/lin22.ldf', 'signal', '--name', 'InternalLightsRequest'],
+    ['ldfparser', '--ldf', './tests/ldf/lin22.ldf', 'busload'],
+    ['ldfparser', '--ldf', './tests/ldf/lin22.ldf', 'busload', '--table', 'Normal_Schedule', '--table', 'MRF_schedule'],
+    ['ldfparser', '--ldf', './tests/ldf/lin22.ldf', 'busload', '--format', 'json'],
+    ['ldfparser', '--ldf', './tests/ldf/lin22.ldf', 'busload', '--format', 'csv', '--output', './tests/tmp/test_cli_busload.csv']
 ])
 def test_valid_commands(command):
     with pytest.raises(SystemExit) as exit_ex, patch.object(sys, 'argv', command):
@@ -32,7 +36,9 @@ def test_valid_commands(command):
     ['ldfparser', '--ldf'],
     ['ldfparser', '--ldf', './tests/ldf/lin22.ldf', 'node', '--slave', 'ABC'],
     ['ldfparser', '--ldf', './tests/ldf/lin22.ldf', 'frame', '--name', 'ABC'],
-    ['ldfparser', '--ldf', './tests/ldf/lin22.ldf', 'signal', '--name', 'ABC']
+    ['ldfparser', '--ldf', './tests/ldf/lin22.ldf', 'signal', '--name', 'ABC'],
+    ['ldfparser', '--ldf', './tests/ldf/lin22.ldf', 'busload', '--table', 'ABC'],
+    ['ldfparser', '--ldf', './tests/ldf/lin22.ldf', 'busload', '--format', 'xml']
 ])
 def test_invalid_commands(command):
     with pytest.raises(SystemExit) as exit_ex, patch.object(sys, 'argv', command):
@@ -0,0 +1,167 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from ldfparser.client import LinDiagnosticClient, LinDiagnosticTransport, LinSimulatedTransport
+from ldfparser.diagnostics import LIN_NAD_BROADCAST_ADDRESS
+from ldfparser.node import LinProductId, LinSlave
+from ldfparser.parser import parse_ldf
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+def product_id_fields(product_id):
+    return (product_id.supplier_id, product_id.function_id, product_id.variant)
+
+def create_slave(name, nad, p2_min=0.001):
+    slave = LinSlave(name)
+    slave.configured_nad = nad
+    slave.initial_nad = nad
+    slave.product_id = LinProductId(0x1234, nad, 1)
+    slave.p2_min = p2_min
+    return slave
+
+@pytest.fixture
+def slaves():
+    return [create_slave(f'Slave{nad}', nad) for nad in range(1, 4)]
+
+@pytest.mark.unit
+class TestLinDiagnosticClient:
+
+    def test_read_product_id(self, slaves):
+        client = LinDiagnosticClient(LinSimulatedTransport(slaves), slaves)
+        assert product_id_fields(run(client.read_product_id(0x02))) == (0x1234, 0x02, 1)
+
+    def test_read_serial_number(self, slaves):
+        transport = LinSimulatedTransport(slaves)
+        transport.get_slave('Slave3').serial_number = 0x12345678
+        client = LinDiagnosticClient(transport, slaves)
+        assert run(client.read_serial_number(0x03)) == 0x12345678
+
+    def test_concurrent_requests(self, slaves):
+        transport = LinSimulatedTransport(slaves)
+        for (index, slave) in enumerate(transport.slaves):
+            slave.identifiers[32] = bytes([index] * 5)
+        client = LinDiagnosticClient(transport, slaves)
+
+        async def read_all():
+            return await asyncio.gather(*(client.read_by_id(nad, 32) for nad in (1, 2, 3, 1)))
+        assert run(read_all()) == [bytes([0] * 5), bytes([1] * 5), bytes([2] * 5), bytes([0] * 5)]
+
+    @pytest.mark.parametrize(('pipeline', 'minimum', 'maximum'), [(True, 0.1, 0.25), (False, 0.3, 1.0)])
+    def test_pipeline(self, pipeline, minimum, maximum):
+        slaves = [create_slave(f'Slave{nad}', nad, p2_min=0.1) for nad in range(1, 4)]
+        client = LinDiagnosticClient(LinSimulatedTransport(slaves), slaves, pipeline=pipeline,
+                                     poll_interval=0.001)
+
+        async def read_all():
+            return await asyncio.gather(*(client.read_product_id(nad) for nad in (1, 2, 3)))
+        start = time.perf_counter()
+        assert [product_id.function_id for product_id in run(read_all())] == [1, 2, 3]
+        assert minimum <= time.perf_counter() - start < maximum
+
+    def test_p2_min(self, slaves):
+        class RecordingTransport(LinSimulatedTransport):
+            async def slave_response(self):
+                headers.append(asyncio.get_event_loop().time())
+                return await super().slave_response()
+        headers = []
+        slaves[0].p2_min = 0.05
+        client = LinDiagnosticClient(RecordingTransport(slaves), slaves)
+
+        async def read():
+            start = asyncio.get_event_loop().time()
+            await client.read_product_id(0x01)
+            return start
+        start = run(read())
+        assert headers[0] - start >= 0.05
+
+    def test_timeout(self, slaves):
+        client = LinDiagnosticClient(LinSimulatedTransport(slaves), slaves, poll_interval=0.001)
+        with pytest.raises(asyncio.TimeoutError):
+            run(client.request(0x10, bytes([0xB2, 0x00, 0xFF, 0x7F, 0xFF, 0xFF]), timeout=0.05))
+
+    def test_timeout_doesnt_block_other_nodes(self, slaves):
+        client = LinDiagnosticClient(LinSimulatedTransport(slaves), slaves, poll_interval=0.001)
+
+        async def read():
+            return await asyncio.gather(client.request(0x10, bytes([0xB6]), timeout=0.05),
+                                        client.read_product_id(0x01), return_exceptions=True)
+        (error, product_id) = run(read())
+        assert isinstance(error, asyncio.TimeoutError)
+        assert product_id_fields(product_id) == (0x1234, 0x01, 1)
+
+    def test_negative_response(self, slaves):
+        client = LinDiagnosticClient(LinSimulatedTransport(slaves), slaves)
+        with pytest.raises(ValueError):
+            run(client.read_by_id(0x01, 40))
+
+    def test_unsupported_service(self, slaves):
+        client = LinDiagnosticClient(LinSimulatedTransport(slaves), slaves)
+        pdu = run(client.request(0x01, bytes([0x22, 0x01])))
+        assert (pdu.nad, pdu.data) == (0x01, b'\x7F\x22\x11')
+        assert pdu.timestamp is not None
+
+    def test_segmented_request_and_response(self, slaves):
+        transport = LinSimulatedTransport(slaves)
+        transport.get_slave('Slave1').handlers[0x22] = lambda data: bytes([0x62]) + data[1:] * 2
+        client = LinDiagnosticClient(transport, slaves)
+        data = bytes([0x22]) + bytes(range(20))
+        pdu = run(client.request(0x01, data))
+        assert (pdu.nad, pdu.data) == (0x01, bytes([0x62]) + bytes(range(20)) * 2)
+
+    def test_transport_error(self, slaves):
+        class FailingTransport(LinDiagnosticTransport):
+            async def master_request(self, data):
+                raise OSError('interface disconnected')
+        client = LinDiagnosticClient(FailingTransport(), slaves)
+        with pytest.raises(OSError):
+            run(client.read_product_id(0x01))
+
+    def test_broadcast(self):
+        slaves = [create_slave('Slave', 0x05)]
+        client = LinDiagnosticClient(LinSimulatedTransport(slaves), slaves)
+        assert product_id_fields(run(client.read_product_id(LIN_NAD_BROADCAST_ADDRESS))) == (0x1234, 0x05, 1)
+
+@pytest.mark.unit
+class TestConfiguration:
+
+    @pytest.fixture
+    def ldf(self):
+        path = os.path.join(os.path.dirname(__file__), 'ldf', 'lin22.ldf')
+        ldf = parse_ldf(path)
+        for slave in ldf.get_slaves():
+            slave.p2_min = 0.001
+        return ldf
+
+    def test_configure(self, ldf):
+        transport = LinSimulatedTransport(ldf.get_slaves())
+        client = LinDiagnosticClient(transport, ldf.get_slaves())
+        run(client.configure(ldf.get_slaves(), save_configuration=True))
+
+        lsm = transport.get_slave('LSM')
+        assert lsm.nad == 0x21
+        assert lsm.saved
+        assert lsm.frame_ids == {0: 0x06, 1: 0xC1, 2: 0x42, 3: 0x03}
+        assert transport.get_slave('RSM').saved
+
+    def test_read_after_configure(self, ldf):
+        slaves = ldf.get_slaves()
+        client = LinDiagnosticClient(LinSimulatedTransport(slaves), slaves)
+
+        async def configure_and_read():
+            await client.configure(slaves)
+            return await asyncio.gather(*(client.read_product_id(slave.configured_nad) for slave in slaves))
+        assert [product_id_fields(product_id) for product_id in run(configure_and_read())] == \
+            [product_id_fields(slave.product_id) for slave in slaves]
+
+@pytest.mark.unit
+def test_get_slave_not_found(slaves):
+    with pytest.raises(LookupError):
+        LinSimulatedTransport(slaves).get_slave('Slave9')
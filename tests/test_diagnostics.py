@@ -1,9 +1,16 @@
+import os
 import pytest
 
 from ldfparser.diagnostics import (
     LIN_PCI_CONSECUTIVE_FRAME, LIN_PCI_FIRST_FRAME, LIN_PCI_SINGLE_FRAME, LIN_SID_DATA_DUMP, LIN_SID_READ_BY_ID,
-    LinDiagnosticFrame, LinDiagnosticRequest, LinDiagnosticResponse, pci_byte, rsid
+    LinDiagnosticFrame, LinDiagnosticRequest, LinDiagnosticResponse, LinDiagnosticResponseFields,
+    assign_frame_id_ranges, encode_configuration, encode_configuration_entry, pci_byte, rsid
 )
+from ldfparser.frame import LinUnconditionalFrame
+from ldfparser.lin import LIN_VERSION_2_0, LIN_VERSION_2_1
+from ldfparser.node import LinProductId, LinSlave
+from ldfparser.parser import parse_ldf
+from ldfparser.schedule import AssignNadEntry, DataDumpEntry, LinFrameEntry, UnassignFrameIdEntry
 from ldfparser.signal import LinSignal
 
 @pytest.mark.parametrize(
@@ -101,3 +108,128 @@ def test_decode_assign_frame_id_response(diagnostic_response):
         'D4': 0xFF,
         'D5': 0xFF
     }
+
+@pytest.mark.unit
+def test_decode_response_fields(diagnostic_response):
+    fields = diagnostic_response.decode_response_fields(b'\x01\x06\xF2\x7F\xFF\xFF\xFF\x01')
+    assert fields == LinDiagnosticResponseFields(0x01, 0x06, 0xF2, 0x7F, 0xFF, 0xFF, 0xFF, 0x01)
+    assert fields.RSID == 0xF2
+    with pytest.raises(ValueError):
+        diagnostic_response.decode_response_fields(b'\x01\x06\xF2')
+
+@pytest.mark.unit
+def test_decode_responses(diagnostic_response):
+    frames = [b'\x00\x01\xF0\xFF\xFF\xFF\xFF\xFF', bytearray(b'\x01\x06\xF2\x7F\xFF\xFF\xFF\x01')]
+    expected = [diagnostic_response.decode_response_fields(frame) for frame in frames]
+    assert diagnostic_response.decode_responses(frames) == expected
+    assert diagnostic_response.decode_responses(b''.join(frames)) == expected
+    with pytest.raises(ValueError):
+        diagnostic_response.decode_responses(b''.join(frames) + b'\x00')
+
+@pytest.mark.unit
+def test_decode_response_custom_layout():
+    frame = LinDiagnosticFrame(0x3D, 'SlaveResp', 2, {
+        0: LinSignal('SlaveRespB0', 8, 0),
+        8: LinSignal('SlaveRespB1', 8, 0)
+    })
+    response = LinDiagnosticResponse(frame)
+    assert response.decode_response(b'\x01\x06') == {'NAD': 0x01, 'PCI': 0x06}
+    assert response.decode_response_fields(b'\x01\x06') == LinDiagnosticResponseFields(NAD=0x01, PCI=0x06)
+    with pytest.raises(ValueError):
+        response.decode_responses(b'\x01\x06')
+
+@pytest.mark.unit
+def test_encode_assign_frame_id(diagnostic_request):
+    data = diagnostic_request.encode_assign_frame_id(0x01, 0x7FFF, 0x1234, 0x80)
+    assert data == b'\x01\x06\xB1\xFF\x7F\x34\x12\x80'
+
+@pytest.mark.unit
+def test_assign_frame_id_ranges():
+    slave = LinSlave('Slave')
+    assert assign_frame_id_ranges(slave) == []
+    slave.configurable_frames = {
+        0: LinUnconditionalFrame(0x01, 'Frame_1', 1, {}),
+        1: LinUnconditionalFrame(0x02, 'Frame_2', 1, {}),
+        9: LinUnconditionalFrame(0x03, 'Frame_3', 1, {})
+    }
+    assert assign_frame_id_ranges(slave) == [(0, [0xC1, 0x42, 0xFF, 0xFF]), (8, [0xFF, 0x03, 0xFF, 0xFF])]
+
+@pytest.mark.unit
+def test_encode_configuration(diagnostic_request):
+    slave = LinSlave('Slave')
+    slave.lin_protocol = LIN_VERSION_2_1
+    slave.initial_nad = 0x01
+    slave.configured_nad = 0x02
+    slave.product_id = LinProductId(0x1234, 0x5678)
+    slave.configurable_frames = {0: LinUnconditionalFrame(0x01, 'Frame_1', 1, {})}
+    legacy = LinSlave('Legacy')
+    legacy.lin_protocol = LIN_VERSION_2_0
+    legacy.initial_nad = legacy.configured_nad = 0x03
+    legacy.configurable_frames = {0x0100: LinUnconditionalFrame(0x02, 'Frame_2', 1, {})}
+
+    assert encode_configuration([slave, legacy], save_configuration=True) == b''.join([
+        diagnostic_request.encode_assign_nad(0x01, 0x1234, 0x5678, 0x02),
+        diagnostic_request.encode_assign_frame_id_range(0x02, 0, [0xC1, 0xFF, 0xFF, 0xFF]),
+        diagnostic_request.encode_save_configuration(0x02),
+        diagnostic_request.encode_assign_frame_id(0x03, 0x7FFF, 0x0100, 0x42),
+        diagnostic_request.encode_save_configuration(0x03)
+    ])
+    assert encode_configuration([slave], assign_nad=False) == \
+        diagnostic_request.encode_assign_frame_id_range(0x02, 0, [0xC1, 0xFF, 0xFF, 0xFF])
+
+    with pytest.raises(ValueError):
+        encode_configuration([LinSlave('Unaddressed')])
+
+@pytest.mark.unit
+def test_encode_configuration_ldf():
+    ldf = parse_ldf(os.path.join(os.path.dirname(__file__), 'ldf', 'iso17987.ldf'))
+    data = encode_configuration(ldf.get_slaves())
+    frames = [data[i:i + 8] for i in range(0, len(data), 8)]
+    assert frames[:2] == [b'\x05\x06\xB7\x00\xC4\x85\x80\x42', b'\x05\x06\xB7\x04\x37\x78\xFF\xFF']
+    assert all(frame[2] == 0xB1 for frame in frames[2:])
+
+@pytest.mark.unit
+def test_encode_configuration_entry(diagnostic_request):
+    ldf = parse_ldf(os.path.join(os.path.dirname(__file__), 'ldf', 'lin22.ldf'))
+    entries = ldf.get_schedule_table('Configuration_Schedule').schedule
+    assert [encode_configuration_entry(entry) for entry in entries] == [
+        diagnostic_request.encode_assign_nad(0x01, 0x4A4F, 0x4841, 0x21),
+        diagnostic_request.encode_assign_frame_id_range(0x21, 0, [0x06, 0xC1, 0x42, 0x03]),
+        diagnostic_request.encode_assign_frame_id_range(0x21, 0, [0x01, 0x02, 0x03, 0x04]),
+        diagnostic_request.encode_conditional_change_nad(0x17, 0x00, 0x20, 0xFF, 0x00, 0x18),
+        diagnostic_request.encode_data_dump(0x21, [1, 2, 3, 4, 5]),
+        diagnostic_request.encode_save_configuration(0x21),
+        diagnostic_request.encode_assign_frame_id(0x20, 0x4E4E, 0x0001, 0xC1),
+        diagnostic_request.encode_assign_frame_id(0x20, 0x4E4E, 0x0002, 0xC4),
+        diagnostic_request.encode_assign_frame_id(0x20, 0x4E4E, 0x0003, 0x85),
+        bytes([1, 2, 3, 4, 5, 6, 7, 8])
+    ]
+
+@pytest.mark.unit
+def test_encode_configuration_entry_unassign(diagnostic_request):
+    ldf = parse_ldf(os.path.join(os.path.dirname(__file__), 'ldf', 'lin22.ldf'))
+    entry = UnassignFrameIdEntry()
+    entry.node = ldf.get_slave('RSM')
+    entry.frame = ldf.get_frame('RSM_Frm1')
+    assert encode_configuration_entry(entry) == diagnostic_request.encode_assign_frame_id(0x20, 0x4E4E, 0x0002, 0x40)
+
+    entry.frame = ldf.get_frame('LSM_Frm1')
+    with pytest.raises(ValueError):
+        encode_configuration_entry(entry)
+    with pytest.raises(ValueError):
+        encode_configuration_entry(LinFrameEntry())
+
+@pytest.mark.unit
+def test_encode_configuration_entry_invalid():
+    ldf = parse_ldf(os.path.join(os.path.dirname(__file__), 'ldf', 'lin22.ldf'))
+    entry = DataDumpEntry()
+    entry.node = ldf.get_slave('LSM')
+    entry.data = [1, 2, 3, 4, 5, 6]
+    with pytest.raises(ValueError, match='DataDumpEntry of LSM'):
+        encode_configuration_entry(entry)
+
+    entry = AssignNadEntry()
+    entry.node = ldf.get_slave('LSM')
+    entry.node.initial_nad = None
+    with pytest.raises(ValueError, match='AssignNadEntry of LSM'):
+        encode_configuration_entry(entry)
@@ -2,7 +2,8 @@ import pytest
 
 from ldfparser.signal import LinSignal
 from ldfparser.encoding import (
-    ASCIIValue, BCDValue, PhysicalValue, LogicalValue, LinSignalEncodingType
+    ASCIIValue, BCDValue, FixedPointScale, FixedPointValue, PhysicalQuantity, PhysicalValue, LogicalValue,
+    LinSignalEncodingType, LIN_VALIDATION_CLAMP, LIN_VALIDATION_STRICT, LIN_VALIDATION_UNCHECKED
 )
 
 @pytest.mark.unit
@@ -69,6 +70,55 @@ def test_decode_physical_valid():
     assert physical_value.decode(0, motor_signal) == 0
     assert abs(physical_value.decode(254, motor_signal) - 100.0) < 0.01
 
+@pytest.mark.unit
+def test_decode_physical_keep_unit():
+    motor_signal = LinSignal('MotorRPM', 8, 0)
+    physical_value = PhysicalValue(0, 254, 0.5, 0, 'rpm')
+    decoded = physical_value.decode(25, motor_signal, keep_unit=True)
+    assert isinstance(decoded, PhysicalQuantity)
+    assert decoded.value == 12.5
+    assert decoded.unit is physical_value.unit
+    assert float(decoded) == 12.5
+    assert str(decoded) == '12.500 rpm'
+    assert f'{decoded:.1f}' == '12.5 rpm'
+    assert decoded == '12.500 rpm'
+    assert decoded == PhysicalQuantity(12.5, 'rpm')
+    assert decoded != PhysicalQuantity(12.5, 'km/h')
+    with pytest.raises(AttributeError):
+        decoded.value = 10.0
+    with pytest.raises(AttributeError):
+        decoded.unit = 'km/h'
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ['scale', 'offset', 'expected'],
+    [
+        (1, 0, FixedPointScale(1, 1, 0)),
+        (0.5, -40, FixedPointScale(1, 2, -80)),
+        (0.3937, 0, FixedPointScale(3937, 10000, 0)),
+        (0.00390625, -512, FixedPointScale(1, 256, -131072)),
+        (0.1, 0.25, FixedPointScale(2, 20, 5))
+    ]
+)
+def test_physical_fixed_point(scale, offset, expected):
+    physical_value = PhysicalValue(0, 254, scale, offset)
+    assert physical_value.fixed_point == expected
+    motor_signal = LinSignal('MotorRPM', 8, 0)
+    for raw in (0, 1, 100, 254):
+        assert physical_value.fixed_point.to_float(raw) == pytest.approx(physical_value.decode(raw, motor_signal))
+
+@pytest.mark.unit
+def test_fixed_point_scale_many():
+    fixed_point = FixedPointScale(1, 2, -80)
+    assert fixed_point.scale(100) == 20
+    assert fixed_point.scale_many([0, 100, 254]) == [-80, 20, 174]
+
+@pytest.mark.unit
+def test_fixed_point_scale_many_numpy():
+    numpy = pytest.importorskip('numpy')
+    fixed_point = FixedPointScale(1, 2, -80)
+    assert list(fixed_point.scale_many(numpy.array([0, 100, 254]))) == [-80, 20, 174]
+
 @pytest.mark.unit
 def test_decode_physical_invalid():
     motor_signal = LinSignal('MotorRPM', 8, 0)
@@ -142,6 +192,7 @@ def test_decode_bcd():
     assert bcd_value.decode([1, 2, 3, 4], LinSignal('Counter', 32, [0, 0, 0, 0])) == 1234
     assert bcd_value.decode([1, 2, 3, 4, 5], LinSignal('Counter', 40, [0, 0, 0, 0, 0])) == 12345
     assert bcd_value.decode([1, 2, 3, 4, 5, 6], LinSignal('Counter', 48, [0, 0, 0, 0, 0, 0])) == 123456
+    assert bcd_value.decode(b'\x01\x02\x03', LinSignal('Counter', 24, [0, 0, 0])) == 123
 
 @pytest.mark.unit
 def test_decode_bcd_invalid_value():
@@ -150,6 +201,56 @@ def test_decode_bcd_invalid_value():
     with pytest.raises(ValueError):
         bcd_value.decode([0x67, 0x67, 0x67], LinSignal('Counter', 24, [0, 0, 0]))
 
+@pytest.mark.unit
+def test_bcd_many():
+    bcd_value = BCDValue()
+    signal = LinSignal('Counter', 24, [0, 0, 0])
+
+    assert bcd_value.encode_many([123, 45, 0], signal) == [b'\x01\x02\x03', b'\x00\x04\x05', b'\x00\x00\x00']
+    assert bcd_value.decode_many([b'\x01\x02\x03', [0, 4, 5]], signal) == [123, 45]
+    assert bcd_value.decode_many(b'\x01\x02\x03\x00\x04\x05', signal) == [123, 45]
+    assert bcd_value.decode_many([b'\x01\x02\x03\x09'], signal) == [123]
+    assert bcd_value.decode_many([], signal) == []
+    with pytest.raises(ValueError):
+        bcd_value.encode_many([1000], signal)
+    with pytest.raises(ValueError):
+        bcd_value.decode_many([b'\x01\x02\x0a'], signal)
+    with pytest.raises(ValueError):
+        bcd_value.decode_many(b'\x01\x02', signal)
+
+@pytest.mark.unit
+def test_bcd_many_numpy():
+    numpy = pytest.importorskip('numpy')
+    bcd_value = BCDValue()
+    signal = LinSignal('Counter', 16, [0, 0])
+
+    assert bcd_value.decode_many(numpy.array([[1, 2], [3, 4]], dtype=numpy.uint8), signal) == [12, 34]
+    with pytest.raises(ValueError):
+        bcd_value.decode_many(numpy.array([[1, 2], [3, 4]], dtype=numpy.uint16), signal)
+
+@pytest.mark.unit
+def test_ascii_many():
+    ascii_value = ASCIIValue()
+    signal = LinSignal('Id', 24, [0, 0, 0])
+
+    assert ascii_value.encode_many(['ABC', 'xyz'], signal) == [b'ABC', b'xyz']
+    assert ascii_value.decode_many([b'ABC', [120, 121, 122]], signal) == ['ABC', 'xyz']
+    assert ascii_value.decode_many(b'ABCxyz', signal) == ['ABC', 'xyz']
+    assert ascii_value.decode_many(b'\xc3\xa9Axyz', signal) == ['\u00e9A', 'xyz']
+    assert ascii_value.decode_many([b'AB', b'ABCD'], signal) == ['AB', 'ABCD']
+
+@pytest.mark.unit
+def test_encoding_type_many():
+    signal = LinSignal('Counter', 16, [0, 0])
+    bcd_type = LinSignalEncodingType('CounterType', [BCDValue()])
+    assert bcd_type.encode_many([12, 34], signal) == [b'\x01\x02', b'\x03\x04']
+    assert bcd_type.decode_many([b'\x01\x02', b'\x03\x04'], signal) == [12, 34]
+
+    motor_signal = LinSignal('MotorRPM', 8, 0)
+    motor_type = LinSignalEncodingType('MotorType', [LogicalValue(0, 'off'), PhysicalValue(1, 254, 1, 0, 'rpm')])
+    assert motor_type.encode_many(['off', 100], motor_signal) == [0, 100]
+    assert motor_type.decode_many([0, 100], motor_signal, keep_unit=True) == ['off', '100.000 rpm']
+
 @pytest.mark.unit
 def test_encode_ascii():
     id_signal = LinSignal('Id', 48, [0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])
@@ -163,6 +264,7 @@ def test_decode_ascii():
     ascii_value = ASCIIValue()
 
     assert ascii_value.decode([65, 66, 67, 49, 50, 51], id_signal) == 'ABC123'
+    assert ascii_value.decode(b'ABC123', id_signal) == 'ABC123'
 
 @pytest.mark.integration
 def test_encode_signal_scalar():
@@ -194,3 +296,154 @@ def test_encode_signal_ascii():
 
     signal_type = LinSignalEncodingType('TextType', [text_value])
     assert signal_type.encode("ABC", text_signal) == [65, 66, 67]
+
+@pytest.mark.unit
+class TestLookupTable:
+
+    @pytest.fixture
+    def signal_type(self):
+        return LinSignalEncodingType('MotorType', [
+            LogicalValue(0, 'off'),
+            PhysicalValue(1, 99, 1, 0, 'rpm'),
+            LogicalValue(255, 'error')
+        ])
+
+    def test_build(self, signal_type):
+        signal = LinSignal('MotorRPM', 8, 0)
+        expected = [[signal_type.decode(value, signal, keep_unit) for value in (0, 1, 99, 255)]
+                    for keep_unit in (False, True)]
+
+        assert signal_type.build_lookup_table(signal) is True
+        assert signal_type.lookup_table_size > 0
+        assert [[signal_type.decode(value, signal, keep_unit) for value in (0, 1, 99, 255)]
+                for keep_unit in (False, True)] == expected
+
+    def test_cached_quantities_are_immutable(self, signal_type):
+        signal = LinSignal('MotorRPM', 8, 0)
+        signal_type.build_lookup_table(signal)
+        decoded = signal_type.decode(99, signal, keep_unit=True)
+        with pytest.raises(AttributeError):
+            decoded.value = 0
+        assert signal_type.decode(99, signal, keep_unit=True) == decoded
+
+    def test_undecodable(self, signal_type):
+        signal = LinSignal('MotorRPM', 8, 0)
+        signal_type.build_lookup_table(signal)
+        with pytest.raises(ValueError):
+            signal_type.decode(100, signal)
+
+    def test_logical_encoding(self, signal_type):
+        signal = LinSignal('MotorRPM', 8, 0)
+        signal_type.build_lookup_table(signal)
+        assert signal_type.encode('error', signal) == 255
+        assert signal_type.encode('50 rpm', signal) == 50
+        with pytest.raises(ValueError):
+            signal_type.encode('on', signal)
+
+    @pytest.mark.parametrize(
+        'signal',
+        [
+            LinSignal('MotorRPM', 16, 0),
+            LinSignal('Array', 8, [0])
+        ]
+    )
+    def test_not_built(self, signal_type, signal):
+        assert signal_type.build_lookup_table(signal) is False
+        assert signal_type.lookup_table_size == 0
+
+    def test_not_built_bcd(self):
+        signal_type = LinSignalEncodingType('CounterType', [BCDValue()])
+        assert signal_type.build_lookup_table(LinSignal('Counter', 8, 0)) is False
+
+@pytest.mark.unit
+def test_decode_signal_fixed_point():
+    motor_signal = LinSignal('MotorRPM', 8, 0)
+    motor_speed = PhysicalValue(1, 99, 1, 0, 'rpm')
+    overdrive = PhysicalValue(100, 254, 0.5, 100)
+    signal_type = LinSignalEncodingType('MotorType', [LogicalValue(0, 'off'), motor_speed, overdrive])
+
+    assert signal_type.decode_fixed_point(0, motor_signal) == FixedPointValue(0, None)
+    assert signal_type.decode_fixed_point(50, motor_signal) == FixedPointValue(50, FixedPointScale(1, 1, 0))
+    assert signal_type.decode_fixed_point(120, motor_signal) == FixedPointValue(120, FixedPointScale(1, 2, 200))
+    with pytest.raises(ValueError):
+        signal_type.decode_fixed_point(255, motor_signal)
+
+@pytest.mark.unit
+class TestValidation:
+
+    @pytest.fixture
+    def signal(self):
+        return LinSignal('MotorRPM', 8, 0)
+
+    @staticmethod
+    def signal_type(validation):
+        return LinSignalEncodingType('MotorType', [
+            LogicalValue(0, 'off'),
+            PhysicalValue(1, 99, 1, 0, 'rpm'),
+            PhysicalValue(150, 200, 2, 0, 'rpm'),
+            LogicalValue(255, 'error')
+        ], validation)
+
+    @pytest.mark.parametrize('validation', [LIN_VALIDATION_STRICT, LIN_VALIDATION_CLAMP, LIN_VALIDATION_UNCHECKED])
+    def test_valid_values(self, signal, validation):
+        reference = self.signal_type(LIN_VALIDATION_STRICT)
+        signal_type = self.signal_type(validation)
+        assert signal_type.validation == validation
+        for value in ('off', 'error', 1, 50.0, '99 rpm', 300, 400):
+            assert signal_type.encode(value, signal) == reference.encode(value, signal)
+        for value in (0, 1, 50, 99, 150, 200, 255):
+            for keep_unit in (False, True):
+                assert signal_type.decode(value, signal, keep_unit) == reference.decode(value, signal, keep_unit)
+
+    def test_strict(self, signal):
+        signal_type = self.signal_type(LIN_VALIDATION_STRICT)
+        with pytest.raises(ValueError):
+            signal_type.encode(150, signal)
+        with pytest.raises(ValueError):
+            signal_type.decode(120, signal)
+
+    def test_clamp(self, signal):
+        signal_type = self.signal_type(LIN_VALIDATION_CLAMP)
+        assert signal_type.encode(-10, signal) == 1
+        assert signal_type.encode(120, signal) == 99
+        assert signal_type.encode(250, signal) == 150
+        assert signal_type.encode('1000 rpm', signal) == 200
+        assert signal_type.decode(120, signal) == 99.0
+        assert signal_type.decode(140, signal) == 300.0
+        assert signal_type.decode(220, signal, keep_unit=True) == '400.000 rpm'
+        with pytest.raises(ValueError):
+            signal_type.encode('on', signal)
+
+    def test_unchecked(self, signal):
+        signal_type = self.signal_type(LIN_VALIDATION_UNCHECKED)
+        assert signal_type.encode(150, signal) == 150
+        assert signal_type.encode(500, signal) == 500
+        assert signal_type.decode(120, signal) == 120.0
+        assert signal_type.decode(180, signal) == 360.0
+
+    @pytest.mark.parametrize('validation', [LIN_VALIDATION_STRICT, LIN_VALIDATION_CLAMP, LIN_VALIDATION_UNCHECKED])
+    def test_numeric_logical_value(self, signal, validation):
+        # the physical value would convert 0 into a raw value outside of its range
+        signal_type = LinSignalEncodingType('SpeedType', [
+            LogicalValue(0),
+            PhysicalValue(1, 254, 10, 100, 'rpm'),
+            LogicalValue(255, 'error')
+        ], validation)
+        assert signal_type.encode(0, signal) == 0
+        assert signal_type.encode(110, signal) == 1
+        assert signal_type.encode('error', signal) == 255
+
+    def test_logical_only(self, signal):
+        signal_type = LinSignalEncodingType('StateType', [LogicalValue(0, 'off'), LogicalValue(1, 'on')],
+                                            LIN_VALIDATION_UNCHECKED)
+        assert signal_type.encode('on', signal) == 1
+        with pytest.raises(ValueError):
+            signal_type.encode('error', signal)
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            self.signal_type('fast')
+        signal_type = self.signal_type(LIN_VALIDATION_STRICT)
+        with pytest.raises(ValueError):
+            signal_type.validation = 'fast'
+        assert signal_type.validation == LIN_VALIDATION_STRICT
@@ -1,8 +1,9 @@
 import pytest
 
-from ldfparser.frame import LinUnconditionalFrame
-from ldfparser.signal import LinSignal
-from ldfparser.encoding import LinSignalEncodingType, LogicalValue, PhysicalValue
+from ldfparser.frame import FrameState, LinEventTriggeredFrame, LinUnconditionalFrame
+from ldfparser.signal import LinSignal, LinSignalGroup
+from ldfparser.encoding import (ASCIIValue, BCDValue, FixedPointScale, FixedPointValue, LinSignalEncodingType,
+                                LogicalValue, PhysicalValue)
 
 @pytest.mark.unit
 def test_frame_raw_encoding():
@@ -72,14 +73,14 @@ def test_frame_raw_encoding_array2():
 def test_frame_raw_decoding_array():
     signal1 = LinSignal('Signal_1', 16, [0, 0])
     frame = LinUnconditionalFrame(1, 'Frame_1', 2, {0: signal1})
-    assert frame.parse_raw(bytearray([1, 2])) == {"Signal_1": [1, 2]}
+    assert frame.parse_raw(bytearray([1, 2])) == {"Signal_1": b'\x01\x02'}
 
 @pytest.mark.unit
 def test_frame_raw_decoding_array2():
     signal1 = LinSignal('Signal_1', 16, [0, 0])
     signal2 = LinSignal('Signal_2', 8, 0)
     frame = LinUnconditionalFrame(1, 'Frame_1', 3, {0: signal1, 16: signal2})
-    assert frame.parse_raw(bytearray([1, 2, 3])) == {"Signal_1": [1, 2], "Signal_2": 3}
+    assert frame.parse_raw(bytearray([1, 2, 3])) == {"Signal_1": b'\x01\x02', "Signal_2": 3}
 
 @pytest.mark.unit
 def test_frame_raw_encoding_out_of_range():
@@ -247,6 +248,49 @@ class TestLinUnconditionalFrameEncodingRaw:
     def test_encode_raw(self, frame, data, expected):
         assert frame.encode_raw(data) == expected
 
+    def test_encode_raw_empty(self, frame):
+        assert frame.encode_raw({}) == frame.default_payload
+
+    def test_encode_raw_invalid_default(self):
+        signal1 = LinSignal('Signal_1', 8, 0)
+        signal2 = LinSignal('Signal_2', 4, 255)
+        frame = LinUnconditionalFrame(1, 'Frame_1', 2, {0: signal1, 8: signal2})
+        assert frame.encode_raw({'Signal_2': 1}) == b'\x00\x01'
+        with pytest.raises(ValueError):
+            frame.encode_raw({'Signal_1': 1})
+
+@pytest.mark.unit
+class TestLinUnconditionalFrameDefaults:
+
+    def test_default_payload(self, frame):
+        assert frame.default_payload == b'\xFF\x3F\x00'
+
+    def test_default_payload_padding(self):
+        signal = LinSignal('Signal_1', 4, 2)
+        frame = LinUnconditionalFrame(1, 'Frame_1', 2, {4: signal}, pad_with_zero=False)
+        assert frame.default_payload == b'\x2F\xFF'
+
+    def test_default_values(self, frame):
+        assert frame.default_values == {
+            'MotorSpeed': 0xFF,
+            'InternalTemperature': 0x3F,
+            'Reserved1': 0,
+            'InternalError': 0,
+            'CommError': 0
+        }
+
+    def test_default_values_array(self):
+        signal = LinSignal('BattCurr', 24, [0, 0, 2])
+        frame = LinUnconditionalFrame(0x20, "LinStatus", 3, {0: signal})
+        assert frame.default_values == {'BattCurr': b'\x00\x00\x02'}
+        assert frame.default_values == frame.decode_raw(frame.default_payload)
+        assert FrameState(frame).get_raw('BattCurr') == b'\x00\x00\x02'
+
+    def test_default_values_copy(self):
+        frame = LinUnconditionalFrame(0x20, "LinStatus", 1, {0: LinSignal('Signal_1', 8, 0)})
+        frame.default_values['Signal_1'] = 1
+        assert frame.default_values == {'Signal_1': 0}
+
 @pytest.mark.unit
 class TestLinUnconditionalFrameEncoding:
 
@@ -270,6 +314,93 @@ class TestLinUnconditionalFrameEncoding:
         with pytest.raises(ValueError):
             frame.encode({'MotorSpeed': value})
 
+@pytest.mark.unit
+class TestLinUnconditionalFrameEncodingMany:
+
+    def test_encode_rows(self, frame, range_type):
+        rows = [{'MotorSpeed': '1000rpm'}, {'MotorSpeed': 500, 'CommError': 1}, {}]
+        expected = [frame.encode(row, {'MotorSpeed': range_type}) for row in rows]
+        assert frame.encode_many(rows, {'MotorSpeed': range_type}) == expected
+        assert frame.encode_many(rows, {'MotorSpeed': range_type}, contiguous=True) == b''.join(expected)
+
+    def test_encode_columns(self, frame, range_type):
+        columns = {'MotorSpeed': ['1000rpm', 500], 'CommError': [0, 1]}
+        assert frame.encode_many(columns, {'MotorSpeed': range_type}) == [
+            frame.encode({'MotorSpeed': '1000rpm', 'CommError': 0}, {'MotorSpeed': range_type}),
+            frame.encode({'MotorSpeed': 500, 'CommError': 1}, {'MotorSpeed': range_type})
+        ]
+
+    def test_encode_columns_numpy(self, frame, range_type):
+        numpy = pytest.importorskip('numpy')
+        columns = {'MotorSpeed': numpy.array([0.0, 1000.0, 12750.0]), 'CommError': [0, 1, 0]}
+        assert frame.encode_many(columns, {'MotorSpeed': range_type}) == [
+            frame.encode({'MotorSpeed': value, 'CommError': error}, {'MotorSpeed': range_type})
+            for (value, error) in [(0.0, 0), (1000.0, 1), (12750.0, 0)]
+        ]
+        with pytest.raises(ValueError):
+            frame.encode_many({'MotorSpeed': numpy.array([13000.0])}, {'MotorSpeed': range_type})
+
+    @pytest.mark.parametrize(['validation', 'values'], [('clamp', [-100.0, 13000.0]), ('unchecked', [12000.0, 12750.0])])
+    def test_encode_columns_numpy_validation(self, frame, validation, values):
+        numpy = pytest.importorskip('numpy')
+        encoding_type = LinSignalEncodingType('MotorSpeedType', [PhysicalValue(0, 200, 50, 0, 'rpm')], validation)
+        columns = {'MotorSpeed': numpy.array(values), 'CommError': [0, 0]}
+        assert frame.encode_many(columns, {'MotorSpeed': encoding_type}) == [
+            frame.encode({'MotorSpeed': value, 'CommError': 0}, {'MotorSpeed': encoding_type}) for value in values
+        ]
+
+    def test_encode_columns_length_mismatch(self, frame):
+        with pytest.raises(ValueError):
+            frame.encode_many({'MotorSpeed': [1, 2], 'CommError': [0]})
+
+    def test_encode_unknown_signal(self, frame):
+        with pytest.raises(LookupError):
+            frame.encode_many([{'NotExistingSignal': 1}])
+
+    def test_encode_out_of_range(self, frame):
+        with pytest.raises(ValueError):
+            frame.encode_many([{'CommError': 2}])
+
+@pytest.mark.unit
+class TestLinUnconditionalFrameDecodingMany:
+
+    @pytest.fixture
+    def serial_frame(self):
+        serial = LinSignal('SerialNumber', 32, [0, 0, 0, 0])
+        serial.encoding_type = LinSignalEncodingType('SerialType', [BCDValue()])
+        part = LinSignal('PartNumber', 24, [0x41, 0x41, 0x41])
+        part.encoding_type = LinSignalEncodingType('PartType', [ASCIIValue()])
+        return LinUnconditionalFrame(0x30, 'Identification', 8, {
+            0: serial, 32: part, 56: LinSignal('Counter', 8, 0)
+        })
+
+    def test_decode_rows(self, frame, range_type):
+        payloads = [bytearray(b'\x14\x3F\x00'), bytearray(b'\x28\x3F\x08')]
+        expected = [frame.decode(data, {'MotorSpeed': range_type}, True) for data in payloads]
+        assert frame.decode_many(payloads, {'MotorSpeed': range_type}, True) == expected
+        assert frame.decode_many(b''.join(payloads), {'MotorSpeed': range_type}, True) == expected
+
+    def test_decode_columns(self, frame):
+        columns = frame.decode_many([b'\x14\x3F\x00', b'\x28\x3F\x08'], columns=True)
+        assert columns['MotorSpeed'] == [20, 40]
+        assert columns['CommError'] == [0, 1]
+
+    def test_decode_buffer_length(self, frame):
+        with pytest.raises(ValueError):
+            frame.decode_many(b'\x00' * 4)
+
+    def test_encode_decode_bcd_ascii(self, serial_frame):
+        columns = {'SerialNumber': [1234, 9876], 'PartNumber': ['ABC', 'XYZ'], 'Counter': [1, 2]}
+        payloads = serial_frame.encode_many(columns)
+        assert payloads == [serial_frame.encode({'SerialNumber': 1234, 'PartNumber': 'ABC', 'Counter': 1}),
+                            serial_frame.encode({'SerialNumber': 9876, 'PartNumber': 'XYZ', 'Counter': 2})]
+        assert serial_frame.decode_many(payloads, columns=True) == columns
+        assert serial_frame.decode_many(payloads) == [serial_frame.decode(data) for data in payloads]
+
+    def test_decode_invalid_bcd(self, serial_frame):
+        with pytest.raises(ValueError):
+            serial_frame.decode_many([b'\x01\x0a\x00\x00AAA\x00'])
+
 @pytest.mark.unit
 class TestEncodeDecodeArray:
     """Test encode/decode of signal with array values"""
@@ -315,14 +446,20 @@ class TestEncodeDecodeArray:
         assert encoded == encoded_expected
 
         decoded = frame.decode(encoded)
-        assert decoded == raw
+        assert decoded == {"BattCurr": b'\x01\x01\x01'}
+
+    def test_encode_array_int_no_converter(self):
+        signal = LinSignal('BattCurr', 24, [0, 0, 2])
+        frame = LinUnconditionalFrame(0x20, "LinStatus", 3, {0: signal})
+        assert frame.encode({"BattCurr": 258}) == bytearray([0, 1, 2])
+        assert frame.encode_many([{"BattCurr": 258}]) == [bytearray([0, 1, 2])]
 
     def test_encode_decode_array_default_no_converter(self):
         signal = LinSignal('BattCurr', 24, [0, 0, 2])
         frame = LinUnconditionalFrame(0x20, "LinStatus", 3, {0: signal})
 
         encoded_expected = bytearray([0, 0, 2])
-        decode_expected = {'BattCurr': [0, 0, 2]}
+        decode_expected = {'BattCurr': b'\x00\x00\x02'}
 
         encoded = frame.encode({})
         assert encoded == encoded_expected
@@ -330,6 +467,22 @@ class TestEncodeDecodeArray:
         decoded = frame.decode(encoded)
         assert decoded == decode_expected
 
+    @pytest.mark.parametrize(
+        ['converter', 'value', 'data'],
+        [
+            (BCDValue(), 123, b'\x01\x02\x03'),
+            (ASCIIValue(), 'ABC', b'ABC')
+        ]
+    )
+    def test_encode_decode_array_buffer_converter(self, converter, value, data):
+        signal = LinSignal('Text', 24, [0, 0, 0])
+        signal.encoding_type = LinSignalEncodingType('TextType', [converter])
+        frame = LinUnconditionalFrame(0x20, "LinStatus", 3, {0: signal})
+
+        assert frame.encode({'Text': value}) == data
+        assert frame.decode(data) == {'Text': value}
+        assert frame.encode_raw({'Text': data}) == data
+
 
 @pytest.mark.unit
 class TestLinUnconditionalFrameDecodingRaw:
@@ -376,6 +529,13 @@ class TestLinUnconditionalFrameDecoding:
         decoded = frame.decode(b'\x20\x3F\x08', {'MotorSpeed': range_type}, keep_unit=True)
         assert decoded['MotorSpeed'] == '1600.000 rpm'
 
+    def test_decode_fixed_point(self, frame, range_type):
+        decoded = frame.decode(b'\x20\x3F\x08', {'MotorSpeed': range_type}, fixed_point=True)
+        assert decoded['MotorSpeed'] == FixedPointValue(0x20, FixedPointScale(50, 1, 0))
+        assert decoded['InternalTemperature'] == FixedPointValue(0x3F, None)
+        assert frame.decode(b'\x20\x3F\x08', {'MotorSpeed': range_type}, signals=['MotorSpeed'],
+                            fixed_point=True) == {'MotorSpeed': decoded['MotorSpeed']}
+
 @pytest.mark.unit
 def test_frame_encoding_with_optional_padding1():
     signal1 = LinSignal('Signal_1', 8, 255)
@@ -389,3 +549,205 @@ def test_frame_encoding_with_optional_padding1():
     })
 
     assert list(content) == [255, 250]  # 10 | ( 1 << 7 | 0x70) = 250
+
+@pytest.mark.unit
+class TestLinUnconditionalFrameByteOrder:
+
+    @pytest.fixture(scope="class")
+    def frames(self):
+        def create(byte_order):
+            return LinUnconditionalFrame(1, 'Frame_1', 4, {
+                0: LinSignal('Aligned', 16, 0x0102),
+                20: LinSignal('Unaligned', 12, 0),
+                16: LinSignal('Nibble', 4, 0)
+            }, byte_order=byte_order)
+        return {order: create(order) for order in ('little', 'big')}
+
+    @pytest.mark.parametrize(
+        ['byte_order', 'data', 'expected'],
+        [
+            ('little', b'\x34\x12\x5A\xBC', {'Aligned': 0x1234, 'Nibble': 0xA, 'Unaligned': 0xBC5}),
+            ('big', b'\x12\x34\x5A\xBC', {'Aligned': 0x1234, 'Nibble': 0xA, 'Unaligned': 0x5BC})
+        ]
+    )
+    def test_decode_raw(self, frames, byte_order, data, expected):
+        frame = frames[byte_order]
+        assert frame.decode_raw(data) == expected
+        assert frame.decode(data, signals=['Unaligned']) == {'Unaligned': expected['Unaligned']}
+        assert frame.encode_raw(expected) == data
+        assert frame.encode_raw([expected['Aligned'], expected['Nibble'], expected['Unaligned']]) == data
+
+    @pytest.mark.parametrize('byte_order', ['little', 'big'])
+    def test_invalid_length(self, frames, byte_order):
+        with pytest.raises(ValueError):
+            frames[byte_order].decode_raw(b'\x01\x02\x03')
+        with pytest.raises(ValueError):
+            frames[byte_order].encode_raw([0x0102, 0x0A])
+
+    def test_default_payload(self, frames):
+        assert frames['little'].default_payload == b'\x02\x01\x00\x00'
+        assert frames['big'].default_payload == b'\x01\x02\x00\x00'
+
+    def test_frame_state(self, frames):
+        state = FrameState(frames['big'])
+        state.set_raw('Unaligned', 0x123)
+        assert state.payload == b'\x01\x02\x10\x23'
+        assert state.get_raw('Unaligned') == 0x123
+
+    def test_out_of_range(self, frames):
+        with pytest.raises(ValueError):
+            frames['big'].encode_raw({'Unaligned': 0x1000})
+
+    def test_unknown_byte_order(self):
+        with pytest.raises(ValueError):
+            LinUnconditionalFrame(1, 'Frame_1', 2, {0: LinSignal('Signal_1', 16, 0)}, byte_order='middle')
+
+    def test_signal_group(self, frames):
+        group = LinSignalGroup('Group', 16, {0: LinSignal('Aligned', 16, 0x0102)}, byte_order='big')
+        assert group.encode_raw({'Aligned': 0x1234}) == b'\x12\x34'
+        assert group.get_frame_offset(frames['big']) == 0
+        with pytest.raises(LookupError):
+            group.get_frame_offset(frames['little'])
+
+@pytest.mark.unit
+class TestLinUnconditionalFrameProjection:
+
+    def test_decode_raw(self, frame):
+        projection = frame.projection(['CommError', 'MotorSpeed'])
+        assert projection.decode_raw(b'\x64\x32\x08') == {'CommError': 1, 'MotorSpeed': 0x64}
+
+    def test_decode_builtin(self, frame, range_type):
+        frame._get_signal('MotorSpeed').encoding_type = range_type
+        decoded = frame.projection(['MotorSpeed']).decode(b'\x20\x3F\x08')
+        assert decoded == {'MotorSpeed': 1600.0}
+
+    def test_decode_signals(self, frame, range_type):
+        decoded = frame.decode(b'\x20\x3F\x08', {'MotorSpeed': range_type}, keep_unit=True,
+                               signals=['MotorSpeed', 'InternalTemperature'])
+        assert decoded == {'MotorSpeed': '1600.000 rpm', 'InternalTemperature': 0x3F}
+
+    def test_decode_matches_full_decode(self, frame):
+        data = b'\x64\x32\x08'
+        names = [signal.name for (_, signal) in frame.signal_map]
+        assert frame.decode(data, signals=names) == frame.decode(data)
+
+    def test_projection_cached(self, frame):
+        assert frame.projection(['MotorSpeed']) is frame.projection(['MotorSpeed'])
+
+    def test_projection_unknown_signal(self, frame):
+        with pytest.raises(LookupError):
+            frame.projection(['MissingSignal'])
+
+    def test_decode_array(self):
+        signal = LinSignal('BattCurr', 24, [0, 0, 2])
+        status = LinSignal('Status', 8, 0)
+        frame = LinUnconditionalFrame(0x20, "LinStatus", 4, {0: signal, 24: status})
+        assert frame.projection(['BattCurr']).decode(bytearray([1, 2, 3, 4])) == {'BattCurr': b'\x01\x02\x03'}
+
+@pytest.mark.unit
+class TestFrameState:
+
+    def test_initial_payload(self, frame):
+        state = FrameState(frame)
+        assert state.payload == frame.encode_raw({})
+        assert not state.dirty
+
+    def test_set_raw(self, frame):
+        state = FrameState(frame)
+        state.set_raw('MotorSpeed', 100)
+        state.set_raw('CommError', 1)
+        assert state.payload == frame.encode_raw({'MotorSpeed': 100, 'CommError': 1})
+        assert state.dirty_signals == {'MotorSpeed', 'CommError'}
+        assert state.get_raw('MotorSpeed') == 100
+
+    def test_set_encoded(self, frame, range_type):
+        state = FrameState(frame, {'MotorSpeed': range_type})
+        state.set('MotorSpeed', '1000rpm')
+        assert state.payload == b'\x14\x3F\x00'
+
+    def test_set_same_value_not_dirty(self, frame):
+        state = FrameState(frame)
+        state.set('MotorSpeed', 0xFF)
+        assert not state.dirty
+
+    def test_clean(self, frame):
+        state = FrameState(frame)
+        state.update({'MotorSpeed': 1, 'InternalError': 1})
+        assert state.dirty
+        state.clean()
+        assert not state.dirty
+        assert state.payload == frame.encode_raw({'MotorSpeed': 1, 'InternalError': 1})
+
+    def test_set_out_of_range(self, frame):
+        state = FrameState(frame)
+        with pytest.raises(ValueError):
+            state.set_raw('InternalTemperature', 0x40)
+
+    def test_set_unknown_signal(self, frame):
+        state = FrameState(frame)
+        with pytest.raises(LookupError):
+            state.set('MissingSignal', 0)
+
+    def test_set_array(self):
+        signal = LinSignal('BattCurr', 24, [0, 0, 2])
+        frame = LinUnconditionalFrame(0x20, "LinStatus", 3, {0: signal})
+        state = FrameState(frame)
+        state.set('BattCurr', [1, 2, 3])
+        assert state.payload == bytearray([1, 2, 3])
+
+    def test_set_group(self, frame):
+        group = LinSignalGroup('Errors', 2, {
+            0: frame._get_signal('InternalError'),
+            1: frame._get_signal('CommError')
+        })
+        state = FrameState(frame)
+        state.set_group(group, {'InternalError': 1, 'CommError': 1})
+        assert state.payload == frame.encode_raw({'InternalError': 1, 'CommError': 1})
+        assert state.dirty_signals == {'InternalError', 'CommError'}
+        state.clean()
+        state.set_group_raw(group, {'CommError': 0})
+        assert state.get_raw('InternalError') == 1
+        assert state.dirty_signals == {'CommError'}
+
+    def test_set_group_not_in_frame(self, frame):
+        group = LinSignalGroup('Errors', 3, {
+            0: frame._get_signal('InternalError'),
+            2: frame._get_signal('CommError')
+        })
+        with pytest.raises(LookupError):
+            FrameState(frame).set_group(group, {'CommError': 1})
+
+    def test_padding_with_ones(self):
+        signal = LinSignal('Signal_1', 4, 0)
+        frame = LinUnconditionalFrame(1, 'Frame_1', 1, {0: signal}, pad_with_zero=False)
+        state = FrameState(frame)
+        state.set('Signal_1', 5)
+        assert state.payload == bytearray([0xF5])
+
+@pytest.mark.unit
+class TestLinEventTriggeredFrame:
+
+    @pytest.fixture
+    def event_frame(self):
+        left = LinUnconditionalFrame(0x02, 'LeftStatus', 2, {8: LinSignal('LeftSwitch', 8, 0)})
+        right = LinUnconditionalFrame(0x04, 'RightStatus', 2, {8: LinSignal('RightSwitch', 8, 0)})
+        return LinEventTriggeredFrame(0x06, 'StatusEvent', [left, right])
+
+    def test_get_associated_frame(self, event_frame):
+        assert event_frame.get_associated_frame(b'\x42\x00').name == 'LeftStatus'
+        assert event_frame.get_associated_frame(b'\xC4\x00').name == 'RightStatus'
+
+    def test_decode(self, event_frame, range_type):
+        (frame, values) = event_frame.decode(b'\xC4\x02', {'RightSwitch': range_type})
+        assert frame.name == 'RightStatus'
+        assert values == {'RightSwitch': 100.0}
+
+    def test_decode_raw(self, event_frame):
+        (frame, values) = event_frame.decode_raw(b'\x42\x07')
+        assert frame.name == 'LeftStatus'
+        assert values == {'LeftSwitch': 7}
+
+    @pytest.mark.parametrize('data', [b'\x02\x00', b'\x80\x00', b''])
+    def test_decode_unknown(self, event_frame, data):
+        with pytest.raises(LookupError):
+            event_frame.decode(data)
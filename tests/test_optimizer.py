@@ -0,0 +1,90 @@
+import os
+import pytest
+
+from ldfparser.analysis import bus_load, signal_refresh
+from ldfparser.optimizer import optimize_schedule
+from ldfparser.parser import parse_ldf
+from ldfparser.save import save_ldf
+
+ldf_directory = os.path.join(os.path.dirname(__file__), 'ldf')
+
+@pytest.fixture
+def ldf():
+    return parse_ldf(os.path.join(ldf_directory, 'lin22.ldf'))
+
+def max_intervals(ldf, table):
+    ldf.add_schedule_table(table)
+    intervals = {}
+    for refresh in signal_refresh(ldf, tables=[table.name]):
+        for frame in ldf.get_signal(refresh.signal).frames:
+            intervals[frame.name] = refresh.maximum
+    return intervals
+
+@pytest.mark.unit
+class TestOptimizeSchedule:
+
+    def test_meets_periods(self, ldf):
+        periods = {'CEM_Frm1': 0.02, 'LSM_Frm1': 0.05, 'LSM_Frm2': 0.05, 'RSM_Frm1': 0.03, 'RSM_Frm2': 0.1}
+        table = optimize_schedule(ldf, periods, attempts=200)
+        intervals = max_intervals(ldf, table)
+        for (frame, period) in periods.items():
+            assert intervals[frame] <= period + 1e-9
+        (load, ) = bus_load(ldf, [table.name])
+        assert load.overruns == []
+        timebase = ldf.get_master().timebase
+        assert all(abs(round(entry.delay / timebase) * timebase - entry.delay) < 1e-9 for entry in table.schedule)
+
+    def test_lowest_load(self, ldf):
+        # sending CEM_Frm1 every 20 ms and RSM_Frm1 every 30 ms needs a 60 ms cycle
+        table = optimize_schedule(ldf, {'CEM_Frm1': 0.02, 'RSM_Frm1': 0.03}, attempts=200)
+        assert sum(entry.delay for entry in table.schedule) == pytest.approx(0.06)
+        assert sorted(entry.frame.name for entry in table.schedule) == ['CEM_Frm1'] * 3 + ['RSM_Frm1'] * 2
+
+    def test_even_intervals(self, ldf):
+        table = optimize_schedule(ldf, {'CEM_Frm1': 0.02, 'LSM_Frm1': 0.02}, attempts=200)
+        assert [entry.frame.name for entry in table.schedule] in (['CEM_Frm1', 'LSM_Frm1'], ['LSM_Frm1', 'CEM_Frm1'])
+        assert [entry.delay for entry in table.schedule] == [0.01, 0.01]
+
+    def test_signal_periods(self, ldf):
+        table = optimize_schedule(ldf, {'InternalLightsRequest': 0.02, 'LSM_Frm1': 0.04}, 'Signals', attempts=200)
+        intervals = max_intervals(ldf, table)
+        assert intervals['CEM_Frm1'] <= 0.02 + 1e-9
+        assert intervals['LSM_Frm1'] <= 0.04 + 1e-9
+
+    def test_deterministic(self, ldf):
+        periods = {'CEM_Frm1': 0.02, 'LSM_Frm1': 0.05, 'RSM_Frm1': 0.03, 'RSM_Frm2': 0.07}
+        first = optimize_schedule(ldf, periods, attempts=50, seed=3)
+        second = optimize_schedule(ldf, periods, attempts=50, seed=3)
+        assert [(entry.frame, entry.delay) for entry in first.schedule] == \
+            [(entry.frame, entry.delay) for entry in second.schedule]
+
+    def test_save(self, ldf):
+        table = optimize_schedule(ldf, {'CEM_Frm1': 0.02, 'RSM_Frm1': 0.03}, 'Optimized', attempts=200)
+        ldf.add_schedule_table(table)
+        os.makedirs('./tests/tmp', exist_ok=True)
+        save_ldf(ldf, './tests/tmp/test_optimized_lin22.ldf')
+        saved = parse_ldf('./tests/tmp/test_optimized_lin22.ldf').get_schedule_table('Optimized')
+        assert [(entry.frame.name, entry.delay) for entry in saved.schedule] == \
+            [(entry.frame.name, pytest.approx(entry.delay)) for entry in table.schedule]
+
+    def test_duplicate_table(self, ldf):
+        table = optimize_schedule(ldf, {'CEM_Frm1': 0.02}, 'Normal_Schedule', attempts=200)
+        with pytest.raises(ValueError):
+            ldf.add_schedule_table(table)
+
+    @pytest.mark.parametrize(('periods', 'error'), [
+        ({'NotExisting': 0.02}, LookupError),
+        ({'CEM_Frm1': 0.001}, ValueError),
+        ({'CEM_Frm1': -0.02}, ValueError),
+        ({}, ValueError),
+        ({'CEM_Frm1': 0.005, 'LSM_Frm1': 0.005}, ValueError)
+    ])
+    def test_invalid(self, ldf, periods, error):
+        with pytest.raises(error):
+            optimize_schedule(ldf, periods, attempts=200)
+
+    def test_time_budget(self, ldf):
+        periods = {'CEM_Frm1': 0.02, 'RSM_Frm1': 0.03}
+        table = optimize_schedule(ldf, periods, attempts=200, time_budget=10)
+        assert [(entry.frame, entry.delay) for entry in table.schedule] == \
+            [(entry.frame, entry.delay) for entry in optimize_schedule(ldf, periods, attempts=200).schedule]
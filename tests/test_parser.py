@@ -27,6 +27,60 @@ def test_load_valid_lin13():
     assert ldf.get_slave('CPM').initial_nad == 0x02
 
 
+@pytest.mark.unit
+def test_load_signal_groups():
+    path = os.path.join(os.path.dirname(__file__), "ldf", "lin13.ldf")
+    ldf = parse_ldf(path)
+
+    assert len(ldf.get_signal_groups()) == 2
+    group = ldf.get_signal_group('CPMReq')
+    assert group.size == 64
+    assert [signal.name for signal in group.signals] == [f'CPMReqB{i}' for i in range(8)]
+    assert ldf.get_signal_group_of('CPMReqB3') is group
+    assert ldf.get_signal_group_of(ldf.get_signal('CPMRespB0')).name == 'CPMResp'
+
+    with pytest.raises(LookupError):
+        ldf.get_signal_group('NotExistingGroup')
+    with pytest.raises(LookupError):
+        ldf.get_signal_group_of('StartHeater')
+
+
+@pytest.mark.unit
+def test_load_lookup_tables():
+    path = os.path.join(os.path.dirname(__file__), "ldf", "lin22.ldf")
+    ldf = parse_ldf(path, lookup_table_width=8)
+    ldf_without_tables = parse_ldf(path)
+
+    assert ldf.get_lookup_table_size() > 0
+    assert ldf_without_tables.get_lookup_table_size() == 0
+    for frame in ldf.get_unconditional_frames():
+        data = bytes(range(frame.length))
+        reference = ldf_without_tables.get_unconditional_frame(frame.name)
+        for keep_unit in (False, True):
+            try:
+                expected = reference.decode(data, keep_unit=keep_unit)
+            except ValueError:
+                with pytest.raises(ValueError):
+                    frame.decode(data, keep_unit=keep_unit)
+                continue
+            assert frame.decode(data, keep_unit=keep_unit) == expected
+
+    with pytest.raises(ValueError):
+        parse_ldf(path, lookup_table_width=16)
+
+@pytest.mark.unit
+def test_load_validation_policy():
+    path = os.path.join(os.path.dirname(__file__), "ldf", "lin22.ldf")
+    ldf = parse_ldf(path, validation='clamp')
+
+    for encoding_type in ldf.get_signal_encoding_types():
+        assert encoding_type.validation == 'clamp'
+    frame = ldf.get_unconditional_frame('RSM_Frm1')
+    assert frame.encode({'RightIntLightsSwitch': 1000}) == frame.encode({'RightIntLightsSwitch': 354})
+
+    with pytest.raises(ValueError):
+        parse_ldf(path, validation='fast')
+
 @pytest.mark.unit
 def test_load_valid_lin20():
     path = os.path.join(os.path.dirname(__file__), "ldf", "lin20.ldf")
@@ -212,6 +266,11 @@ def test_load_iso17987():
     assert isinstance(ldf.get_language_version(), Iso17987Version)
     assert ldf.get_language_version().revision == 2015
 
+    assert ldf.get_byte_order() == 'big'
+    motor_control = ldf.get_unconditional_frame('MotorControl')
+    assert motor_control.byte_order == 'big'
+    assert motor_control.decode_raw(b'\x12\x34') == {'signal1': 0x1234}
+
 @pytest.mark.unit
 def test_load_j2602_attributes():
     path = os.path.join(os.path.dirname(__file__), "ldf", "j2602_1.ldf")
@@ -1,10 +1,20 @@
+import asyncio
 import glob
 import os
 import pytest
 
 from ldfparser.parser import parse_ldf
+from ldfparser.optimizer import optimize_schedule
 from ldfparser.signal import LinSignal
-from ldfparser.encoding import PhysicalValue, LogicalValue
+from ldfparser.encoding import ASCIIValue, BCDValue, LinSignalEncodingType, PhysicalValue, LogicalValue
+from ldfparser.frame import LinUnconditionalFrame
+from ldfparser.analysis import bus_load, signal_refresh
+from ldfparser.bus import build_schedule_cycle
+from ldfparser.client import LinDiagnosticClient, LinSimulatedTransport
+from ldfparser.checksum import protected_id, validate_frames
+from ldfparser.diagnostics import LinDiagnosticFrame, LinDiagnosticResponse, encode_configuration
+from ldfparser.lin import LIN_VERSION_2_1
+from ldfparser.transport import LinTransportReceiver, segment_pdu
 
 ldf_directory = os.path.join(os.path.dirname(__file__), 'ldf')
 ldf_files = glob.glob(ldf_directory + '/*.ldf')
@@ -36,8 +46,217 @@ def test_performance_physical_decoding(benchmark):
     physical_value = PhysicalValue(0, 254, 0.3937, 0, 'rpm')
     benchmark(physical_value.decode, value=200, signal=motor_signal)
 
+@pytest.mark.performance
+def test_performance_physical_decoding_keep_unit(benchmark):
+    motor_signal = LinSignal('MotorRPM', 8, 0)
+    physical_value = PhysicalValue(0, 254, 0.3937, 0, 'rpm')
+    benchmark(physical_value.decode, value=100, signal=motor_signal, keep_unit=True)
+
+@pytest.mark.performance
+def test_performance_fixed_point_decoding(benchmark):
+    signals = {i * 8: LinSignal(f'Signal_{i}', 8, 0) for i in range(8)}
+    frame = LinUnconditionalFrame(0x10, 'Frame', 8, signals)
+    encoding_type = LinSignalEncodingType('Type', [PhysicalValue(0, 254, 0.3937, 0, 'rpm')])
+    encoding_types = {signal.name: encoding_type for signal in signals.values()}
+    benchmark(frame.decode, bytearray([1, 2, 3, 4, 5, 6, 7, 8]), encoding_types, fixed_point=True)
+
 @pytest.mark.performance
 def test_performance_logical_decoding(benchmark):
     motor_signal = LinSignal('MotorRPM', 8, 0)
     logical_value = LogicalValue(1, "on")
     benchmark(logical_value.decode, value=1, signal=motor_signal)
+
+@pytest.mark.performance
+def test_performance_projection_decoding(benchmark):
+    signals = {i * 8: LinSignal(f'Signal_{i}', 8, 0) for i in range(8)}
+    frame = LinUnconditionalFrame(0x10, 'Frame', 8, signals)
+    projection = frame.projection(['Signal_1', 'Signal_6'])
+    benchmark(projection.decode, bytearray([1, 2, 3, 4, 5, 6, 7, 8]))
+
+@pytest.mark.performance
+@pytest.mark.parametrize('byte_order', ['little', 'big'])
+def test_performance_byte_order_decoding(benchmark, byte_order):
+    signals = {i * 16: LinSignal(f'Signal_{i}', 16, 0) for i in range(4)}
+    frame = LinUnconditionalFrame(0x10, 'Frame', 8, signals, byte_order=byte_order)
+    benchmark(frame.decode_raw, bytearray([1, 2, 3, 4, 5, 6, 7, 8]))
+
+@pytest.mark.performance
+@pytest.mark.parametrize('byte_order', ['little', 'big'])
+def test_performance_byte_order_encoding(benchmark, byte_order):
+    signals = {i * 16: LinSignal(f'Signal_{i}', 16, 0) for i in range(4)}
+    frame = LinUnconditionalFrame(0x10, 'Frame', 8, signals, byte_order=byte_order)
+    benchmark(frame.encode_raw, [0x0102, 0x0304, 0x0506, 0x0708])
+
+@pytest.mark.performance
+def test_performance_array_decoding(benchmark):
+    frame = LinUnconditionalFrame(0x10, 'Frame', 8, {0: LinSignal('Array', 64, [0] * 8)})
+    benchmark(frame.decode_raw, bytearray([1, 2, 3, 4, 5, 6, 7, 8]))
+
+@pytest.mark.performance
+@pytest.mark.parametrize('lookup_table', [False, True])
+def test_performance_lookup_table_decoding(benchmark, lookup_table):
+    signal = LinSignal('MotorRPM', 8, 0)
+    signal_type = LinSignalEncodingType('MotorType', [
+        LogicalValue(0, 'off'), PhysicalValue(1, 254, 0.3937, 0, 'rpm'), LogicalValue(255, 'error')
+    ])
+    if lookup_table:
+        signal_type.build_lookup_table(signal)
+    benchmark(signal_type.decode, 200, signal, True)
+
+@pytest.mark.performance
+@pytest.mark.parametrize('validation', ['strict', 'clamp', 'unchecked'])
+def test_performance_validation_encoding(benchmark, validation):
+    signal = LinSignal('MotorRPM', 8, 0)
+    signal_type = LinSignalEncodingType('MotorType', [
+        LogicalValue(0, 'off'), PhysicalValue(1, 254, 0.3937, 0, 'rpm'), LogicalValue(255, 'error')
+    ], validation)
+    benchmark(signal_type.encode, 50, signal)
+
+@pytest.mark.performance
+@pytest.mark.parametrize('validation', ['strict', 'clamp', 'unchecked'])
+def test_performance_validation_decoding(benchmark, validation):
+    signal = LinSignal('MotorRPM', 16, 0)
+    signal_type = LinSignalEncodingType('MotorType', [
+        LogicalValue(0, 'off'), PhysicalValue(1, 65534, 0.01, 0, 'rpm'), LogicalValue(65535, 'error')
+    ], validation)
+    benchmark(signal_type.decode, 20000, signal)
+
+@pytest.mark.performance
+def test_performance_encode_many(benchmark):
+    signals = {i * 8: LinSignal(f'Signal_{i}', 8, 0) for i in range(8)}
+    frame = LinUnconditionalFrame(0x10, 'Frame', 8, signals)
+    encoding_type = LinSignalEncodingType('Type', [PhysicalValue(0, 254, 0.5, 0, 'rpm')])
+    encoding_types = {signal.name: encoding_type for signal in signals.values()}
+    columns = {signal.name: [float(i % 127) for i in range(1000)] for signal in signals.values()}
+    benchmark(frame.encode_many, columns, encoding_types, contiguous=True)
+
+@pytest.mark.performance
+def test_performance_partial_encoding(benchmark):
+    signals = {i * 8: LinSignal(f'Signal_{i}', 8, 0) for i in range(8)}
+    frame = LinUnconditionalFrame(0x10, 'Frame', 8, signals)
+    benchmark(frame.encode_raw, {'Signal_3': 100})
+
+@pytest.mark.performance
+def test_performance_frame_validation(benchmark):
+    frames = [(protected_id(i % 60), bytes(range(8)), 0) for i in range(1000)]
+    benchmark(validate_frames, frames, LIN_VERSION_2_1)
+
+@pytest.mark.performance
+def test_performance_schedule_cycle(benchmark):
+    path = os.path.join(os.path.dirname(__file__), "ldf", "lin22.ldf")
+    ldf = parse_ldf(path)
+    table = ldf.get_schedule_table('Collision_resolver')
+    benchmark(build_schedule_cycle, table, ldf.get_protocol_version())
+
+@pytest.mark.performance
+def test_performance_bus_decoding(benchmark):
+    path = os.path.join(os.path.dirname(__file__), "ldf", "lin22.ldf")
+    decoder = parse_ldf(path).bus_decoder()
+    records = [(0x42, b'\x00\x05'), (0xC1, b'\x01'), (0x03, b'\x03')] * 100
+    benchmark(lambda: list(decoder.decode_stream(records)))
+
+@pytest.mark.performance
+@pytest.mark.parametrize('batch', [False, True])
+def test_performance_bcd_decoding(benchmark, batch):
+    converter = BCDValue()
+    signal = LinSignal('SerialNumber', 48, [0] * 6)
+    values = [bytes([i % 10, 1, 2, 3, 4, 5]) for i in range(1000)]
+    if batch:
+        benchmark(converter.decode_many, values, signal)
+    else:
+        benchmark(lambda: [converter.decode(value, signal) for value in values])
+
+@pytest.mark.performance
+@pytest.mark.parametrize('batch', [False, True])
+def test_performance_bcd_encoding(benchmark, batch):
+    converter = BCDValue()
+    signal = LinSignal('SerialNumber', 48, [0] * 6)
+    values = list(range(100000, 101000))
+    if batch:
+        benchmark(converter.encode_many, values, signal)
+    else:
+        benchmark(lambda: [converter.encode(value, signal) for value in values])
+
+@pytest.mark.performance
+@pytest.mark.parametrize('batch', [False, True])
+def test_performance_ascii_decoding(benchmark, batch):
+    converter = ASCIIValue()
+    signal = LinSignal('PartNumber', 64, [0] * 8)
+    values = [f'PN{i:06d}'.encode() for i in range(1000)]
+    if batch:
+        benchmark(converter.decode_many, b''.join(values), signal)
+    else:
+        benchmark(lambda: [converter.decode(value, signal) for value in values])
+
+@pytest.mark.performance
+def test_performance_transport_reassembly(benchmark):
+    frames = [frame for nad in (0x01, 0x02) for frame in segment_pdu(nad, bytes(range(256)) * 15)]
+    records = [(index * 0.001, frame) for (index, frame) in enumerate(frames)]
+    receiver = LinTransportReceiver()
+    benchmark(lambda: list(receiver.receive_stream(records)))
+
+@pytest.mark.performance
+@pytest.mark.parametrize('method', ['decode_response', 'decode_response_fields'])
+def test_performance_diagnostic_response(benchmark, method):
+    frame = LinDiagnosticFrame(0x3D, 'SlaveResp', 8, {i * 8: LinSignal(f'SlaveRespB{i}', 8, 0) for i in range(8)})
+    response = LinDiagnosticResponse(frame)
+    benchmark(getattr(response, method), b'\x01\x06\xF2\x7F\xFF\xFF\xFF\x01')
+
+@pytest.mark.performance
+def test_performance_diagnostic_responses(benchmark):
+    frame = LinDiagnosticFrame(0x3D, 'SlaveResp', 8, {i * 8: LinSignal(f'SlaveRespB{i}', 8, 0) for i in range(8)})
+    response = LinDiagnosticResponse(frame)
+    benchmark(response.decode_responses, b'\x01\x06\xF2\x7F\xFF\xFF\xFF\x01' * 1000)
+
+@pytest.mark.performance
+def test_performance_encode_configuration(benchmark):
+    ldf = parse_ldf(os.path.join(ldf_directory, 'iso17987.ldf'))
+    slaves = list(ldf.get_slaves()) * 50
+    benchmark(encode_configuration, slaves, save_configuration=True)
+
+@pytest.mark.performance
+def test_performance_diagnostic_client(benchmark):
+    ldf = parse_ldf(os.path.join(ldf_directory, 'iso17987.ldf'))
+    slaves = list(ldf.get_slaves())
+    for slave in slaves:
+        slave.p2_min = 0
+    client = LinDiagnosticClient(LinSimulatedTransport(slaves), slaves)
+    loop = asyncio.new_event_loop()
+
+    async def read_product_ids():
+        return await asyncio.gather(*(client.read_product_id(slave.configured_nad)
+                                      for slave in slaves for _ in range(20)))
+    benchmark(lambda: loop.run_until_complete(read_product_ids()))
+    loop.close()
+
+@pytest.mark.performance
+@pytest.mark.parametrize('method', ['step', 'fast_forward'])
+def test_performance_schedule_timeline(benchmark, method):
+    ldf = parse_ldf(os.path.join(ldf_directory, 'lin_schedules.ldf'))
+
+    def run():
+        timeline = ldf.schedule_timeline('Normal_Schedule')
+        if method == 'step':
+            for _ in timeline.slots(count=10000):
+                pass
+        else:
+            timeline.fast_forward(36000.0)
+    benchmark(run)
+
+@pytest.mark.performance
+def test_performance_bus_load(benchmark):
+    ldfs = [parse_ldf(path) for path in ldf_files]
+    benchmark(lambda: [bus_load(ldf) for ldf in ldfs])
+
+@pytest.mark.performance
+def test_performance_signal_refresh(benchmark):
+    ldf = parse_ldf(os.path.join(ldf_directory, 'lin22.ldf'))
+    table = ldf.get_schedule_table('Normal_Schedule')
+    table.schedule = table.schedule * 250
+    benchmark(signal_refresh, ldf)
+
+@pytest.mark.performance
+def test_performance_optimize_schedule(benchmark):
+    ldf = parse_ldf(os.path.join(ldf_directory, 'lin22.ldf'))
+    periods = {'CEM_Frm1': 0.02, 'LSM_Frm1': 0.05, 'LSM_Frm2': 0.05, 'RSM_Frm1': 0.03, 'RSM_Frm2': 0.07}
+    benchmark(optimize_schedule, ldf, periods, attempts=100)
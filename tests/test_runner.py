@@ -0,0 +1,248 @@
+import asyncio
+import os
+
+import pytest
+
+from ldfparser.client import LinDiagnosticClient, LinSimulatedTransport
+from ldfparser.diagnostics import LIN_MASTER_REQUEST_FRAME_ID, LIN_SLAVE_RESPONSE_FRAME_ID, encode_configuration_entry
+from ldfparser.parser import parse_ldf
+from ldfparser.runner import LinClock, LinLoopbackBackend, LinScheduleRunner, LinScheduleStatistics
+from ldfparser.schedule import MasterRequestEntry, ScheduleTable, SlaveResponseEntry
+
+ldf_directory = os.path.join(os.path.dirname(__file__), 'ldf')
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+class FakeClock(LinClock):
+    """
+    Clock that only advances when the runner sleeps or the test advances it
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.now += delay
+        await asyncio.sleep(0)
+
+    def advance(self, delay):
+        self.now += delay
+
+def diagnostic_table():
+    table = ScheduleTable('Diagnostic_Schedule')
+    for entry_type in (MasterRequestEntry, SlaveResponseEntry):
+        entry = entry_type()
+        entry.delay = 0.01
+        table.schedule.append(entry)
+    return table
+
+@pytest.fixture
+def ldf():
+    return parse_ldf(os.path.join(ldf_directory, 'lin22.ldf'))
+
+@pytest.fixture
+def table(ldf):
+    return ldf.get_schedule_table('Normal_Schedule')
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def backend(clock):
+    return LinLoopbackBackend(clock=clock)
+
+@pytest.mark.unit
+class TestLinScheduleRunner:
+
+    def test_master_frames(self, ldf, table, clock, backend):
+        runner = LinScheduleRunner(ldf.get_master(), table, backend, clock=clock)
+        runner.on_slot('CEM_Frm1', lambda slot: {'InternalLightsRequest': 'on'})
+        run(runner.run(count=4))
+
+        frame = ldf.get_unconditional_frame('CEM_Frm1')
+        assert [frame_id for (_, frame_id, _) in backend.frames] == [0x01, 0x03, 0x05, 0x06]
+        assert backend.frames[0][2] == frame.encode({'InternalLightsRequest': 'on'})
+        assert not runner.state(frame).dirty
+
+    def test_slave_responses(self, ldf, table, clock, backend):
+        backend.responses[0x03] = b'\x02'
+        backend.responses[0x06] = lambda: b'\x42\x01'
+        received = []
+        runner = LinScheduleRunner(ldf.get_master(), table, backend, clock=clock)
+        runner.add_listener(lambda slot, data: received.append((slot.frame.name, data)))
+        run(runner.run(count=4))
+
+        assert received == [('LSM_Frm2', b'\x02'), ('Node_Status_Event', b'\x42\x01')]
+        assert backend.frames[2][2] is None
+        (frame, values) = ldf.get_frame('Node_Status_Event').decode_raw(received[1][1])
+        assert (frame.name, values['LeftIntLightsSwitch']) == ('LSM_Frm1', 0x01)
+
+    def test_no_drift(self, ldf, table, clock):
+        class SlowBackend(LinLoopbackBackend):
+            async def send_frame(self, frame_id, data):
+                clock.advance(0.004)
+                await super().send_frame(frame_id, data)
+
+            async def send_header(self, frame_id):
+                clock.advance(0.004)
+                return await super().send_header(frame_id)
+        backend = SlowBackend(clock=clock)
+        runner = LinScheduleRunner(ldf.get_master(), table, backend, clock=clock)
+        statistics = run(runner.run(count=400))
+
+        # a sleep based loop would be late by the time the backend took in every slot
+        nominal = [offset + 0.055 * cycle for cycle in range(100) for offset in (0.0, 0.015, 0.03, 0.045)]
+        assert [timestamp for (timestamp, _, _) in backend.frames] == \
+            [pytest.approx(timestamp + 0.004) for timestamp in nominal]
+        assert (statistics.slots, statistics.skipped, statistics.late) == (400, 0, 0)
+        assert statistics.histogram[0] == 400
+
+    def test_skip_overrun_slots(self, ldf, table, clock, backend):
+        runner = LinScheduleRunner(ldf.get_master(), table, backend, clock=clock)
+        runner.on_slot('CEM_Frm1', lambda slot: clock.advance(0.035))
+        statistics = run(runner.run(count=3))
+
+        # LSM_Frm2 would start at 15 ms and is over at 30 ms, RSM_Frm2 is 5 ms late
+        assert [frame_id for (_, frame_id, _) in backend.frames] == [0x01, 0x05]
+        assert (statistics.slots, statistics.skipped, statistics.late) == (2, 1, 1)
+        assert statistics.maximum == pytest.approx(0.005)
+        assert statistics.histogram[0] == 1
+        assert sum(statistics.histogram[9:11]) == 1
+
+    def test_duration(self, ldf, table, clock, backend):
+        runner = LinScheduleRunner(ldf.get_master(), table, backend, clock=clock)
+        statistics = run(runner.run(duration=0.1))
+        # slots start at 0, 15, 30, 45, 55, 70 and 85 ms
+        assert statistics.slots == 7
+        assert clock.now == pytest.approx(0.085)
+
+    def test_resume(self, ldf, table, clock, backend):
+        runner = LinScheduleRunner(ldf.get_master(), table, backend, clock=clock)
+        run(runner.run(count=2))
+        clock.advance(1.0)
+        run(runner.run(count=2))
+        assert [frame_id for (_, frame_id, _) in backend.frames] == [0x01, 0x03, 0x05, 0x06]
+        assert runner.statistics.skipped == 0
+
+    def test_stop(self, ldf, table, clock, backend):
+        runner = LinScheduleRunner(ldf.get_master(), table, backend, clock=clock)
+        runner.on_slot('RSM_Frm2', lambda slot: runner.stop())
+        run(runner.run())
+        assert len(backend.frames) == 3
+
+    def test_switch(self, ldf, table, clock, backend):
+        runner = LinScheduleRunner(ldf.get_master(), table, backend, clock=clock)
+        runner.on_slot('CEM_Frm1', lambda slot: runner.switch(ldf.get_schedule_table('SRF_schedule')))
+        run(runner.run(count=3))
+
+        assert runner.table.name == 'SRF_schedule'
+        assert [(timestamp, frame_id) for (timestamp, frame_id, _) in backend.frames] == \
+            [(0.0, 0x01), (pytest.approx(0.015), LIN_SLAVE_RESPONSE_FRAME_ID),
+             (pytest.approx(0.025), LIN_SLAVE_RESPONSE_FRAME_ID)]
+
+    def test_configuration_slots(self, ldf, clock, backend):
+        table = ldf.get_schedule_table('Configuration_Schedule')
+        runner = LinScheduleRunner(ldf.get_master(), table, backend, clock=clock)
+        run(runner.run(count=len(table.schedule)))
+
+        assert [(frame_id, data) for (_, frame_id, data) in backend.frames] == \
+            [(LIN_MASTER_REQUEST_FRAME_ID, encode_configuration_entry(entry)) for entry in table.schedule]
+
+    def test_empty_master_request_slot(self, ldf, clock, backend):
+        runner = LinScheduleRunner(ldf.get_master(), diagnostic_table(), backend, clock=clock)
+        run(runner.run(count=2))
+        assert [(frame_id, data) for (_, frame_id, data) in backend.frames] == [(LIN_SLAVE_RESPONSE_FRAME_ID, None)]
+
+    def test_diagnostic_client(self, ldf):
+        slaves = ldf.get_slaves()
+        for slave in slaves:
+            slave.p2_min = 0
+        # the client polls in event loop time, a fake clock would let the runner overtake it
+        backend = LinLoopbackBackend(LinSimulatedTransport(slaves))
+        runner = LinScheduleRunner(ldf.get_master(), diagnostic_table(), backend)
+        client = LinDiagnosticClient(runner.transport, slaves, poll_interval=0)
+
+        async def read():
+            task = asyncio.ensure_future(runner.run())
+            product_id = await client.read_product_id(0x20)
+            runner.stop()
+            await task
+            return product_id
+        product_id = run(read())
+        assert (product_id.supplier_id, product_id.function_id) == (0x4E4E, 0x4553)
+        assert {frame_id for (_, frame_id, _) in backend.frames} == \
+            {LIN_MASTER_REQUEST_FRAME_ID, LIN_SLAVE_RESPONSE_FRAME_ID}
+
+    def test_sporadic_frames(self, clock, backend):
+        ldf = parse_ldf(os.path.join(ldf_directory, 'ldf_with_sporadic_frames.ldf'))
+        runner = LinScheduleRunner(ldf.get_master(), ldf.get_schedule_table('POST_RUN'), backend, clock=clock)
+        frame = ldf.get_unconditional_frame('REQ_POST_RUN')
+        state = runner.state(frame)
+        run(runner.run(count=1))
+        assert backend.frames == []
+
+        signal = frame.signal_map[0][1].name
+        state.set_raw(signal, 1)
+        run(runner.run(count=2))
+        assert [(frame_id, data) for (_, frame_id, data) in backend.frames] == \
+            [(frame.frame_id, frame.encode_raw({signal: 1}))]
+
+    def test_backend_error(self, ldf, clock):
+        class FailingBackend(LinLoopbackBackend):
+            async def send_frame(self, frame_id, data):
+                raise OSError('interface disconnected')
+        runner = LinScheduleRunner(ldf.get_master(), diagnostic_table(), FailingBackend(clock=clock), clock=clock)
+
+        async def request():
+            request = asyncio.ensure_future(runner.transport.master_request(b'\x20\x01\xB6\xFF\xFF\xFF\xFF\xFF'))
+            return await asyncio.gather(runner.run(), request, return_exceptions=True)
+        assert [type(result) for result in run(request())] == [OSError, OSError]
+
+@pytest.mark.unit
+class TestLinScheduleStatistics:
+
+    def test_histogram(self):
+        statistics = LinScheduleStatistics(bin_width=0.001, bins=3)
+        for lateness in (0.0, 0.0005, 0.0015, 0.01):
+            statistics.record(lateness, lateness > 0.001)
+        assert statistics.histogram == [2, 1, 1]
+        assert statistics.to_dict() == {
+            'slots': 4, 'late': 2, 'skipped': 0, 'average': pytest.approx(0.003), 'maximum': 0.01,
+            'bin_width': 0.001, 'histogram': [2, 1, 1]
+        }
+
+    @pytest.mark.parametrize(('bin_width', 'bins'), [(0, 10), (0.001, 0)])
+    def test_invalid_histogram(self, bin_width, bins):
+        with pytest.raises(ValueError):
+            LinScheduleStatistics(bin_width, bins)
+
+@pytest.mark.unit
+def test_timebase_required(ldf):
+    master = ldf.get_master()
+    master.timebase = 0
+    with pytest.raises(ValueError):
+        LinScheduleRunner(master, ldf.get_schedule_table('Normal_Schedule'), LinLoopbackBackend())
+
+@pytest.mark.performance
+def test_real_time_drift(ldf, table):
+    class SlowBackend(LinLoopbackBackend):
+        async def send_frame(self, frame_id, data):
+            await asyncio.sleep(0.004)
+            await super().send_frame(frame_id, data)
+    runner = LinScheduleRunner(ldf.get_master(), table, SlowBackend())
+    offsets = []
+    runner.on_slot('CEM_Frm1', lambda slot: offsets.append(asyncio.get_event_loop().time() - slot.timestamp))
+    statistics = run(runner.run(count=40))
+
+    # a sleep based loop would drift by 4 ms in every CEM_Frm1 slot
+    assert max(offsets) - min(offsets) < 0.02
+    assert statistics.slots + statistics.skipped == 40
@@ -5,7 +5,9 @@ from ldfparser.parser import parse_ldf
 from ldfparser.schedule import (AssignFrameIdEntry, AssignFrameIdRangeEntry, AssignNadEntry,
                                 ConditionalChangeNadEntry, DataDumpEntry, FreeFormatEntry,
                                 LinFrameEntry, MasterRequestEntry,
-                                SaveConfigurationEntry, SlaveResponseEntry, UnassignFrameIdEntry)
+                                SaveConfigurationEntry, ScheduleTable, ScheduleTimeline, SlaveResponseEntry,
+                                UnassignFrameIdEntry)
+from ldfparser.node import LinMaster
 
 class TestSchedule:
 
@@ -91,3 +93,88 @@ class TestSchedule:
 
         with pytest.raises(LookupError):
             ldf.get_schedule_table('NotExistingSchedule')
+
+
+@pytest.fixture(scope="module")
+def schedules_ldf():
+    return parse_ldf(os.path.join(os.path.dirname(__file__), "ldf", "lin_schedules.ldf"))
+
+def create_table(name, delays):
+    table = ScheduleTable(name)
+    for delay in delays:
+        entry = MasterRequestEntry()
+        entry.delay = delay
+        table.schedule.append(entry)
+    return table
+
+@pytest.mark.unit
+class TestScheduleTimeline:
+
+    def test_slots(self, schedules_ldf):
+        timeline = schedules_ldf.schedule_timeline('Normal_Schedule')
+        slots = list(timeline.slots(count=6))
+        assert [slot.timestamp for slot in slots] == pytest.approx([0.0, 0.02, 0.04, 0.06, 0.08, 0.1])
+        assert [slot.latest - slot.timestamp for slot in slots] == pytest.approx([0.001] * 6)
+        assert [slot.frame.name for slot in slots] == ['LeftLightSet', 'LeftLightStatus', 'RightLightSet',
+                                                       'RightLightStatus', 'LeftLightSet', 'LeftLightStatus']
+        assert [slot.index for slot in slots] == [0, 1, 2, 3, 0, 1]
+        assert timeline.cycle_time == pytest.approx(0.08)
+        assert timeline.timestamp == pytest.approx(0.12)
+
+    def test_slots_until(self, schedules_ldf):
+        timeline = schedules_ldf.schedule_timeline('Normal_Schedule', start=1.0)
+        assert len(list(timeline.slots(until=1.1))) == 5
+        assert next(timeline).timestamp == pytest.approx(1.1)
+
+    def test_diagnostic_entries(self, schedules_ldf):
+        slots = list(schedules_ldf.schedule_timeline('Diagnostic_Schedule').slots(count=2))
+        assert [type(slot.entry) for slot in slots] == [MasterRequestEntry, SlaveResponseEntry]
+        assert [slot.frame for slot in slots] == [None, None]
+
+    def test_delay_rounded_to_timebase(self):
+        timeline = ScheduleTimeline(LinMaster('Master', 0.005, 0, 48, 0.4), create_table('Table', [0.012, 0.003]))
+        slots = list(timeline.slots(count=3))
+        assert [slot.duration for slot in slots] == pytest.approx([0.015, 0.005, 0.015])
+        assert [slot.timestamp for slot in slots] == pytest.approx([0.0, 0.015, 0.02])
+
+    def test_no_drift(self):
+        timeline = ScheduleTimeline(LinMaster('Master', 0.001, 0, 48, 0.4), create_table('Table', [0.001]))
+        for slot in timeline.slots(count=100000):
+            pass
+        assert slot.timestamp == 99.999
+
+    @pytest.mark.parametrize('at_end', [False, True])
+    def test_switch(self, schedules_ldf, at_end):
+        timeline = schedules_ldf.schedule_timeline('Normal_Schedule')
+        next(timeline)
+        timeline.switch(schedules_ldf.get_schedule_table('Diagnostic_Schedule'), at_end)
+        names = [slot.table.name for slot in timeline.slots(count=4)]
+        if at_end:
+            assert names == ['Normal_Schedule'] * 3 + ['Diagnostic_Schedule']
+        else:
+            assert names == ['Diagnostic_Schedule'] * 4
+
+    @pytest.mark.parametrize('at_end', [False, True])
+    def test_fast_forward(self, schedules_ldf, at_end):
+        stepped = schedules_ldf.schedule_timeline('Normal_Schedule')
+        skipped = schedules_ldf.schedule_timeline('Normal_Schedule')
+        for timeline in (stepped, skipped):
+            next(timeline)
+            timeline.switch(schedules_ldf.get_schedule_table('Collision_Resolver_Schedule'), at_end)
+        for slot in stepped.slots(until=600.005):
+            pass
+        skipped.fast_forward(600.005)
+        assert skipped.timestamp == stepped.timestamp
+        assert next(skipped)[:3] == next(stepped)[:3]
+        assert skipped.table is stepped.table
+
+    def test_empty_table(self, schedules_ldf):
+        with pytest.raises(ValueError):
+            ScheduleTimeline(schedules_ldf.get_master(), create_table('Empty', []))
+        timeline = schedules_ldf.schedule_timeline('Normal_Schedule')
+        with pytest.raises(ValueError):
+            timeline.switch(create_table('Zero', [0.0]))
+
+    def test_invalid_timebase(self):
+        with pytest.raises(ValueError):
+            ScheduleTimeline(LinMaster('Master', 0, 0, 48, 0.4), create_table('Table', [0.01]))
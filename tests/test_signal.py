@@ -1,5 +1,6 @@
 import pytest
-from ldfparser import LinSignal
+from ldfparser import LinSignal, LinSignalGroup
+from ldfparser.encoding import LinSignalEncodingType, LogicalValue
 
 @pytest.mark.unit
 def test_signal_create_scalar_valid():
@@ -30,3 +31,42 @@ def test_signal_create_array_invalid_width():
 def test_signal_create_array_invalid_initvalue():
     with pytest.raises(ValueError):
         LinSignal.create('LSM', 24, [1, 2, 3, 4, 5])
+
+@pytest.fixture
+def signal_group():
+    return LinSignalGroup('SeatControl', 24, {
+        0: LinSignal('SeatPosition', 10, 0x3FF),
+        10: LinSignal('SeatHeating', 2, 0),
+        16: LinSignal('SeatAngle', 8, 0)
+    })
+
+@pytest.mark.unit
+def test_signal_group_encode_raw(signal_group):
+    assert signal_group.length == 3
+    assert signal_group.encode_raw({}) == b'\xFF\x03\x00'
+    assert signal_group.encode_raw({'SeatHeating': 2, 'SeatAngle': 0x10}) == b'\xFF\x0B\x10'
+
+@pytest.mark.unit
+def test_signal_group_decode_raw(signal_group):
+    assert signal_group.decode_raw(b'\xFF\x0B\x10') == {
+        'SeatPosition': 0x3FF, 'SeatHeating': 2, 'SeatAngle': 0x10
+    }
+
+@pytest.mark.unit
+def test_signal_group_encoding_types(signal_group):
+    heating = LinSignalEncodingType('Heating', [LogicalValue(0, 'off'), LogicalValue(2, 'high')])
+    encoded = signal_group.encode({'SeatHeating': 'high'}, {'SeatHeating': heating})
+    assert encoded == b'\xFF\x0B\x00'
+    assert signal_group.decode(encoded, {'SeatHeating': heating})['SeatHeating'] == 'high'
+
+@pytest.mark.unit
+def test_signal_group_unknown_signal(signal_group):
+    with pytest.raises(LookupError):
+        signal_group.encode_raw({'StartHeater': 1})
+
+@pytest.mark.unit
+def test_signal_group_overlapping():
+    with pytest.raises(ValueError):
+        LinSignalGroup('Group', 16, {0: LinSignal('A', 8, 0), 4: LinSignal('B', 8, 0)})
+    with pytest.raises(ValueError):
+        LinSignalGroup('Group', 8, {0: LinSignal('A', 4, 0), 6: LinSignal('B', 4, 0)})
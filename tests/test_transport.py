@@ -0,0 +1,176 @@
+import pytest
+
+from ldfparser.node import LinSlave
+from ldfparser.transport import (LinTransportPdu, LinTransportReceiver, LinTransportSender, LinTransportTiming,
+                                 segment_pdu, transport_timings)
+
+@pytest.fixture
+def slave():
+    slave = LinSlave('Slave')
+    slave.configured_nad = 0x02
+    slave.initial_nad = 0x01
+    slave.st_min = 0.01
+    slave.n_as_timeout = 0.5
+    slave.n_cr_timeout = 0.5
+    return slave
+
+@pytest.mark.unit
+def test_transport_timings(slave):
+    timings = transport_timings([slave])
+    assert timings[0x01] == timings[0x02] == LinTransportTiming(0.01, 0.5, 0.5)
+
+@pytest.mark.unit
+class TestSegmentation:
+
+    def test_single_frame(self):
+        assert segment_pdu(0x01, bytes([0xB6])) == [b'\x01\x01\xB6\xFF\xFF\xFF\xFF\xFF']
+        assert segment_pdu(0x01, bytes([0xB2, 0x00, 0xFF, 0x7F, 0xFF, 0xFF])) == [b'\x01\x06\xB2\x00\xFF\x7F\xFF\xFF']
+
+    def test_multiple_frames(self):
+        assert segment_pdu(0x01, bytes(range(0xB4, 0xB4 + 13))) == [
+            b'\x01\x10\x0D\xB4\xB5\xB6\xB7\xB8',
+            b'\x01\x21\xB9\xBA\xBB\xBC\xBD\xBE',
+            b'\x01\x22\xBF\xC0\xFF\xFF\xFF\xFF'
+        ]
+
+    def test_counter_wraps(self):
+        frames = segment_pdu(0x01, bytes(5 + 6 * 20))
+        assert [frame[1] for frame in frames[15:19]] == [0x2F, 0x20, 0x21, 0x22]
+
+    @pytest.mark.parametrize('length', [0, 4096])
+    def test_invalid_length(self, length):
+        with pytest.raises(ValueError):
+            segment_pdu(0x01, bytes(length))
+
+@pytest.mark.unit
+class TestLinTransportReceiver:
+
+    @pytest.mark.parametrize('length', [1, 6, 7, 11, 12, 100, 4095])
+    def test_reassembly(self, length):
+        data = bytes(i & 0xFF for i in range(length))
+        receiver = LinTransportReceiver()
+        frames = segment_pdu(0x05, data)
+        assert [receiver.receive(frame) for frame in frames[:-1]] == [None] * (len(frames) - 1)
+        assert receiver.receive(frames[-1]) == LinTransportPdu(0x05, data)
+        assert receiver.pending == []
+
+    def test_interleaved_nodes(self):
+        receiver = LinTransportReceiver()
+        first = segment_pdu(0x01, bytes(range(20)))
+        second = segment_pdu(0x02, bytes(range(100, 120)))
+        records = [(None, frame) for pair in zip(first, second) for frame in pair]
+        assert list(receiver.receive_stream(records)) == [
+            LinTransportPdu(0x01, bytes(range(20))), LinTransportPdu(0x02, bytes(range(100, 120)))
+        ]
+
+    def test_out_of_sequence(self):
+        receiver = LinTransportReceiver()
+        frames = segment_pdu(0x01, bytes(20))
+        receiver.receive(frames[0])
+        with pytest.raises(ValueError):
+            receiver.receive(frames[2])
+        assert receiver.pending == []
+
+    @pytest.mark.parametrize(
+        'data', [b'\x01\x21\x00\x00\x00\x00\x00\x00', b'\x01\x07\x00\x00\x00\x00\x00\x00',
+                 b'\x01\x10\x06\x00\x00\x00\x00\x00', b'\x01\x30\x00\x00\x00\x00\x00\x00',
+                 b'', b'\x01', b'\x01\x10']
+    )
+    def test_invalid_frame(self, data):
+        with pytest.raises(ValueError):
+            LinTransportReceiver().receive(data)
+
+    def test_first_frame_restarts(self):
+        receiver = LinTransportReceiver()
+        frames = segment_pdu(0x01, bytes(range(20)))
+        receiver.receive(frames[0])
+        receiver.receive(frames[1])
+        assert list(receiver.receive_stream((None, frame) for frame in frames)) == [
+            LinTransportPdu(0x01, bytes(range(20)))
+        ]
+
+    def test_n_cr_timeout(self, slave):
+        receiver = LinTransportReceiver([slave])
+        frames = segment_pdu(0x02, bytes(20))
+        receiver.receive(frames[0], 0.0)
+        receiver.receive(frames[1], 0.4)
+        with pytest.raises(TimeoutError):
+            receiver.receive(frames[2], 1.0)
+        assert receiver.pending == []
+
+    def test_default_timing(self):
+        receiver = LinTransportReceiver(timing=LinTransportTiming(n_cr_timeout=0.1))
+        frames = segment_pdu(0x02, bytes(20))
+        receiver.receive(frames[0], 0.0)
+        with pytest.raises(TimeoutError):
+            receiver.receive(frames[1], 0.2)
+
+    def test_expire(self, slave):
+        receiver = LinTransportReceiver([slave])
+        receiver.receive(segment_pdu(0x02, bytes(20))[0], 0.0)
+        receiver.receive(segment_pdu(0x03, bytes(20))[0], 0.0)
+        assert receiver.expire(0.6) == [0x02]
+        assert receiver.pending == [0x03]
+
+    def test_skip_errors(self, slave):
+        receiver = LinTransportReceiver([slave])
+        timed_out = segment_pdu(0x02, bytes(20))
+        complete = segment_pdu(0x02, bytes(range(10)))
+        records = [(0.0, timed_out[0]), (1.0, timed_out[1]), (1.0, timed_out[2])] + \
+            [(1.0, frame) for frame in complete]
+        assert list(receiver.receive_stream(records, skip_errors=True)) == [
+            LinTransportPdu(0x02, bytes(range(10)), 1.0)
+        ]
+        with pytest.raises(TimeoutError):
+            list(receiver.receive_stream(records))
+
+@pytest.mark.unit
+class TestLinTransportSender:
+
+    def test_send(self):
+        sender = LinTransportSender()
+        assert sender.send(0x01, bytes(range(20))) == 4
+        assert sender.send(0x02, bytes([0xB6])) == 1
+        frames = [sender.next_frame() for _ in range(6)]
+        assert frames[:4] == segment_pdu(0x01, bytes(range(20)))
+        assert frames[4:] == [segment_pdu(0x02, bytes([0xB6]))[0], None]
+        assert sender.pending == 0
+
+    def test_st_min(self, slave):
+        sender = LinTransportSender([slave])
+        sender.send(0x02, bytes(20), timestamp=0.0)
+        assert sender.next_frame(0.0) is not None
+        assert sender.next_frame(0.005) is None
+        assert sender.next_frame(0.01) is not None
+
+    def test_n_as_timeout(self, slave):
+        sender = LinTransportSender([slave])
+        sender.send(0x02, bytes(20), timestamp=0.0)
+        sender.send(0x02, bytes(1), timestamp=0.0)
+        sender.next_frame(0.0)
+        with pytest.raises(TimeoutError):
+            sender.next_frame(1.0)
+        assert sender.pending == 1
+        assert sender.next_frame(1.0) == segment_pdu(0x02, bytes(1))[0]
+
+    def test_round_trip(self, slave):
+        sender = LinTransportSender([slave])
+        receiver = LinTransportReceiver([slave])
+        sender.send(0x02, bytes(range(50)), timestamp=0.0)
+        pdus = []
+        timestamp = 0.0
+        while sender.pending:
+            frame = sender.next_frame(timestamp)
+            if frame is not None:
+                pdu = receiver.receive(frame, timestamp)
+                if pdu is not None:
+                    pdus.append(pdu)
+            timestamp += 0.01
+        assert [pdu.data for pdu in pdus] == [bytes(range(50))]
+
+    def test_cancel(self):
+        sender = LinTransportSender()
+        sender.send(0x01, bytes(20))
+        sender.cancel()
+        assert sender.pending == 0
+        assert sender.next_frame() is None